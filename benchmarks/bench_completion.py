@@ -0,0 +1,52 @@
+"""Benchmark of Tab completion for inputChoice() with 100,000 choices (such
+as a catalog of SKU names) and for inputFilepath(), and of the history that
+every prompt keeps of its valid responses.
+
+The first completion of a ChoicePrompt sorts its choices, which is timed
+separately. Each completion after that bisects the sorted choices.
+
+Run with:
+
+    python benchmarks/bench_completion.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import time
+
+import pyinputplus as pyip
+
+NUMBER = 20000
+
+CHOICES = ['SKU-%s-%06d' % (color, i) for color in ('red', 'green', 'blue', 'black') for i in range(25000)]
+TYPED = ['SKU-r', 'SKU-green-01', 'sku-blue-024', 'SKU-black-000123', 'SKU-', 'nothing']
+
+
+def timePerCall(name, func, values, number=NUMBER):
+    values = (values * (number // len(values) + 1))[:number]
+    startTime = time.perf_counter()
+    for value in values:
+        func(value)
+    print('%-40s %8.2f microseconds/call' % (name, (time.perf_counter() - startTime) / number * 1000000))
+
+
+def main():
+    prompt = pyip.ChoicePrompt(CHOICES, prompt='')
+    startTime = time.perf_counter()
+    prompt._complete('SKU-')
+    print('%-40s %8.2f milliseconds' % ('first completion (sorts %d choices)' % (len(CHOICES)),
+                                        (time.perf_counter() - startTime) * 1000))
+    timePerCall('ChoicePrompt completion', prompt._complete, TYPED)
+
+    directory = os.path.dirname(os.path.abspath(pyip.__file__)) + os.sep
+    timePerCall('FilepathPrompt completion (cached)', pyip.FilepathPrompt()._complete,
+                [directory + '__', directory + 'a', directory + 'x'])
+
+    backend = pyip.ScriptedIOBackend(['answer %d' % (i % 500) for i in range(NUMBER)])
+    strPrompt = pyip.StrPrompt(ioBackend=backend)
+    timePerCall('StrPrompt.ask() with history', lambda value: strPrompt.ask(), [None])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark of validating dates, times, and datetimes, comparing
+DatePrompt/TimePrompt/DatetimePrompt.validate() (which use formats compiled
+once by a _DatetimeParser) with the pysimplevalidate functions that
+PyInputPlus used to call, which try each format with strptime() in turn.
+
+The values include ones in the first format, ones in a later format, and
+invalid ones, which are the slowest case for trying each format in turn.
+
+Run with:
+
+    python benchmarks/bench_datetime.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+import pyinputplus as pyip
+import pysimplevalidate as pysv
+
+NUMBER = 20000
+
+
+def timeValidate(validate, values, number=NUMBER):
+    """Calls validate() on each of values, `number` times in total, and
+    returns the values validated per second."""
+    values = (values * (number // len(values) + 1))[:number]
+    startTime = time.perf_counter()
+    for value in values:
+        try:
+            validate(value)
+        except pysv.ValidationException:
+            pass
+    return number / (time.perf_counter() - startTime)
+
+
+def compare(name, prompt, pysvFunc, values):
+    """Prints the speed of prompt.validate() and of pysvFunc() with the same
+    formats on values."""
+    compiledSpeed = timeValidate(prompt.validate, values)
+    strptimeSpeed = timeValidate(lambda value: pysvFunc(value, formats=prompt.formats), values)
+    print('%-35s %10.0f/sec compiled %10.0f/sec strptime  (%.1fx)' %
+          (name, compiledSpeed, strptimeSpeed, compiledSpeed / strptimeSpeed))
+
+
+def main():
+    # The old default formats for inputDatetime() listed five of them twice.
+    datetimePrompt = pyip.DatetimePrompt(formats=pyip.DatetimePrompt().formats * 2)
+    compare('datetime, first format', datetimePrompt, pysv.validateDatetime, ['10/31/2018 12:00:01'])
+    compare('datetime, later format', datetimePrompt, pysv.validateDatetime, ['18/10/31 12:00'])
+    compare('datetime, invalid', datetimePrompt, pysv.validateDatetime, ['10/31/2018', '2018-10-31 12:00', 'soon'])
+
+    datePrompt = pyip.DatePrompt()
+    compare('date, mixed', datePrompt, pysv.validateDate, ['10/31/2018', '2018/10/31', '2/30/2020', 'today'])
+
+    timePrompt = pyip.TimePrompt()
+    compare('time, mixed', timePrompt, pysv.validateTime, ['12:00:01', '12:00', '25:00', 'noon'])
+
+
+if __name__ == '__main__':
+    main()
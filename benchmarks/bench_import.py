@@ -0,0 +1,82 @@
+"""Benchmark of how long `import pyinputplus` takes, measured with
+`python -X importtime` in fresh interpreters. Exits with status 1 if the
+import is slower than the budget, or if it imports any of the modules that
+PyInputPlus only loads when they're first used, so it can be run in CI to
+catch regressions.
+
+Run with:
+
+    python benchmarks/bench_import.py [--runs N] [--budget-ms MS]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import subprocess
+import sys
+
+# Modules that `import pyinputplus` must not import.
+LAZY_MODULES = ('pysimplevalidate', 'stdiomask', 'threading', 'queue', 'asyncio')
+
+DEFAULT_RUNS = 10
+DEFAULT_BUDGET_MS = 10.0
+
+
+def measureImport():
+    """Imports pyinputplus in a new interpreter with -X importtime. Returns a
+    tuple of pyinputplus's cumulative import time in microseconds and the set
+    of module names that were imported along with it."""
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import pyinputplus'],
+                            stderr=subprocess.PIPE, universal_newlines=True, check=True).stderr
+
+    # Each line is "import time: self [us] | cumulative | name", and a module
+    # is listed after the modules it imported, indented one level more.
+    cumulativeTime = None
+    importedModules = set()
+    pending = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        selfTime, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        pending.append((depth, name.strip()))
+        if name.strip() == 'pyinputplus':
+            cumulativeTime = int(cumulative)
+            importedModules = set(moduleName for moduleDepth, moduleName in pending if moduleDepth > depth)
+        if depth == 0:
+            pending = []
+    return cumulativeTime, importedModules
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the time `import pyinputplus` takes.')
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS, help='number of fresh interpreters to time')
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS,
+                        help='fail if the fastest import takes longer than this many milliseconds')
+    args = parser.parse_args()
+
+    times = []
+    importedModules = set()
+    for i in range(args.runs):
+        cumulativeTime, modules = measureImport()
+        times.append(cumulativeTime)
+        importedModules.update(modules)
+    times.sort()
+
+    print('import pyinputplus: best %.2f ms, median %.2f ms over %s runs' %
+          (times[0] / 1000, times[len(times) // 2] / 1000, args.runs))
+    print('imported along with it: %s' % (', '.join(sorted(importedModules)) or '(nothing)'))
+
+    failed = False
+    eagerModules = sorted(name for name in importedModules if name.split('.')[0] in LAZY_MODULES)
+    if eagerModules:
+        print('FAIL: these modules should be imported lazily: %s' % (', '.join(eagerModules)))
+        failed = True
+    if times[0] / 1000 > args.budget_ms:
+        print('FAIL: the import took longer than the %.2f ms budget' % (args.budget_ms))
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark of validating a column of numbers, comparing
+NumPrompt.validateArray() (with and without NumPy) with validating each value
+with validateMany().
+
+Run with:
+
+    python benchmarks/bench_numbers.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import random
+import time
+
+import pyinputplus as pyip
+
+NUMBER = 200000
+
+random.seed(42)
+CLEAN_VALUES = [str(random.randint(-1000, 100000)) for i in range(NUMBER)]
+MESSY_VALUES = [value if i % 100 else 'N/A' for i, value in enumerate(CLEAN_VALUES)]
+
+
+def timeIt(name, func):
+    startTime = time.perf_counter()
+    func()
+    duration = time.perf_counter() - startTime
+    print('%-45s %12.0f values/sec' % (name, NUMBER / duration))
+
+
+def main():
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+
+    prompt = pyip.IntPrompt(min=0, max=50000)
+    for valuesName, values in (('clean', CLEAN_VALUES), ('1% invalid', MESSY_VALUES)):
+        timeIt('validateMany(), %s' % (valuesName), lambda: list(pyip.validateMany(prompt, values)))
+        timeIt('validateArray(useNumpy=False), %s' % (valuesName), lambda: prompt.validateArray(values, useNumpy=False))
+        if numpy is not None:
+            timeIt('validateArray(useNumpy=True), %s' % (valuesName), lambda: prompt.validateArray(values, useNumpy=True))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Microbenchmark comparing calling an input*() function repeatedly with
+creating its Prompt object once and calling ask() repeatedly.
+
+The input*() functions check their arguments and set up their validation on
+every call, while a Prompt object only does this once. The difference between
+the two timings is the per-call overhead that Prompt objects remove.
+
+Run with:
+
+    python benchmarks/bench_prompt.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import sys
+import timeit
+
+import pyinputplus as pyip
+
+NUMBER = 20000
+
+MENU_CHOICES = ['item%s' % (i) for i in range(1000)]
+
+
+def timeAnswers(func, answer, number):
+    """Returns the number of seconds it takes to call func() `number` times,
+    with stdin providing `answer` as the response to each call."""
+    originalStdin, originalStdout = sys.stdin, sys.stdout
+    sys.stdin = io.StringIO((answer + '\n') * number)
+    sys.stdout = io.StringIO()
+    try:
+        return timeit.timeit(func, number=number)
+    finally:
+        sys.stdin, sys.stdout = originalStdin, originalStdout
+
+
+def compare(name, inputFunc, promptObj, answer, number=NUMBER):
+    funcTime = timeAnswers(inputFunc, answer, number)
+    promptTime = timeAnswers(promptObj.ask, answer, number)
+    print('%-12s input*(): %7.2f us/call   Prompt.ask(): %7.2f us/call   removed: %7.2f us/call' %
+          (name, funcTime / number * 1e6, promptTime / number * 1e6, (funcTime - promptTime) / number * 1e6))
+
+
+def main():
+    compare('inputStr', lambda: pyip.inputStr(blockRegexes=['^x$']), pyip.StrPrompt(blockRegexes=['^x$']), 'hello')
+    compare('inputNum', lambda: pyip.inputNum(min=0, max=100, limit=3), pyip.NumPrompt(min=0, max=100, limit=3), '42')
+    compare('inputChoice', lambda: pyip.inputChoice(['dog', 'cat', 'moose']), pyip.ChoicePrompt(['dog', 'cat', 'moose']), 'cat')
+    compare('inputMenu', lambda: pyip.inputMenu(MENU_CHOICES, numbered=True), pyip.MenuPrompt(MENU_CHOICES, numbered=True), '500', number=500)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark of checking responses against many allowRegexes and
+blockRegexes, comparing Prompt.validate() (which compiles the regexes once
+and combines them into a single regex) with passing the regex lists to the
+pysimplevalidate functions the way PyInputPlus used to, which searches for
+each regex in turn.
+
+The 150 block regexes stand in for a profanity and injection filter. Most
+responses don't match any of them, which is the case that the combined regex
+speeds up the most.
+
+Run with:
+
+    python benchmarks/bench_regexes.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+import pyinputplus as pyip
+import pysimplevalidate as pysv
+
+NUMBER = 20000
+
+BLOCK_REGEXES = ([r'\b%s\b' % (word) for word in ('darn', 'heck', 'gosh', 'fiddlesticks', 'drat', 'blast')] +
+                 [(r'(?i)\bdrop\s+table\b', 'SQL is not allowed.'), (r'<\s*script', 'HTML is not allowed.')] +
+                 [r'\bbadword%03d\b' % (i) for i in range(142)])
+ALLOW_REGEXES = [r'^admin-\d+$', r'^ops-[a-z]+$', r'^N/A$']
+
+RESPONSES = ['Al Sweigart', '42 Main Street', 'hello world', 'badword141', 'ops-oncall', '<script>']
+
+
+def timeValidate(validate, values, number=NUMBER):
+    """Calls validate() on each of values, `number` times in total, and
+    returns the values validated per second."""
+    values = (values * (number // len(values) + 1))[:number]
+    startTime = time.perf_counter()
+    for value in values:
+        try:
+            validate(value)
+        except pysv.ValidationException:
+            pass
+    return number / (time.perf_counter() - startTime)
+
+
+def compare(name, compiledValidate, listValidate):
+    compiledSpeed = timeValidate(compiledValidate, RESPONSES)
+    listSpeed = timeValidate(listValidate, RESPONSES)
+    print('%-30s %10.0f/sec compiled %10.0f/sec regex lists  (%.1fx)' %
+          (name, compiledSpeed, listSpeed, compiledSpeed / listSpeed))
+
+
+def main():
+    print('%s block regexes, %s allow regexes' % (len(BLOCK_REGEXES), len(ALLOW_REGEXES)))
+    strPrompt = pyip.StrPrompt(allowRegexes=ALLOW_REGEXES, blockRegexes=BLOCK_REGEXES)
+    compare('StrPrompt', strPrompt.validate,
+            lambda value: pysv._prevalidationCheck(value, False, None, ALLOW_REGEXES, BLOCK_REGEXES))
+
+    numPrompt = pyip.NumPrompt(allowRegexes=ALLOW_REGEXES, blockRegexes=BLOCK_REGEXES)
+    compare('NumPrompt', numPrompt.validate,
+            lambda value: pysv.validateNum(value, allowRegexes=ALLOW_REGEXES, blockRegexes=BLOCK_REGEXES))
+
+    compare('inputStr() (new prompt each call)',
+            lambda value: pyip.inputStr(allowRegexes=ALLOW_REGEXES, blockRegexes=BLOCK_REGEXES,
+                                        ioBackend=pyip.ScriptedIOBackend([value]), limit=1, default=''),
+            lambda value: pysv._prevalidationCheck(value, False, None, ALLOW_REGEXES, BLOCK_REGEXES))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark of replaying scripted answers with pyinputplus.replay(), in
+prompts per second. No terminal, stdin, or stdout is used.
+
+Each scenario replays a mix of valid and invalid answers, so the retry, limit,
+and default handling of the input loop is included in the timings.
+
+Run with:
+
+    python benchmarks/bench_replay.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import time
+
+import pyinputplus as pyip
+
+NUMBER = 100000
+
+
+def timeReplay(name, ask, answersPerPrompt, number=NUMBER, transcript=None):
+    """Calls ask() `number` times inside replay(), answering each call with
+    the answers in answersPerPrompt, and prints the prompts per second."""
+    answers = answersPerPrompt * number
+    startTime = time.perf_counter()
+    with pyip.replay(answers, transcript=transcript):
+        for i in range(number):
+            ask()
+    duration = time.perf_counter() - startTime
+    print('%-40s %10.0f prompts/sec' % (name, number / duration))
+
+
+def main():
+    strPrompt = pyip.StrPrompt()
+    timeReplay('StrPrompt.ask(), valid', strPrompt.ask, ['hello'])
+    timeReplay('inputStr(), valid', pyip.inputStr, ['hello'])
+
+    intPrompt = pyip.IntPrompt(limit=3)
+    timeReplay('IntPrompt.ask(), invalid then valid', intPrompt.ask, ['forty', '42'])
+    timeReplay('IntPrompt.ask(), with transcript', intPrompt.ask, ['forty', '42'], transcript=[])
+
+    yesNoPrompt = pyip.YesNoPrompt(limit=2, default='no')
+    timeReplay('YesNoPrompt.ask(), limit reached', yesNoPrompt.ask, ['maybe', 'perhaps'])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark of answering prompts from stdin when it is a file, as in
+`mytool < answers.txt`, comparing the default StdIOBackend (which reads one
+line at a time with input() and writes every prompt and error message) with
+StreamIOBackend (which reads stdin in blocks, doesn't write the prompts, and
+writes each prompt's error messages at once as JSON lines on stderr).
+
+Each run is a separate Python process with its stdin redirected from a
+temporary file and its stdout and stderr sent to a pipe, in prompts per
+second.
+
+Run with:
+
+    python benchmarks/bench_stream.py
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+NUMBER = 100000
+
+# Every tenth answer is invalid, so error messages are included.
+ANSWERS = ''.join(['forty\n42\n' if i % 10 == 0 else '%s\n' % (i) for i in range(NUMBER)])
+
+CODE = '''
+import pyinputplus as pyip
+prompt = pyip.IntPrompt('Quantity> ', ioBackend=%s)
+for i in range(%d):
+    prompt.ask()
+'''
+
+
+def timeBackend(name, backendCode, answersFilename):
+    with open(answersFilename) as answersFile:
+        startTime = time.perf_counter()
+        subprocess.run([sys.executable, '-c', CODE % (backendCode, NUMBER)], stdin=answersFile,
+                       stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+        duration = time.perf_counter() - startTime
+    print('%-30s %10.0f prompts/sec' % (name, NUMBER / duration))
+
+
+def main():
+    answersFile = tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False)
+    try:
+        with answersFile:
+            answersFile.write(ANSWERS)
+        timeBackend('StdIOBackend', 'None', answersFile.name)
+        timeBackend('StreamIOBackend', 'pyip.StreamIOBackend()', answersFile.name)
+        timeBackend('StreamIOBackend, showPrompts', 'pyip.StreamIOBackend(showPrompts=True)', answersFile.name)
+    finally:
+        os.remove(answersFile.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""Benchmark suite that measures the per-prompt overhead of every input*()
+function, for catching performance regressions before a release.
+
+Each benchmark calls an input*() function over and over with stdin replaced
+by an in-memory file of answers (and stdout by an in-memory file), so it
+goes through the same input() and validation path as a real prompt, minus
+the waiting. Besides one benchmark for each input*() function, there are
+benchmarks of responses that are retried, large inputMenu() choice lists,
+many blockRegexes, and inputDatetime() with several formats.
+
+Each benchmark is run `--runs` times, and the results are saved as JSON with
+the mean time per prompt of each run, so that two result files can be
+compared. --compare prints how each benchmark changed against an earlier
+result file and exits with status 1 if any of them got slower by more than
+--threshold.
+
+Run with:
+
+    python benchmarks/bench_suite.py --output before.json
+    (make changes)
+    python benchmarks/bench_suite.py --output after.json --compare before.json
+
+Use --filter to only run the benchmarks whose names contain a string, and
+--quick for fewer prompts per run (for checking that the suite works).
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+
+import pyinputplus as pyip
+
+MENU_CHOICES = ['item %05d' % (i) for i in range(10000)]
+BLOCK_REGEXES = [r'\bbadword%03d\b' % (i) for i in range(200)] + [(r'(?i)\bdrop\s+table\b', 'SQL is not allowed.')]
+DATETIME_FORMATS = ('%m/%d/%Y %H:%M:%S', '%m/%d/%y %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%Y-%m-%d %H:%M', '%d %b %Y %H:%M',
+                    '%B %d, %Y %I:%M %p', '%Y%m%dT%H%M%S', '%x %X')
+
+# Each benchmark is a tuple of its name, a function that asks one prompt,
+# and the answers (one per line) that one prompt reads. Answers with
+# mistakes are retried, and measure the cost of the error message and the
+# extra read.
+BENCHMARKS = [
+    ('inputStr', lambda: pyip.inputStr(), ['hello']),
+    ('inputCustom', lambda: pyip.inputCustom(lambda value: value), ['hello']),
+    ('inputNum', lambda: pyip.inputNum(min=0), ['42']),
+    ('inputInt', lambda: pyip.inputInt(min=0, max=100), ['42']),
+    ('inputFloat', lambda: pyip.inputFloat(), ['3.14']),
+    ('inputChoice', lambda: pyip.inputChoice(['dog', 'cat', 'moose']), ['cat']),
+    ('inputMenu', lambda: pyip.inputMenu(['dog', 'cat', 'moose'], numbered=True), ['2']),
+    ('inputDate', lambda: pyip.inputDate(), ['2019/10/31']),
+    ('inputDatetime', lambda: pyip.inputDatetime(), ['2019/10/31 12:30:00']),
+    ('inputTime', lambda: pyip.inputTime(), ['12:30']),
+    ('inputState', lambda: pyip.inputState(), ['ca']),
+    ('inputMonth', lambda: pyip.inputMonth(), ['october']),
+    ('inputDayOfWeek', lambda: pyip.inputDayOfWeek(), ['thursday']),
+    ('inputDayOfMonth', lambda: pyip.inputDayOfMonth(2019, 10), ['31']),
+    ('inputIp', lambda: pyip.inputIp(), ['192.168.0.1']),
+    ('inputRegex', lambda: pyip.inputRegex(r'^[a-z]+-\d+$'), ['sku-42']),
+    ('inputRegexStr', lambda: pyip.inputRegexStr(), [r'\d+']),
+    ('inputURL', lambda: pyip.inputURL(), ['https://inventwithpython.com']),
+    ('inputYesNo', lambda: pyip.inputYesNo(), ['y']),
+    ('inputBool', lambda: pyip.inputBool(), ['true']),
+    ('inputZip', lambda: pyip.inputZip(), ['94103']),
+    ('inputFilename', lambda: pyip.inputFilename(), ['report.txt']),
+    ('inputFilepath', lambda: pyip.inputFilepath(), ['reports/report.txt']),
+    ('inputEmail', lambda: pyip.inputEmail(), ['al@inventwithpython.com']),
+    # inputPassword() reads keystrokes from the terminal instead of stdin, so
+    # its answers come from a ScriptedIOBackend.
+    ('inputPassword', lambda: pyip.inputPassword(ioBackend=pyip.ScriptedIOBackend(['hunter2'])), []),
+
+    ('inputInt, 2 retries', lambda: pyip.inputInt(min=0, max=100), ['forty', '142', '42']),
+    ('inputInt, limit reached', lambda: pyip.inputInt(limit=3, default='0'), ['a', 'b', 'c']),
+    ('IntPrompt.ask()', pyip.IntPrompt(min=0, max=100).ask, ['42']),
+    ('inputMenu, 10000 choices', lambda: pyip.inputMenu(MENU_CHOICES, numbered=True), ['5000']),
+    ('MenuPrompt.ask(), 10000 choices', pyip.MenuPrompt(MENU_CHOICES, numbered=True).ask, ['item 05000']),
+    ('inputMenu, 10000 choices, paged', lambda: pyip.inputMenu(MENU_CHOICES, pageSize=20), ['n', 'item 00021']),
+    ('inputStr, 201 blockRegexes', lambda: pyip.inputStr(blockRegexes=BLOCK_REGEXES), ['hello world']),
+    ('StrPrompt.ask(), 201 blockRegexes', pyip.StrPrompt(blockRegexes=BLOCK_REGEXES).ask, ['hello world']),
+    ('inputDatetime, 8 formats', lambda: pyip.inputDatetime(formats=DATETIME_FORMATS), ['October 31, 2019 12:30 PM']),
+    ('DatetimePrompt.ask(), 8 formats', pyip.DatetimePrompt(formats=DATETIME_FORMATS).ask, ['20191031T123000']),
+]
+
+
+def timePrompts(func, answers, number):
+    """Returns the mean number of seconds that func() takes to ask a prompt,
+    over `number` prompts, with stdin answering each one with answers."""
+    originalStdin, originalStdout = sys.stdin, sys.stdout
+    sys.stdin = io.StringIO(''.join([answer + '\n' for answer in answers]) * number)
+    sys.stdout = io.StringIO()
+    try:
+        startTime = time.perf_counter()
+        for i in range(number):
+            func()
+        return (time.perf_counter() - startTime) / number
+    finally:
+        sys.stdin, sys.stdout = originalStdin, originalStdout
+
+
+def runBenchmarks(nameFilter, runs, number):
+    """Runs the benchmarks whose names contain nameFilter, and returns a dict
+    that maps each name to a dict of its statistics."""
+    results = {}
+    for name, func, answers in BENCHMARKS:
+        if nameFilter not in name:
+            continue
+        timePrompts(func, answers, max(number // 10, 1)) # Warm up: compile regexes, import modules, and so on.
+        runTimes = [timePrompts(func, answers, number) for i in range(runs)]
+        results[name] = {'runs': runTimes, 'median': statistics.median(runTimes), 'min': min(runTimes),
+                         'stdev': statistics.stdev(runTimes) if runs > 1 else 0.0, 'prompts': number}
+        print('%-36s %9.2f us/prompt  (min %.2f, +- %.2f)' % (name, results[name]['median'] * 1e6,
+                                                             results[name]['min'] * 1e6, results[name]['stdev'] * 1e6))
+    return results
+
+
+def compareResults(results, baseline, threshold):
+    """Prints how each benchmark changed from the baseline results, and
+    returns the names of the benchmarks that are slower by more than
+    threshold (such as 0.1 for 10%)."""
+    regressions = []
+    print()
+    print('Compared with %s:' % (baseline['metadata'].get('pyinputplus', 'the baseline')))
+    for name, result in results.items():
+        if name not in baseline['benchmarks']:
+            print('%-36s (not in baseline)' % (name))
+            continue
+        ratio = result['median'] / baseline['benchmarks'][name]['median']
+        flag = ''
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = '  SLOWER'
+        print('%-36s %6.2fx%s' % (name, ratio, flag))
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Measure the per-prompt overhead of the input*() functions.')
+    parser.add_argument('--output', help='the file to save the results in as JSON')
+    parser.add_argument('--compare', help='a results file from an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.10,
+                        help='how much slower (as a fraction) a benchmark can get before --compare fails')
+    parser.add_argument('--filter', default='', help='only run the benchmarks whose names contain this')
+    parser.add_argument('--runs', type=int, default=5, help='the number of times to run each benchmark')
+    parser.add_argument('--number', type=int, default=2000, help='the number of prompts in each run')
+    parser.add_argument('--quick', action='store_true', help='use 3 runs of 100 prompts')
+    args = parser.parse_args(args)
+    if args.quick:
+        args.runs, args.number = 3, 100
+
+    results = runBenchmarks(args.filter, args.runs, args.number)
+    output = {'metadata': {'pyinputplus': pyip.__version__, 'python': platform.python_version(),
+                           'implementation': platform.python_implementation(), 'platform': platform.platform(),
+                           'time': time.strftime('%Y-%m-%dT%H:%M:%S')},
+              'benchmarks': results}
+    if args.output is not None:
+        with open(args.output, 'w') as outputFile:
+            json.dump(output, outputFile, indent=2, sort_keys=True)
+
+    if args.compare is not None:
+        with open(args.compare) as baselineFile:
+            baseline = json.load(baselineFile)
+        if compareResults(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
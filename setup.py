@@ -21,13 +21,15 @@ setup(
     url='https://github.com/asweigart/pyinputplus',
     author='Al Sweigart',
     author_email='al@inventwithpython.com',
-    description=('Provides more featureful versions of input() and raw_input().'),
+    description=('Provides more featureful versions of input().'),
     license='BSD',
     long_description=long_description,
     packages=find_packages(where='src'),
     package_dir={'': 'src'},
     test_suite='tests',
+    python_requires='>=3.7', # asyncinput needs asyncio.get_running_loop().
     install_requires=['pysimplevalidate>=0.2.7', 'stdiomask>=0.0.3'],
+    extras_require={'numpy': ['numpy']}, # Used by NumPrompt.validateArray() if it is installed.
     keywords="input validation text gui message box",
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -38,15 +40,12 @@ setup(
         'License :: OSI Approved :: BSD License',
         'Operating System :: OS Independent',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.1',
-        'Programming Language :: Python :: 3.2',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3 :: Only',
         'Programming Language :: Python :: 3.7',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
     ],
 )
\ No newline at end of file
@@ -1,7 +1,7 @@
 """PyInputPlus
 By Al Sweigart al@inventwithpython.com
 
-A Python 2 and 3 module to provide input()- and raw_input()-like functions with additional validation features.
+A Python 3 module to provide input()-like functions with additional validation features.
 
 This module relies heavily on PySimpleValidate (also by Al) for the actual
 validation. PyInputPlus provides interaction with the user through stdin/stdout
@@ -10,17 +10,60 @@ while PySimpleValidate provides the functions that validate the user's input.
 
 # TODO - Figure out a way to get doctests to work with input().
 
-# TODO - Possible future feature: using cmdline for tab-completion and history.
-
 from __future__ import absolute_import, division, print_function
 
+import _thread
+import codecs
+import io
+import os
+import select
+import sys
 import time
 
-import pysimplevalidate as pysv
-import stdiomask
-
 __version__ = '0.2.6'
 
+
+class _LazyModule(object):
+    """Stands in for a module that isn't imported until one of its attributes
+    is first used, so that `import pyinputplus` stays fast for programs that
+    never need it. On first use, this object replaces itself with the real
+    module in this module's globals, so later uses don't go through it."""
+
+    def __init__(self, moduleName, globalName):
+        self._moduleName = moduleName
+        self._globalName = globalName
+
+    def __getattr__(self, name):
+        module = __import__(self._moduleName)
+        globals()[self._globalName] = module
+        return getattr(module, name)
+
+
+# These modules are imported when first used. PySimpleValidate (which
+# imports re, datetime, calendar, and typing) is needed once a prompt is
+# created, stdiomask is only needed for password prompts, and queue and
+# threading are only needed to read input with a timeout. termios, tty, and
+# msvcrt are only needed to read keystrokes with KeystrokeIOBackend (and only
+# exist on some platforms). atexit is only needed once an AnswerStore has
+# answers to write.
+pysv = _LazyModule('pysimplevalidate', 'pysv')
+re = _LazyModule('re', 're')
+datetime = _LazyModule('datetime', 'datetime')
+stdiomask = _LazyModule('stdiomask', 'stdiomask')
+queue = _LazyModule('queue', 'queue')
+threading = _LazyModule('threading', 'threading')
+csv = _LazyModule('csv', 'csv')
+collections = _LazyModule('collections', 'collections')
+json = _LazyModule('json', 'json')
+heapq = _LazyModule('heapq', 'heapq')
+decimal = _LazyModule('decimal', 'decimal')
+array = _LazyModule('array', 'array')
+bisect = _LazyModule('bisect', 'bisect')
+atexit = _LazyModule('atexit', 'atexit')
+termios = _LazyModule('termios', 'termios')
+tty = _LazyModule('tty', 'tty')
+msvcrt = _LazyModule('msvcrt', 'msvcrt')
+
 class PyInputPlusException(Exception):
     """Base class for exceptions raised when PyInputPlus functions encounter
     a problem. If PyInputPlus raises an exception that isn't this class, that
@@ -37,16 +80,96 @@ class RetryLimitException(Exception):
     within the limited number of tries given."""
     pass
 
-"""
-TODO - This can be added to a future version if needed.
-class MetaDataEntry(object):
-    def __init__(self):
+class SlowValidationWarning(UserWarning):
+    """This warning is issued when applyFunc, the validation of a response, or
+    postValidateApplyFunc takes longer than the budget set with
+    setValidationBudget().
+
+    * stage (str): 'applyFunc', 'validationFunc', or 'postValidateApplyFunc'.
+    * func (Callable): The function that took too long. For 'validationFunc', this is the Prompt object's validation method.
+    * duration (float): The number of seconds it took.
+    * budget (float): The budget it went over, in seconds.
+    """
+
+    def __init__(self, stage, func, duration, budget):
+        self.stage = stage
+        self.func = func
+        self.duration = duration
+        self.budget = budget
+        funcName = getattr(func, '__qualname__', getattr(func, '__name__', repr(func)))
+        super(SlowValidationWarning, self).__init__('%s %s took %.3f seconds, over the budget of %.3f seconds'
+                                                    % (stage, funcName, duration, budget))
+
+class PromptMetrics(object):
+    """The measurements of one call to an input*() function or Prompt.ask(),
+    which are passed to the callback set with setMetricsCallback() when the
+    call returns or raises an exception. Times are in seconds.
+
+    * promptType (str, None): The name of the Prompt class, such as 'IntPrompt', or None for _genericInput().
+    * startTime (float): The Unix epoch time when the first prompt was displayed.
+    * endTime (float): The Unix epoch time when the call returned or raised an exception.
+    * duration (float): The time from startTime to endTime.
+    * firstAnswerTime (float, None): The time from startTime until the user's first response, or None if they never responded.
+    * tries (int): The number of responses and unanswered attempts that counted as tries. Menu paging commands aren't tries.
+    * invalidResponses (int): The number of responses that failed validation.
+    * waitTime (float): The total time spent waiting for the user to respond.
+    * validationTime (float): The total time spent in applyFunc, validation, and postValidateApplyFunc.
+    * applyFuncTime (float): The part of validationTime spent in applyFunc.
+    * validationFuncTime (float): The part of validationTime spent in validation, such as checking blockRegexes and calling customValidationFunc.
+    * postValidateApplyFuncTime (float): The part of validationTime spent in postValidateApplyFunc.
+    * timedOut (bool): True if the timeout passed.
+    * limitReached (bool): True if the user ran out of tries.
+    * usedDefault (bool): True if the default value was returned because of the timeout or limit.
+    * exception (Exception, None): The exception that the call raised, if any.
+    """
+
+    def __init__(self, promptType):
+        self.promptType = promptType
         self.startTime = None
         self.endTime = None
-        self.time = None
-        self.original = None
-        self.userInput = None
-"""
+        self.duration = None
+        self.firstAnswerTime = None
+        self.tries = 0
+        self.invalidResponses = 0
+        self.waitTime = 0.0
+        self.validationTime = 0.0
+        self.applyFuncTime = 0.0
+        self.validationFuncTime = 0.0
+        self.postValidateApplyFuncTime = 0.0
+        self.timedOut = False
+        self.limitReached = False
+        self.usedDefault = False
+        self.exception = None
+
+    @property
+    def retries(self):
+        """The number of tries after the first one."""
+        return max(self.tries - 1, 0)
+
+    def __repr__(self):
+        return '<%s %s: %s tries, %.3fs waiting, %.6fs validating>' % (type(self).__name__, self.promptType,
+                                                                       self.tries, self.waitTime, self.validationTime)
+
+    def _responseRead(self, waitStartTime, userInput):
+        """Called by the input loop after waiting for the user to respond."""
+        now = time.time()
+        self.waitTime += now - waitStartTime
+        if userInput is not None and self.firstAnswerTime is None:
+            self.firstAnswerTime = now - self.startTime
+
+    def _limitOrTimeoutReached(self, limitOrTimeoutException, usedDefault):
+        self.timedOut = isinstance(limitOrTimeoutException, TimeoutException)
+        self.limitReached = isinstance(limitOrTimeoutException, RetryLimitException)
+        self.usedDefault = usedDefault
+
+    def _finish(self, exception):
+        """Records the end of the call and passes this object to the metrics
+        callback."""
+        self.endTime = time.time()
+        self.duration = self.endTime - self.startTime
+        self.exception = exception
+        if _metricsCallback is not None:
+            _metricsCallback(self)
 
 def _checkLimitAndTimeout(startTime, timeout, tries, limit):
     """Returns a TimeoutException or RetryLimitException if the user has
@@ -69,9 +192,1005 @@ def _checkLimitAndTimeout(startTime, timeout, tries, limit):
     return None # Returns None if there was neither a timeout or limit exceeded.
 
 
+class _ReadTimeoutException(Exception):
+    """Raised by _inputWithTimeout() when the user doesn't enter a line in
+    time. This is caught by _genericInputLoop() and never reaches the caller."""
+    pass
+
+
+def _inputWithTimeout(timeout):
+    """Like input(), except that it raises _ReadTimeoutException if the user
+    hasn't entered a line within timeout seconds.
+
+    If stdin is a terminal (on a platform other than Windows), select() is used
+    to wait for the line. Otherwise, input() is called in a background thread.
+
+    * timeout (int, float): The number of seconds to wait for a line of input.
+    """
+    sys.stdout.flush() # input() flushes the prompt, but sys.stdin.readline() doesn't.
+
+    if sys.platform == 'win32' or not _stdinIsTerminal() or _stdinThreadedReaderIsBusy():
+        return _threadedInput(timeout)
+
+    if not select.select([sys.stdin], [], [], max(timeout, 0))[0]:
+        raise _ReadTimeoutException()
+    line = sys.stdin.readline()
+    if line == '':
+        raise EOFError('EOF when reading a line') # The same exception input() raises.
+    if line.endswith('\n'):
+        line = line[:-1]
+    return line
+
+
+def _stdinIsTerminal():
+    """Returns True if sys.stdin is a terminal with a file descriptor that
+    select() can wait on."""
+    try:
+        return os.isatty(sys.stdin.fileno())
+    except (AttributeError, ValueError, OSError, io.UnsupportedOperation):
+        return False
+
+
+class _ThreadedLineReader(object):
+    """Calls a readline function in a background thread so that waiting for
+    its result can time out. Only one thread reads at a time: if waiting for
+    a line times out, the thread keeps running and the line it eventually
+    reads is returned by the next call to read()."""
+
+    def __init__(self, readlineFunc):
+        self._readlineFunc = readlineFunc
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._running = False
+
+    def read(self, timeout):
+        """Returns the next line, and raises _ReadTimeoutException if it isn't
+        read within timeout seconds. If timeout is None, this waits forever."""
+        with self._lock:
+            # Start a reader thread unless one is already running or has
+            # already read a line that hasn't been returned yet.
+            if not self._running and self._queue.empty():
+                self._running = True
+                readerThread = threading.Thread(target=self._readerThreadTarget)
+                readerThread.daemon = True
+                readerThread.start()
+
+        try:
+            succeeded, result = self._queue.get(timeout=None if timeout is None else max(timeout, 0))
+        except queue.Empty:
+            raise _ReadTimeoutException()
+
+        if succeeded:
+            return result
+        else:
+            raise result # Reraise the exception (such as EOFError) that the readline function raised.
+
+    def isBusy(self):
+        """Returns True if a reader thread is still waiting for a line, or has
+        read a line that read() hasn't returned yet. Anything else that reads
+        from the same file must call read() until this returns False, or the
+        thread will take a line meant for it."""
+        with self._lock:
+            return self._running or not self._queue.empty()
+
+    def _readerThreadTarget(self):
+        try:
+            result = (True, self._readlineFunc())
+        except Exception as exc:
+            result = (False, exc)
+
+        with self._lock:
+            self._queue.put(result)
+            self._running = False
+
+
+# The reader used by _threadedInput() for stdin, created when first needed.
+_stdinThreadedReader = None
+
+
+def _threadedInput(timeout):
+    """Calls input() in a background thread, and raises _ReadTimeoutException
+    if it doesn't return within timeout seconds. If timeout is None, this
+    waits forever."""
+    global _stdinThreadedReader
+    if _stdinThreadedReader is None:
+        # input() is called through a lambda so that it uses whatever
+        # sys.stdin is when the line is read.
+        _stdinThreadedReader = _ThreadedLineReader(lambda: input())
+    return _stdinThreadedReader.read(timeout)
+
+
+def _stdinThreadedReaderIsBusy():
+    """Returns True if a line of stdin must be read with _threadedInput(),
+    because a background thread left behind by an earlier read that timed out
+    is still reading it (or has already read it)."""
+    return _stdinThreadedReader is not None and _stdinThreadedReader.isBusy()
+
+
+class ConsoleLock(object):
+    """A lock that lets one thread at a time prompt the user through an IO
+    backend, so that prompts from different threads don't interleave and each
+    response goes to the prompt that asked for it. Every prompt holds its IO
+    backend's ConsoleLock (see IOBackend.getConsoleLock()) while it runs.
+
+    The lock is reentrant: a thread that holds it can acquire it again, such
+    as for each prompt inside a consoleSession(). When it is released, the
+    waiting thread with the highest priority gets it next, and threads with
+    the same priority get it in the order they asked for it.
+
+    It can also be held in a with statement, such as to print output from a
+    background thread without interrupting a prompt.
+    """
+
+    def __init__(self):
+        self._mutex = _thread.allocate_lock() # Protects the attributes below.
+        self._owner = None # The thread identifier of the thread holding the lock.
+        self._count = 0 # The number of times the owner has acquired the lock.
+        self._waiters = [] # A heap of (-priority, order, thread identifier, wake lock) tuples.
+        self._order = 0
+
+    def acquire(self, timeout=None, priority=0):
+        """Waits until this thread holds the lock, and returns True, or
+        returns False if it isn't acquired within timeout seconds. If timeout
+        is None, this waits forever.
+
+        * timeout (int, float, None): The number of seconds to wait.
+        * priority (int, float): Higher priority threads get the lock before lower priority ones.
+        """
+        return self._acquireFor(_thread.get_ident(), timeout, priority)
+
+    def _acquireFor(self, threadId, timeout, priority):
+        """Like acquire(), but the lock is acquired for the thread with the
+        identifier threadId, which then has to release it. The ainput*()
+        functions call this from a background thread so that the event loop
+        doesn't block while they wait for the lock."""
+        with self._mutex:
+            if self._owner == threadId:
+                self._count += 1
+                return True
+            if self._owner is None and not self._waiters:
+                self._owner, self._count = threadId, 1
+                return True
+
+            # release() hands the lock to the first waiter and releases its wake lock.
+            wakeLock = _thread.allocate_lock()
+            wakeLock.acquire()
+            waiter = (-priority, self._order, threadId, wakeLock)
+            self._order += 1
+            heapq.heappush(self._waiters, waiter)
+
+        if wakeLock.acquire(True, -1 if timeout is None else max(timeout, 0)):
+            return True
+        with self._mutex:
+            if self._owner == threadId:
+                return True # The lock was handed over just as the wait timed out.
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+            return False
+
+    def release(self):
+        """Releases the lock, which the calling thread must hold. Raises
+        RuntimeError if it doesn't."""
+        with self._mutex:
+            if self._owner != _thread.get_ident():
+                raise RuntimeError('cannot release a console lock that this thread does not hold')
+            self._count -= 1
+            if self._count:
+                return
+            if self._waiters:
+                negativePriority, order, self._owner, wakeLock = heapq.heappop(self._waiters)
+                self._count = 1
+                wakeLock.release()
+            else:
+                self._owner = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.release()
+
+
+_stdioConsoleLock = ConsoleLock() # The ConsoleLock of every StdIOBackend.
+
+
+class IOBackend(object):
+    """Base class for the objects that PyInputPlus uses to display prompts and
+    read the user's input. The input*() functions and Prompt objects use the
+    backend passed as their ioBackend argument, or the one set by
+    setIOBackend() if ioBackend is None.
+
+    Subclasses must implement write() and readLine(), and can implement
+    readPassword() to hide the characters that the user types. Subclasses
+    that need to tell prompts apart from other output can override
+    writePrompt() and writeMessage(), and promptFinished() is called with the
+    outcome of each prompt.
+
+    >>> import pyinputplus as pyip
+    >>> backend = pyip.ScriptedIOBackend(['forty', '42'])
+    >>> pyip.inputInt('> ', ioBackend=backend)
+    42
+    >>> print(backend.getOutput())
+    > 'forty' is not an integer.
+    >
+    """
+
+    def write(self, text):
+        """Displays text, which doesn't necessarily end with a newline."""
+        raise NotImplementedError()
+
+    def writePrompt(self, prompt):
+        """Displays the prompt before the user's input is read. By default,
+        this calls write()."""
+        self.write(prompt)
+
+    def writeMessage(self, message):
+        """Displays a message, such as the reason the user's input is invalid,
+        on its own line. By default, this calls write()."""
+        self.write(message + '\n')
+
+    def getConsoleLock(self):
+        """Returns the ConsoleLock that prompts hold while they use this
+        backend. By default, each backend object has its own lock."""
+        consoleLock = self.__dict__.get('_consoleLock')
+        if consoleLock is None:
+            # setdefault() keeps two threads from creating different locks.
+            consoleLock = self.__dict__.setdefault('_consoleLock', ConsoleLock())
+        return consoleLock
+
+    def flush(self):
+        """Displays any output that write() has held back. readLine() and
+        readPassword() must flush before waiting for input, but code that
+        reads the input some other way (such as the ainput*() functions)
+        calls this first. Does nothing by default."""
+        pass
+
+    def readLine(self, timeout):
+        """Returns the next line of input, without the newline. If timeout is
+        not None and the user hasn't entered a line within timeout seconds,
+        returns None. Raises EOFError if there is no more input."""
+        raise NotImplementedError()
+
+    def readPassword(self, mask):
+        """Returns the next line of input, without the newline, displaying the
+        mask character (or nothing, if mask is '') instead of the characters
+        the user types. This can't time out. By default, the characters
+        aren't hidden."""
+        return self.readLine(None)
+
+    def readLineIncrementally(self, timeout, isValidPrefix, complete=None, history=None):
+        """Like readLine(), but backends that read the input one keystroke at
+        a time (such as KeystrokeIOBackend) can call isValidPrefix with the
+        text typed so far and reject keystrokes that make it return False,
+        because no more typing could turn that text into a valid response.
+        The returned line is still validated. By default, this calls
+        readLine().
+
+        * isValidPrefix (Callable, None): Passed the text typed so far, returns False if no more typing could make it valid. If None, any text can be typed.
+        * complete (Callable, None): Passed the text typed so far, returns it completed as far as it can be without guessing (such as to the rest of the only choice it starts), or None if it can't be completed. Backends call it when Tab is pressed.
+        * history (Sequence, None): The previous valid responses to this kind of prompt, oldest first, which backends can let the user recall (such as with the up arrow key).
+        """
+        return self.readLine(timeout)
+
+    def promptFinished(self, result, exception):
+        """Called when a prompt finishes, with either the value it returns or
+        the exception it raises (such as RetryLimitException) and None for
+        the other argument. Does nothing by default."""
+        pass
+
+
+class _BufferedIOBackend(IOBackend):
+    """Base class for IO backends that hold back everything written until
+    the next read or the end of the prompt, and then display it with a single
+    write. That way each attempt to answer a prompt (the previous response's
+    error message and the prompt) takes one write to the terminal instead of
+    several small ones, which matters over slow connections such as SSH and
+    serial consoles. Subclasses implement _writeOutput()."""
+
+    def __init__(self):
+        self._pendingOutput = []
+
+    def write(self, text):
+        self._pendingOutput.append(text)
+
+    def flush(self):
+        if self._pendingOutput:
+            pendingOutput, self._pendingOutput = self._pendingOutput, []
+            self._writeOutput(''.join(pendingOutput))
+
+    def promptFinished(self, result, exception):
+        self.flush()
+
+    def _writeOutput(self, text):
+        """Displays text and flushes it."""
+        raise NotImplementedError()
+
+
+class StdIOBackend(_BufferedIOBackend):
+    """The default IOBackend, which displays prompts on sys.stdout and reads
+    the user's input from sys.stdin with input(). Passwords are read with
+    stdiomask.getpass(). The output of each attempt is written to sys.stdout
+    all at once, just before the input is read."""
+
+    def getConsoleLock(self):
+        # Every StdIOBackend uses the same stdin and stdout, so they share a lock.
+        return _stdioConsoleLock
+
+    def _writeOutput(self, text):
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def readLine(self, timeout):
+        self.flush()
+        if timeout is None and not _stdinThreadedReaderIsBusy():
+            return input()
+        try:
+            return _inputWithTimeout(timeout)
+        except _ReadTimeoutException:
+            return None
+
+    def readPassword(self, mask):
+        self.flush()
+        return stdiomask.getpass(prompt='', mask=mask)
+
+
+class KeystrokeIOBackend(StdIOBackend):
+    """A StdIOBackend that reads the user's input one keystroke at a time and
+    checks it as they type, for prompts that can tell whether the text typed
+    so far could still become a valid response (such as inputInt(),
+    inputChoice(), inputMenu(), and inputYesNo()). A keystroke that can't
+    lead to a valid response isn't echoed and rings the terminal bell
+    instead, so the user can fix their typing before pressing Enter rather
+    than using up a try. Backspace, Enter, Ctrl-C, and Ctrl-D (or Ctrl-Z on
+    Windows) work as usual.
+
+    Tab completes the response as far as it can without guessing, for
+    inputChoice(), inputMenu(), and inputFilepath(). The up and down arrow
+    keys go through the previous valid responses to the same kind of prompt
+    (the last 100 of them, see getHistory()), so a repeated answer takes one
+    keystroke. Other keys, such as the left and right arrow keys, are
+    ignored.
+
+    The rest of the response is still validated after Enter is pressed,
+    since a response such as '4' for inputInt(min=10) can only be rejected
+    once it's complete. Password prompts, and any prompt whose stdin isn't a
+    terminal, read lines the same way StdIOBackend does.
+
+    >>> import pyinputplus as pyip
+    >>> pyip.setIOBackend(pyip.KeystrokeIOBackend())
+    """
+
+    def readLineIncrementally(self, timeout, isValidPrefix, complete=None, history=None):
+        if not _stdinIsTerminal() or _stdinThreadedReaderIsBusy():
+            return self.readLine(timeout)
+        self.flush()
+        with _TerminalKeyReader() as keyReader:
+            return _readKeystrokes(keyReader.readKey, self._writeOutput, isValidPrefix,
+                                   None if timeout is None else time.time() + timeout, complete, history)
+
+
+# The keys that _TerminalKeyReader.readKey() returns for the up and down arrow
+# keys. (The other keys it returns are single characters.)
+_KEY_UP = '\x1b[A'
+_KEY_DOWN = '\x1b[B'
+
+
+def _readKeystrokes(readKey, write, isValidPrefix, deadline, complete=None, history=None):
+    """Reads keys with readKey until Enter is pressed and returns the text
+    typed, echoing it with write. Keys that make isValidPrefix return False
+    for the text typed so far are rejected with the terminal bell. Returns
+    None if deadline (a time.time() value, or None for no deadline) passes
+    first.
+
+    * readKey (Callable): Passed the number of seconds to wait (or None to wait forever), returns the next key typed as a one-character str (or _KEY_UP or _KEY_DOWN), or None if none was typed in time.
+    * write (Callable): Displays and flushes its str argument.
+    * isValidPrefix (Callable, None): Passed the text typed so far, returns False if no more typing could make it valid.
+    * deadline (int, float, None): The time.time() when reading times out.
+    * complete (Callable, None): Called with the text typed so far when Tab is pressed, returns the text to replace it with or None.
+    * history (Sequence, None): The previous responses that the up and down arrow keys go through, oldest first. Responses that isValidPrefix rejects are skipped.
+    """
+    chars = []
+    # The history entries that can be recalled, and the index of the one
+    # being shown (len(entries) while showing what the user typed, which is
+    # kept in draft).
+    entries = [entry for entry in history or () if isValidPrefix is None or isValidPrefix(entry)]
+    historyIndex = len(entries)
+    draft = ''
+    while True:
+        key = readKey(None if deadline is None else max(deadline - time.time(), 0))
+        if key is None:
+            if chars:
+                write('\n') # Don't leave the abandoned text in front of the next prompt.
+            return None
+        elif key in ('\r', '\n'):
+            write('\n')
+            return ''.join(chars)
+        elif key in ('\b', '\x7f'):
+            if chars:
+                chars.pop()
+                write('\b \b') # \b doesn't erase the character, it just moves the cursor back.
+        elif key == '\x03':
+            raise KeyboardInterrupt()
+        elif key in ('\x04', '\x1a'):
+            if not chars:
+                raise EOFError('EOF when reading a line') # The same exception input() raises.
+        elif key == '\t':
+            completed = None if complete is None else complete(''.join(chars))
+            if completed is None or completed == ''.join(chars):
+                write('\a')
+            else:
+                _replaceTypedText(chars, completed, write)
+        elif key in (_KEY_UP, _KEY_DOWN):
+            if historyIndex == len(entries):
+                draft = ''.join(chars)
+            newIndex = historyIndex - 1 if key == _KEY_UP else historyIndex + 1
+            if 0 <= newIndex <= len(entries):
+                historyIndex = newIndex
+                _replaceTypedText(chars, entries[historyIndex] if historyIndex < len(entries) else draft, write)
+            else:
+                write('\a')
+        elif key < ' ':
+            pass # Ignore other control characters.
+        elif isValidPrefix is None or isValidPrefix(''.join(chars) + key):
+            chars.append(key)
+            write(key)
+        else:
+            write('\a')
+
+
+def _replaceTypedText(chars, text, write):
+    """Changes the displayed text the user has typed, whose characters are in
+    the chars list, to text. Only the characters after the part they have in
+    common are erased and rewritten."""
+    commonLength = len(os.path.commonprefix([''.join(chars), text]))
+    erased = len(chars) - commonLength
+    write('\b' * erased + ' ' * erased + '\b' * erased + text[commonLength:])
+    chars[:] = list(text)
+
+
+class _TerminalKeyReader(object):
+    """Reads the keys typed at the stdin terminal one at a time, without
+    waiting for Enter and without echoing them. On Windows keys are read with
+    msvcrt. On other platforms the terminal is put into cbreak mode while this
+    object is used in a with statement, and the keys are read from the stdin
+    file descriptor. The up and down arrow keys are returned as _KEY_UP and
+    _KEY_DOWN, and other escape sequences (such as those sent by the other
+    arrow keys) are skipped."""
+
+    def __enter__(self):
+        if sys.platform != 'win32':
+            self._fd = sys.stdin.fileno()
+            self._decoder = codecs.getincrementaldecoder(getattr(sys.stdin, 'encoding', None) or 'utf-8')('replace')
+            self._oldSettings = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd, termios.TCSANOW) # TCSAFLUSH would discard keys typed ahead.
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if sys.platform != 'win32':
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._oldSettings)
+
+    def readKey(self, timeout):
+        """Returns the next key typed, or None if none is typed within
+        timeout seconds. If timeout is None, this waits forever."""
+        if sys.platform == 'win32':
+            return self._readWindowsKey(timeout)
+        while True:
+            key = self._readChar(timeout)
+            if key != '\x1b':
+                return key
+            # Read the rest of the escape sequence: either a CSI sequence
+            # ('[', parameters, and a final character from '@' to '~'), an
+            # SS3 sequence ('O' and one character), or an Alt+key. The arrow
+            # keys send '[A' or 'OA' (for up), and so on.
+            key = self._readChar(_ESCAPE_SEQUENCE_TIMEOUT)
+            if key == '[':
+                parameters = ''
+                key = self._readChar(_ESCAPE_SEQUENCE_TIMEOUT)
+                while key is not None and not '@' <= key <= '~':
+                    parameters += key
+                    key = self._readChar(_ESCAPE_SEQUENCE_TIMEOUT)
+                if parameters == '' and key in ('A', 'B'):
+                    return _KEY_UP if key == 'A' else _KEY_DOWN
+            elif key == 'O':
+                key = self._readChar(_ESCAPE_SEQUENCE_TIMEOUT)
+                if key in ('A', 'B'):
+                    return _KEY_UP if key == 'A' else _KEY_DOWN
+
+    def _readChar(self, timeout):
+        """Returns the next character read from stdin, or None if one isn't
+        read within timeout seconds."""
+        while True:
+            if timeout is not None and not select.select([self._fd], [], [], timeout)[0]:
+                return None
+            data = os.read(self._fd, 1)
+            if data == b'':
+                return '\x04' # The end of the input acts like Ctrl-D.
+            char = self._decoder.decode(data)
+            if char:
+                return char
+            timeout = _ESCAPE_SEQUENCE_TIMEOUT # Wait for the rest of a multi-byte character.
+
+    def _readWindowsKey(self, timeout):
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            while deadline is not None and not msvcrt.kbhit():
+                if time.time() >= deadline:
+                    return None
+                time.sleep(0.01)
+            key = msvcrt.getwch()
+            if key in ('\x00', '\xe0'):
+                # Function and arrow keys are read as two characters.
+                key = msvcrt.getwch()
+                if key in ('H', 'P'):
+                    return _KEY_UP if key == 'H' else _KEY_DOWN
+            else:
+                return key
+
+
+# The number of seconds to wait for the rest of an escape sequence or
+# multi-byte character, which the terminal sends all at once.
+_ESCAPE_SEQUENCE_TIMEOUT = 0.05
+
+
+class ScriptedIOBackend(IOBackend):
+    """An IOBackend that answers prompts from a sequence of strings instead of
+    reading stdin, and records everything written instead of displaying it.
+    This is useful for tests and for replaying recorded answers without a
+    terminal. See also replay().
+
+    * answers (Iterable, str): The strings to use as the user's responses, in order, or a file object or filename to read them from, one per line. A None item acts as if the user didn't respond before the read timed out (this requires strictTimeout or attemptTimeout to be used). After the last answer, reading raises EOFError.
+    * transcript (list, None): If not None, either a list that a (kind, value) tuple is appended to for each event, or a text file object that a "kind: value" line is written to for each event. The kinds are 'prompt' and 'message' for the text displayed, 'input' for each answer read, 'result' for the value a prompt returns, and 'exception' for the exception it raises.
+
+    >>> import pyinputplus as pyip
+    >>> transcript = []
+    >>> backend = pyip.ScriptedIOBackend(['maybe', 'yes'], transcript=transcript)
+    >>> pyip.inputYesNo('Continue? ', ioBackend=backend)
+    'yes'
+    >>> backend.getOutput()
+    "Continue? 'maybe' is not a valid yes/no response.\\nContinue? "
+    >>> transcript
+    [('prompt', 'Continue? '), ('input', 'maybe'), ('message', "'maybe' is not a valid yes/no response."), ('prompt', 'Continue? '), ('input', 'yes'), ('result', 'yes')]
+    """
+
+    def __init__(self, answers, transcript=None):
+        if isinstance(answers, str):
+            with open(answers) as answersFile:
+                answers = answersFile.read().splitlines()
+        elif hasattr(answers, 'readline'):
+            answers = (line[:-1] if line.endswith('\n') else line for line in answers)
+        self._answers = iter(answers)
+        self._output = []
+
+        if transcript is None:
+            self._record = None
+        elif hasattr(transcript, 'write'):
+            self._record = lambda kind, value: transcript.write('%s: %r\n' % (kind, value))
+        else:
+            self._record = lambda kind, value: transcript.append((kind, value))
+
+    def write(self, text):
+        self._output.append(text)
+
+    def writePrompt(self, prompt):
+        self._output.append(prompt)
+        if self._record is not None:
+            self._record('prompt', prompt)
+
+    def writeMessage(self, message):
+        self._output.append(message + '\n')
+        if self._record is not None:
+            self._record('message', message)
+
+    def readLine(self, timeout):
+        try:
+            answer = next(self._answers)
+        except StopIteration:
+            raise EOFError('EOF when reading a line') # The same exception input() raises.
+
+        if answer is None and timeout is None:
+            raise PyInputPlusException('a None answer requires the prompt to have a read timeout')
+        if self._record is not None:
+            self._record('input', answer)
+        return answer
+
+    def readPassword(self, mask):
+        return self.readLine(None)
+
+    def promptFinished(self, result, exception):
+        if self._record is not None:
+            if exception is None:
+                self._record('result', result)
+            else:
+                self._record('exception', exception)
+
+    def getOutput(self):
+        """Returns everything written to this backend as a single string."""
+        return ''.join(self._output)
+
+
+class FileIOBackend(_BufferedIOBackend):
+    """An IOBackend that reads the user's input from one file-like object and
+    writes prompts to another, such as the two ends of a pipe or a socket
+    opened with sock.makefile('rw'). Both must be opened in text mode. The
+    output of each attempt is written and flushed all at once, just before
+    the input is read.
+
+    Read timeouts are implemented by reading inputFile in a background
+    thread. Passwords are read like any other line, without hiding them.
+
+    * inputFile: The file-like object that the user's input is read from with readline().
+    * outputFile: The file-like object that prompts are written to. If None, the output is discarded.
+    """
+
+    def __init__(self, inputFile, outputFile=None):
+        super(FileIOBackend, self).__init__()
+        self.inputFile = inputFile
+        self.outputFile = outputFile
+        self._threadedReader = _ThreadedLineReader(self._readLineBlocking)
+
+    def _writeOutput(self, text):
+        if self.outputFile is not None:
+            self.outputFile.write(text)
+            self.outputFile.flush()
+
+    def readLine(self, timeout):
+        self.flush()
+        try:
+            return self._threadedReader.read(timeout)
+        except _ReadTimeoutException:
+            return None
+
+    def _readLineBlocking(self):
+        line = self.inputFile.readline()
+        if line == '':
+            raise EOFError('EOF when reading a line') # The same exception input() raises.
+        if line.endswith('\n'):
+            line = line[:-1]
+        return line
+
+
+class StreamIOBackend(IOBackend):
+    """An IOBackend for answering prompts from a pipe or a file as fast as
+    possible, such as when a program is run as `mytool < answers.txt`.
+
+    The input is read in large blocks instead of one line at a time, so
+    other code shouldn't read from inputFile while this backend is in use.
+    Prompts aren't displayed unless showPrompts is True, and then they are
+    written without flushing. The validation error messages of each prompt
+    are written to errorFile all at once when the prompt finishes, as one
+    JSON object per line with the line number and text of the response:
+
+        {"line": 3, "input": "forty", "error": "'forty' is not an integer."}
+
+    Read timeouts are implemented by reading inputFile in a background
+    thread. Passwords are read like any other line.
+
+    * inputFile: The text file-like object that answers are read from, or None for sys.stdin.
+    * outputFile: The text file-like object that prompts are written to if showPrompts is True, or None for sys.stdout.
+    * errorFile: The text file-like object that error messages are written to, or None for sys.stderr.
+    * showPrompts (bool): If True, prompts are written to outputFile.
+    * blockSize (int): The largest number of bytes to read at a time.
+
+    See also autoIOBackend().
+
+    >>> import io
+    >>> import pyinputplus as pyip
+    >>> errors = io.StringIO()
+    >>> backend = pyip.StreamIOBackend(io.StringIO('forty\n42\n'), errorFile=errors)
+    >>> pyip.inputInt('Number: ', ioBackend=backend)
+    42
+    >>> print(errors.getvalue())
+    {"line": 1, "input": "forty", "error": "'forty' is not an integer."}
+    """
+
+    def __init__(self, inputFile=None, outputFile=None, errorFile=None, showPrompts=False, blockSize=65536):
+        if not isinstance(blockSize, int) or blockSize < 1:
+            raise PyInputPlusException('blockSize argument must be a positive int')
+        self.inputFile = inputFile
+        self.outputFile = outputFile
+        self.errorFile = errorFile
+        self.showPrompts = showPrompts
+        self.blockSize = blockSize
+        self.lineNumber = 0 # The line number of the last response read.
+        self._lines = [] # Lines that have been read but not returned yet, in reverse order.
+        self._partialLine = ''
+        self._decoder = None
+        self._eof = False
+        self._lastInput = None
+        self._errors = [] # The JSON error lines of the current prompt.
+        self._threadedReader = None
+
+    def write(self, text):
+        if self.showPrompts:
+            (sys.stdout if self.outputFile is None else self.outputFile).write(text)
+
+    def writeMessage(self, message):
+        self._errors.append(json.dumps({'line': self.lineNumber, 'input': self._lastInput, 'error': message}) + '\n')
+
+    def readLine(self, timeout):
+        if not self._lines:
+            self._writeErrors() # Don't hold back the errors while waiting for more input.
+            if timeout is None and self._threadedReader is None:
+                self._lines = self._readLines()
+            else:
+                # Once a read has timed out, its thread might still be reading,
+                # so every later read also goes through the threaded reader.
+                if self._threadedReader is None:
+                    self._threadedReader = _ThreadedLineReader(self._readLines)
+                try:
+                    self._lines = self._threadedReader.read(timeout)
+                except _ReadTimeoutException:
+                    return None
+
+        self._lastInput = self._lines.pop()
+        self.lineNumber += 1
+        return self._lastInput
+
+    def readPassword(self, mask):
+        return self.readLine(None)
+
+    def promptFinished(self, result, exception):
+        self._writeErrors()
+
+    def _writeErrors(self):
+        if self._errors:
+            (sys.stderr if self.errorFile is None else self.errorFile).write(''.join(self._errors))
+            self._errors = []
+
+    def _readLines(self):
+        """Reads the next block of input and returns the complete lines in it
+        in reverse order, reading more blocks until there is at least one.
+        Raises EOFError if there is no more input."""
+        inputFile = sys.stdin if self.inputFile is None else self.inputFile
+        while True:
+            if self._eof:
+                raise EOFError('EOF when reading a line') # The same exception input() raises.
+
+            text = self._readBlock(inputFile)
+            if text == '':
+                self._eof = True
+                lines = [] if self._partialLine == '' else [self._partialLine]
+                self._partialLine = ''
+            else:
+                lines = (self._partialLine + text).split('\n')
+                self._partialLine = lines.pop()
+            if lines:
+                lines.reverse()
+                return [line[:-1] if line.endswith('\r') else line for line in lines]
+
+    def _readBlock(self, inputFile):
+        """Returns the text of the next block of input, or '' at the end of
+        the input. Text files are read through their binary buffer's read1(),
+        which returns whatever is available instead of waiting for a whole
+        block. Other file-like objects are read with readline()."""
+        read1 = getattr(getattr(inputFile, 'buffer', None), 'read1', None)
+        if read1 is None:
+            return inputFile.readline()
+        if self._decoder is None:
+            self._decoder = codecs.getincrementaldecoder(getattr(inputFile, 'encoding', None) or 'utf-8')()
+        data = read1(self.blockSize)
+        text = self._decoder.decode(data, final=not data)
+        if data and text == '':
+            return self._readBlock(inputFile) # Only part of a multi-byte character was read.
+        return text
+
+
+def autoIOBackend():
+    """Returns a StreamIOBackend if stdin isn't a terminal (for example, if it
+    is a pipe or a file, as when a program is run as `mytool < answers.txt`),
+    otherwise returns a StdIOBackend.
+
+    >>> import pyinputplus as pyip
+    >>> pyip.setIOBackend(pyip.autoIOBackend())
+    """
+    return StdIOBackend() if _stdinIsTerminal() else StreamIOBackend()
+
+
+_ioBackend = StdIOBackend() # The backend used when the ioBackend argument is None.
+
+
+def setIOBackend(ioBackend):
+    """Sets the IOBackend object used by the input*() functions and Prompt
+    objects whose ioBackend argument is None. If ioBackend is None, the
+    default StdIOBackend is used.
+
+    >>> import pyinputplus as pyip
+    >>> pyip.setIOBackend(pyip.ScriptedIOBackend(['42']))
+    >>> pyip.inputInt()
+    42
+    >>> pyip.setIOBackend(None)
+    """
+    global _ioBackend
+    if ioBackend is None:
+        ioBackend = StdIOBackend()
+    if not isinstance(ioBackend, IOBackend):
+        raise PyInputPlusException('ioBackend argument must be an IOBackend object or None')
+    _ioBackend = ioBackend
+
+
+def getIOBackend():
+    """Returns the IOBackend object set by setIOBackend()."""
+    return _ioBackend
+
+
+def replay(answers, transcript=None):
+    """A context manager that answers the prompts of the input*() functions
+    and Prompt objects inside the with statement from answers, instead of
+    reading stdin, by temporarily making a ScriptedIOBackend the global IO
+    backend. The with statement's target is the ScriptedIOBackend object.
+    Prompts given their own ioBackend argument aren't affected.
+
+    * answers (Iterable, str): The answers to replay, or a file object or filename to read them from, one per line. See ScriptedIOBackend.
+    * transcript (list, None): The list or text file object to record prompts, answers, messages, and results to. See ScriptedIOBackend.
+
+    >>> import pyinputplus as pyip
+    >>> with pyip.replay(['forty', '42', 'no']) as backend:
+    ...     number = pyip.inputInt('Number: ')
+    ...     again = pyip.inputYesNo('Again? ')
+    ...
+    >>> number, again
+    (42, 'no')
+    """
+    return _ReplayContext(ScriptedIOBackend(answers, transcript=transcript))
+
+
+class _ReplayContext(object):
+    """The context manager returned by replay()."""
+
+    def __init__(self, backend):
+        self._backend = backend
+        self._originalBackend = None
+
+    def __enter__(self):
+        self._originalBackend = _ioBackend
+        setIOBackend(self._backend)
+        return self._backend
+
+    def __exit__(self, excType, excValue, traceback):
+        setIOBackend(self._originalBackend)
+
+
+_threadState = _thread._local() # The settings of each thread.
+
+
+def setConsolePriority(priority):
+    """Sets the priority of the calling thread's prompts when they wait for
+    another thread's prompt to finish. When the console is free, the waiting
+    prompt with the highest priority goes next, and prompts with the same
+    priority go in the order they were asked. The default priority is 0.
+
+    >>> import pyinputplus as pyip
+    >>> pyip.setConsolePriority(10) # This thread's prompts go before others.
+    """
+    if not isinstance(priority, (int, float)):
+        raise PyInputPlusException('priority argument must be an int or float')
+    _threadState.consolePriority = priority
+
+
+def getConsolePriority():
+    """Returns the priority of the calling thread's prompts, set with
+    setConsolePriority()."""
+    return getattr(_threadState, 'consolePriority', 0)
+
+
+def consoleSession(ioBackend=None, timeout=None, priority=None):
+    """A context manager that lets the calling thread prompt the user several
+    times in a row, by holding the console lock of the IO backend for the
+    whole with statement. Prompts from other threads that use the same
+    backend wait until the with statement ends. (Each prompt holds the
+    console lock while it runs, so without a session, another thread's
+    prompt can come between two prompts.) Sessions can be nested.
+
+    * ioBackend (IOBackend, None): The IO backend to hold the console lock of, or None for the one set with setIOBackend().
+    * timeout (int, float, None): The number of seconds to wait for other threads' prompts to finish. If the session hasn't started by then, TimeoutException is raised. If None, this waits forever.
+    * priority (int, float, None): The priority of the session while it waits for the console, or None for the thread's priority from setConsolePriority().
+
+    >>> import pyinputplus as pyip
+    >>> with pyip.consoleSession():
+    ...     name = pyip.inputStr('Name: ')
+    ...     age = pyip.inputInt('Age: ')
+    ...
+    Name: Al
+    Age: 42
+    """
+    if not isinstance(ioBackend, (IOBackend, type(None))):
+        raise PyInputPlusException('ioBackend argument must be an IOBackend object or None')
+    if not isinstance(timeout, (int, float, type(None))):
+        raise PyInputPlusException('timeout argument must be an int or float')
+    if not isinstance(priority, (int, float, type(None))):
+        raise PyInputPlusException('priority argument must be an int or float')
+    return _ConsoleSessionContext(_ioBackend if ioBackend is None else ioBackend, timeout,
+                                  getConsolePriority() if priority is None else priority)
+
+
+class _ConsoleSessionContext(object):
+    """The context manager returned by consoleSession()."""
+
+    def __init__(self, ioBackend, timeout, priority):
+        self._consoleLock = ioBackend.getConsoleLock()
+        self._timeout = timeout
+        self._priority = priority
+
+    def __enter__(self):
+        if not self._consoleLock.acquire(self._timeout, self._priority):
+            raise TimeoutException()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self._consoleLock.release()
+
+
+_metricsCallback = None # The function passed each PromptMetrics object, or None to not measure prompts.
+
+
+def setMetricsCallback(callback):
+    """Sets a function that is passed a PromptMetrics object for each call to
+    an input*() function or Prompt.ask(), to measure how long users take to
+    respond, how often they retry, and how long validation takes. A
+    pyinputplus.MetricsCollector object can be used to aggregate these into
+    histograms. If callback is None (the default), prompts aren't measured
+    and nothing is recorded.
+
+    >>> import pyinputplus as pyip
+    >>> collector = pyip.MetricsCollector()
+    >>> pyip.setMetricsCallback(collector)
+    >>> pyip.inputInt(ioBackend=pyip.ScriptedIOBackend(['forty', '42']))
+    42
+    >>> collector.histogram('retries').count
+    1
+    >>> pyip.setMetricsCallback(None)
+    """
+    global _metricsCallback
+    if not (callable(callback) or callback is None):
+        raise PyInputPlusException('callback argument must be a function or None')
+    _metricsCallback = callback
+
+
+def getMetricsCallback():
+    """Returns the function set by setMetricsCallback(), or None."""
+    return _metricsCallback
+
+
+_validationBudget = None # The seconds each stage of processing a response may take, or None for no budget.
+_slowValidationCallback = None # The function passed SlowValidationWarnings instead of warning, if any.
+
+
+def setValidationBudget(budget, callback=None):
+    """Times applyFunc, the validation (such as blockRegexes and
+    customValidationFunc), and postValidateApplyFunc for each response, and
+    reports any of them that take longer than budget seconds. By default, a
+    SlowValidationWarning is issued with warnings.warn(). If callback is not
+    None, it is called with the SlowValidationWarning object instead. If
+    budget is None (the default), nothing is timed.
+
+    >>> import time
+    >>> import pyinputplus as pyip
+    >>> slow = []
+    >>> pyip.setValidationBudget(0.1, callback=slow.append)
+    >>> pyip.inputCustom(lambda value: time.sleep(0.2), ioBackend=pyip.ScriptedIOBackend(['hi']))
+    'hi'
+    >>> slow[0].stage
+    'validationFunc'
+    >>> pyip.setValidationBudget(None)
+    """
+    global _validationBudget, _slowValidationCallback
+    if not isinstance(budget, (int, float, type(None))) or isinstance(budget, bool) or (budget is not None and budget < 0):
+        raise PyInputPlusException('budget argument must be a non-negative int or float, or None')
+    if not (callable(callback) or callback is None):
+        raise PyInputPlusException('callback argument must be a function or None')
+    _validationBudget = budget
+    _slowValidationCallback = callback
+
+
+def getValidationBudget():
+    """Returns the budget set with setValidationBudget(), or None."""
+    return _validationBudget
+
+
 def _genericInput(prompt='', default=None, timeout=None, limit=None,
                   applyFunc=None, validationFunc=None, postValidateApplyFunc=None,
-                  passwordMask=None):
+                  passwordMask=None, strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """This function is used by the various input*() functions to handle the
     common operations of each input function: displaying prompts, collecting input,
     handling timeouts, etc.
@@ -94,10 +1213,48 @@ def _genericInput(prompt='', default=None, timeout=None, limit=None,
     * validationFunc (Callable): A function that is passed the user's input value, which raises an exception if the input isn't valid. (The return value of this function is ignored.)
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
     * passwordMask (str, None): An optional argument. If not None, this getpass.getpass() is used instead of
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend): The IOBackend object that displays the prompt and reads the user's input.
+
+    Note that strictTimeout and attemptTimeout can't interrupt the user while
+    they type a masked password.
     """
 
     # NOTE: _genericInput() always returns a string. Any type casting must be done by the caller.
-    # Validate the parameters.
+    _validateGenericInputParameters(prompt=prompt, default=default, timeout=timeout, limit=limit,
+                                    applyFunc=applyFunc, validationFunc=validationFunc,
+                                    postValidateApplyFunc=postValidateApplyFunc, passwordMask=passwordMask,
+                                    strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                    ioBackend=ioBackend)
+
+    if ioBackend is None:
+        ioBackend = _ioBackend
+    metrics = None if _metricsCallback is None else PromptMetrics(None)
+    try:
+        result = _consoleInputLoop(prompt=prompt, default=default, timeout=timeout, limit=limit,
+                                   applyFunc=applyFunc, validationFunc=validationFunc,
+                                   postValidateApplyFunc=postValidateApplyFunc, passwordMask=passwordMask,
+                                   strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                   ioBackend=ioBackend, commandFunc=None, prefixFunc=None, completeFunc=None,
+                                   history=None, metrics=metrics)
+    except Exception as exc:
+        ioBackend.flush() # Display the last error message.
+        if metrics is not None:
+            metrics._finish(exc)
+        raise
+    ioBackend.flush()
+    if metrics is not None:
+        metrics._finish(None)
+    return result
+
+
+def _validateGenericInputParameters(prompt, default, timeout, limit, applyFunc, validationFunc,
+                                    postValidateApplyFunc, passwordMask, strictTimeout, attemptTimeout, ioBackend):
+    """Raises PyInputPlusException if any of the arguments for _genericInput()
+    are invalid, otherwise returns None. This code was refactored out of
+    _genericInput() so that the Prompt classes can check their arguments once
+    when they are created instead of every time they prompt the user."""
     if not isinstance(prompt, str):
         raise PyInputPlusException('prompt argument must be a str')
     if not isinstance(default, (str, type(None))):
@@ -114,68 +1271,263 @@ def _genericInput(prompt='', default=None, timeout=None, limit=None,
         raise PyInputPlusException('postValidateApplyFunc argument must be a function or None')
     if passwordMask is not None and len(passwordMask) > 1:
         raise PyInputPlusException('passwordMask argument must be None or a single-character string.')
-
+    if not isinstance(strictTimeout, bool):
+        raise PyInputPlusException('strictTimeout argument must be a bool')
+    if not isinstance(attemptTimeout, (int, float, type(None))):
+        raise PyInputPlusException('attemptTimeout argument must be an int or float')
+    if not isinstance(ioBackend, (IOBackend, type(None))):
+        raise PyInputPlusException('ioBackend argument must be an IOBackend object or None')
+
+
+def _genericInputLoop(prompt, default, timeout, limit, applyFunc, validationFunc,
+                      postValidateApplyFunc, passwordMask, strictTimeout, attemptTimeout, ioBackend, commandFunc,
+                      prefixFunc, completeFunc, history, metrics):
+    """The read/validate loop of _genericInput(). The arguments are assumed to
+    have already been checked by _validateGenericInputParameters().
+
+    Prompt objects can also pass a function as prompt, which is called to get
+    the prompt text before each attempt, and a commandFunc, which is passed
+    each response and returns True if it was a command (such as a request for
+    the next page of a menu) rather than an attempt to answer the prompt.
+    Commands aren't validated and don't count as tries. They can also pass a
+    prefixFunc, which is passed the text the user has typed so far and
+    returns False if it can't become a valid response, for IO backends that
+    check the input as it's typed (see IOBackend.readLineIncrementally()),
+    and a completeFunc, which completes the text typed so far. If history is
+    a _History object, each response that passes validation is added to it,
+    and IO backends can let the user recall them.
+
+    If metrics is a PromptMetrics object, the loop records its measurements
+    in it. The caller calls its _finish() method."""
     startTime = time.time()
     tries = 0
+    if metrics is not None:
+        metrics.startTime = startTime
 
     while True:
+        readTimeout, deadlinePassedOnTimeout = _getReadTimeout(startTime=startTime, timeout=timeout,
+                                                               strictTimeout=strictTimeout, attemptTimeout=attemptTimeout)
+
         # Get the user input.
-        print(prompt, end='')
-        if passwordMask is None:
-            userInput = input()
+        ioBackend.writePrompt(prompt() if callable(prompt) else prompt)
+        if metrics is not None:
+            waitStartTime = time.time()
+        if passwordMask is not None:
+            userInput = ioBackend.readPassword(passwordMask)
+        elif prefixFunc is not None or completeFunc is not None or history is not None:
+            userInput = ioBackend.readLineIncrementally(readTimeout, prefixFunc, completeFunc,
+                                                        None if history is None else history.entries())
         else:
-            userInput = stdiomask.getpass(prompt='', mask=passwordMask)
-        tries += 1
+            userInput = ioBackend.readLine(readTimeout)
+        if metrics is not None:
+            metrics._responseRead(waitStartTime, userInput)
 
-        # Transform the user input with the applyFunc function.
-        if applyFunc is not None:
-            userInput = applyFunc(userInput)
+        if userInput is not None and commandFunc is not None and commandFunc(userInput):
+            continue
 
-        # Run the validation function.
-        try:
-            possibleNewUserInput = validationFunc(userInput) # If validation fails, this function will raise an exception. Returns an updated value to use as user input (e.g. stripped of whitespace, etc.)
-            if possibleNewUserInput is not None:
-                userInput = possibleNewUserInput
-        except Exception as exc:
-            # Check if they have timed out or reach the retry limit. (If so,
-            # the TimeoutException/RetryLimitException overrides the validation
-            # exception that was just raised.)
-            limitOrTimeoutException = _checkLimitAndTimeout(startTime=startTime, timeout=timeout, tries=tries, limit=limit)
+        tries += 1
+        if metrics is not None:
+            metrics.tries = tries
+        if userInput is None:
+            result = _processReadTimeout(deadlinePassedOnTimeout=deadlinePassedOnTimeout, startTime=startTime,
+                                         timeout=timeout, tries=tries, limit=limit, default=default,
+                                         ioBackend=ioBackend, metrics=metrics)
+        else:
+            result = _processResponse(userInput, startTime=startTime, timeout=timeout, tries=tries, limit=limit,
+                                      default=default, applyFunc=applyFunc, validationFunc=validationFunc,
+                                      postValidateApplyFunc=postValidateApplyFunc, ioBackend=ioBackend,
+                                      history=history, metrics=metrics)
+
+        if result is not _ASK_AGAIN:
+            return result
+
+
+def _consoleInputLoop(**loopArguments):
+    """Runs _genericInputLoop() with loopArguments while holding the console
+    lock of the IO backend, so that prompts from other threads wait for it.
+    The time spent waiting for the lock counts toward the timeout. If the
+    timeout passes before the lock is acquired, returns the default value or
+    raises TimeoutException without prompting."""
+    consoleLock = loopArguments['ioBackend'].getConsoleLock()
+    timeout = loopArguments['timeout']
+    waitStartTime = time.time()
+    if not consoleLock.acquire(timeout, getConsolePriority()):
+        return _consoleLockTimedOut(loopArguments, waitStartTime)
 
-            print(exc) # Display the message of the validation exception.
+    try:
+        if timeout is not None:
+            loopArguments['timeout'] = timeout - (time.time() - waitStartTime)
+        return _genericInputLoop(**loopArguments)
+    finally:
+        consoleLock.release()
+
+
+def _consoleLockTimedOut(loopArguments, waitStartTime):
+    """Returns the default value, or raises TimeoutException if there isn't
+    one, for a prompt whose timeout passed while it waited for the console
+    lock."""
+    metrics = loopArguments['metrics']
+    if metrics is not None:
+        metrics.startTime = waitStartTime
+        metrics._limitOrTimeoutReached(TimeoutException(), usedDefault=loopArguments['default'] is not None)
+    if loopArguments['default'] is not None:
+        return loopArguments['default']
+    raise TimeoutException()
+
+
+# Returned by _processResponse() and _processReadTimeout() when the user
+# should be prompted for input again.
+_ASK_AGAIN = object()
+
+
+def _getReadTimeout(startTime, timeout, strictTimeout, attemptTimeout):
+    """Returns a tuple of the number of seconds to wait for the user to enter
+    input (or None to wait forever) and a bool of whether the overall timeout
+    will have passed if the wait times out."""
+    readTimeout = attemptTimeout
+    deadlinePassedOnTimeout = False
+    if strictTimeout and timeout is not None:
+        remaining = startTime + timeout - time.time()
+        if readTimeout is None or remaining <= readTimeout:
+            readTimeout = remaining
+            deadlinePassedOnTimeout = True
+    return readTimeout, deadlinePassedOnTimeout
+
+
+def _processReadTimeout(deadlinePassedOnTimeout, startTime, timeout, tries, limit, default, ioBackend, metrics):
+    """Handles the user not entering input before the read timeout from
+    _getReadTimeout(). Returns the default value, returns _ASK_AGAIN, or
+    raises TimeoutException or RetryLimitException."""
+    ioBackend.write('\n') # Move past the unanswered prompt.
+
+    if deadlinePassedOnTimeout:
+        limitOrTimeoutException = TimeoutException()
+    else:
+        limitOrTimeoutException = _checkLimitAndTimeout(startTime=startTime, timeout=timeout, tries=tries, limit=limit)
 
-            if isinstance(limitOrTimeoutException, Exception):
-                if default is not None:
-                    # If there was a timeout/limit exceeded, return the default value if there is one.
-                    return default
-                else:
-                    # If there is no default, then raise the timeout/limit exception.
-                    raise limitOrTimeoutException
-            else:
-                # If there was no timeout/limit exceeded, let the user enter input again.
-                continue
-
-        # The previous call to _checkLimitAndTimeout() only happens when the
-        # user enteres invalid input. Now we should check for a timeout even if
-        # the last input was valid.
-        if timeout is not None and startTime + timeout < time.time():
-            # It doesn't matter that the user entered valid input, they've
-            # exceeded the timeout so we either return the default or raise
-            # TimeoutException.
+    if isinstance(limitOrTimeoutException, Exception):
+        if metrics is not None:
+            metrics._limitOrTimeoutReached(limitOrTimeoutException, usedDefault=default is not None)
+        if default is not None:
+            return default
+        else:
+            raise limitOrTimeoutException
+    else:
+        # This attempt timed out, but the user can enter input again.
+        return _ASK_AGAIN
+
+
+def _processResponse(userInput, startTime, timeout, tries, limit, default, applyFunc, validationFunc,
+                     postValidateApplyFunc, ioBackend, history, metrics):
+    """Transforms and validates the user's input. Returns the value for the
+    input loop to return, returns _ASK_AGAIN if the input was invalid and the
+    user can try again, or raises TimeoutException or RetryLimitException.
+    If the input is valid and history isn't None, the validated response is
+    added to history once it's the result (and not discarded because the
+    timeout passed)."""
+    typedInput = userInput
+
+    # Each stage is only timed if metrics are being recorded or there is a
+    # validation budget.
+    timed = metrics is not None or _validationBudget is not None
+    if timed:
+        stageStartTime = time.perf_counter()
+
+    # Transform the user input with the applyFunc function.
+    if applyFunc is not None:
+        userInput = applyFunc(userInput)
+        if timed:
+            stageStartTime = _stageFinished('applyFunc', applyFunc, stageStartTime, metrics)
+
+    # Run the validation function.
+    try:
+        possibleNewUserInput = validationFunc(userInput) # If validation fails, this function will raise an exception. Returns an updated value to use as user input (e.g. stripped of whitespace, etc.)
+        if possibleNewUserInput is not None:
+            userInput = possibleNewUserInput
+    except Exception as exc:
+        if timed:
+            _stageFinished('validationFunc', validationFunc, stageStartTime, metrics)
+        if metrics is not None:
+            metrics.invalidResponses += 1
+
+        # Check if they have timed out or reach the retry limit. (If so,
+        # the TimeoutException/RetryLimitException overrides the validation
+        # exception that was just raised.)
+        limitOrTimeoutException = _checkLimitAndTimeout(startTime=startTime, timeout=timeout, tries=tries, limit=limit)
+
+        ioBackend.writeMessage(str(exc)) # Display the message of the validation exception.
+
+        if isinstance(limitOrTimeoutException, Exception):
+            if metrics is not None:
+                metrics._limitOrTimeoutReached(limitOrTimeoutException, usedDefault=default is not None)
             if default is not None:
+                # If there was a timeout/limit exceeded, return the default value if there is one.
                 return default
             else:
-                raise TimeoutException()
-
-        if postValidateApplyFunc is not None:
-            return postValidateApplyFunc(userInput)
+                # If there is no default, then raise the timeout/limit exception.
+                raise limitOrTimeoutException
+        else:
+            # If there was no timeout/limit exceeded, let the user enter input again.
+            return _ASK_AGAIN
+    if timed:
+        stageStartTime = _stageFinished('validationFunc', validationFunc, stageStartTime, metrics)
+
+    # The previous call to _checkLimitAndTimeout() only happens when the
+    # user enteres invalid input. Now we should check for a timeout even if
+    # the last input was valid.
+    if timeout is not None and startTime + timeout < time.time():
+        # It doesn't matter that the user entered valid input, they've
+        # exceeded the timeout so we either return the default or raise
+        # TimeoutException.
+        if metrics is not None:
+            metrics._limitOrTimeoutReached(TimeoutException(), usedDefault=default is not None)
+        if default is not None:
+            return default
         else:
-            return userInput
+            raise TimeoutException()
+
+    if history is not None:
+        # Validation returns the stripped (and for some prompts, normalized)
+        # text, such as 'yes' for 'y'. Prompts that return other types, such
+        # as ints and dates, keep the stripped text they were typed as.
+        history.add(userInput if isinstance(userInput, str) else typedInput.strip())
+
+    if postValidateApplyFunc is not None:
+        userInput = postValidateApplyFunc(userInput)
+        if timed:
+            _stageFinished('postValidateApplyFunc', postValidateApplyFunc, stageStartTime, metrics)
+    return userInput
+
+
+def _stageFinished(stage, func, stageStartTime, metrics):
+    """Records how long a stage of processing a response took, given the
+    time.perf_counter() time it started, and reports it if it went over the
+    validation budget. Returns the time it finished, which is when the next
+    stage starts.
+
+    * stage (str): 'applyFunc', 'validationFunc', or 'postValidateApplyFunc'.
+    * func (Callable): The function that was called for the stage.
+    * stageStartTime (float): The time.perf_counter() time the stage started.
+    * metrics (PromptMetrics, None): The PromptMetrics object to add the time to, if any.
+    """
+    finishTime = time.perf_counter()
+    duration = finishTime - stageStartTime
+    if metrics is not None:
+        metrics.validationTime += duration
+        setattr(metrics, stage + 'Time', getattr(metrics, stage + 'Time') + duration)
+    if _validationBudget is not None and duration > _validationBudget:
+        slowValidation = SlowValidationWarning(stage, func, duration, _validationBudget)
+        if _slowValidationCallback is None:
+            import warnings
+            warnings.warn(slowValidation, stacklevel=2)
+        else:
+            _slowValidationCallback(slowValidation)
+    return finishTime
 
 
 def inputStr(prompt='', default=None, blank=False, timeout=None, limit=None,
              strip=None, allowRegexes=None, blockRegexes=None,
-             applyFunc=None, postValidateApplyFunc=None):
+             applyFunc=None, postValidateApplyFunc=None, strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter input. This is similar to Python's input()
     and raw_input() functions, but with PyInputPlus's additional features
     such as timeouts, retry limits, stripping, allowlist/blocklist, etc.
@@ -189,9 +1541,12 @@ def inputStr(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -207,20 +1562,15 @@ def inputStr(prompt='', default=None, blank=False, timeout=None, limit=None,
     >>> result
     'Bob'
     """
-
-    # Validate the arguments passed to pysv.validateNum().
-    pysv._validateGenericParameters(blank, strip, allowRegexes, blockRegexes)
-
-    validationFunc = lambda value: pysv._prevalidationCheck(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, excMsg=None)[1]
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return StrPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit, strip=strip,
+                     allowRegexes=allowRegexes, blockRegexes=blockRegexes, applyFunc=applyFunc,
+                     postValidateApplyFunc=postValidateApplyFunc,
+                     strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputCustom(customValidationFunc, prompt='', default=None, blank=False, timeout=None, limit=None,
              strip=None, allowRegexes=None, blockRegexes=None,
-             applyFunc=None, postValidateApplyFunc=None):
+             applyFunc=None, postValidateApplyFunc=None, strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter input. This is similar to Python's input()
     and raw_input() functions, but with PyInputPlus's additional features
     such as timeouts, retry limits, stripping, allowlist/blocklist, etc.
@@ -235,29 +1585,26 @@ def inputCustom(customValidationFunc, prompt='', default=None, blank=False, time
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
     """
-
-    # Validate the arguments passed to pysv.validateNum().
-    pysv._validateGenericParameters(blank, strip, allowRegexes, blockRegexes)
-
-    # Our validationFunc argument must also call pysv._prevalidationCheck()
-    def validationFunc(value):
-        value = pysv._prevalidationCheck(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, excMsg=None)[1]
-        return customValidationFunc(value)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return CustomPrompt(customValidationFunc=customValidationFunc, prompt=prompt, default=default,
+                        blank=blank, timeout=timeout, limit=limit, strip=strip, allowRegexes=allowRegexes,
+                        blockRegexes=blockRegexes, applyFunc=applyFunc,
+                        postValidateApplyFunc=postValidateApplyFunc,
+                        strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputNum(prompt='', default=None, blank=False, timeout=None, limit=None,
              strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
-             min=None, max=None, greaterThan=None, lessThan=None):
+             min=None, max=None, greaterThan=None, lessThan=None, strictTimeout=False, attemptTimeout=None,
+             ioBackend=None):
     """Prompts the user to enter a number, either an integer or a floating-point
     value. Returns an int or float value (depending on if the user entered a
     decimal in their input.)
@@ -267,9 +1614,12 @@ def inputNum(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
     * min (None, int): If not None, the minimum accepted numeric value, including the minimum argument.
@@ -313,21 +1663,17 @@ def inputNum(prompt='', default=None, blank=False, timeout=None, limit=None,
         ...
     pyinputplus.RetryLimitException
     """
-
-    # Validate the arguments passed to pysv.validateNum().
-    pysv._validateParamsFor_validateNum(min=min, max=max, lessThan=lessThan, greaterThan=greaterThan)
-
-    validationFunc = lambda value: pysv.validateNum(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, min=min, max=max, lessThan=lessThan, greaterThan=greaterThan, _numType='num')
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
-
+    return NumPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit, strip=strip,
+                     allowRegexes=allowRegexes, blockRegexes=blockRegexes, applyFunc=applyFunc,
+                     postValidateApplyFunc=postValidateApplyFunc, min=min, max=max, greaterThan=greaterThan,
+                     lessThan=lessThan, strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                     ioBackend=ioBackend).ask()
 
 
 def inputInt(prompt='', default=None, blank=False, timeout=None, limit=None,
              strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
-             min=None, max=None, lessThan=None, greaterThan=None):
+             min=None, max=None, lessThan=None, greaterThan=None, strictTimeout=False, attemptTimeout=None,
+             ioBackend=None):
     """Prompts the user to enter an integer value. Returns the integer as an
     int value.
 
@@ -336,9 +1682,12 @@ def inputInt(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
     * min (None, int): If not None, the minimum accepted numeric value, including the minimum argument.
@@ -380,30 +1729,17 @@ def inputInt(prompt='', default=None, blank=False, timeout=None, limit=None,
     >>> type(response)
     <class 'int'>
     """
-    # Validate the arguments passed to pysv.validateNum().
-    pysv._validateParamsFor_validateNum(min=min, max=max, lessThan=lessThan, greaterThan=greaterThan)
-
-    validationFunc = lambda value: pysv.validateNum(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, min=min, max=max, lessThan=lessThan, greaterThan=greaterThan, _numType='int')
-
-    result = _genericInput(prompt=prompt, default=default, timeout=timeout,
-                           limit=limit, applyFunc=applyFunc,
-                           validationFunc=validationFunc)
-
-    try:
-        result = int(float(result))
-    except ValueError:
-        # In case _genericInput() returned the default value or an allowlist value, return that as is instead.
-        pass
-
-    if postValidateApplyFunc is None:
-        return result
-    else:
-        return postValidateApplyFunc(result)
+    return IntPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit, strip=strip,
+                     allowRegexes=allowRegexes, blockRegexes=blockRegexes, applyFunc=applyFunc,
+                     postValidateApplyFunc=postValidateApplyFunc, min=min, max=max, lessThan=lessThan,
+                     greaterThan=greaterThan, strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                     ioBackend=ioBackend).ask()
 
 
 def inputFloat(prompt='', default=None, blank=False, timeout=None, limit=None,
              strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
-             min=None, max=None, lessThan=None, greaterThan=None):
+             min=None, max=None, lessThan=None, greaterThan=None, strictTimeout=False, attemptTimeout=None,
+               ioBackend=None):
     """Prompts the user to enter a floating point number value.
     Returns the number as a float.
 
@@ -412,9 +1748,12 @@ def inputFloat(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
     * min (None, int): If not None, the minimum accepted numeric value, including the minimum argument.
@@ -430,30 +1769,16 @@ def inputFloat(prompt='', default=None, blank=False, timeout=None, limit=None,
     >>> type(response)
     <class 'float'>
     """
-    # Validate the arguments passed to pysv.validateNum().
-    pysv._validateParamsFor_validateNum(min=min, max=max, lessThan=lessThan, greaterThan=greaterThan)
-
-    validationFunc = lambda value: pysv.validateNum(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, min=min, max=max, lessThan=lessThan, greaterThan=greaterThan, _numType='float')
-
-    result = _genericInput(prompt=prompt, default=default, timeout=timeout,
-                           limit=limit, applyFunc=applyFunc,
-                           validationFunc=validationFunc)
-
-    try:
-        result = float(result)
-    except ValueError:
-        # In case _genericInput() returned the default value or an allowlist value, return that as is instead.
-        pass
-
-    if postValidateApplyFunc is None:
-        return result
-    else:
-        return postValidateApplyFunc(result)
+    return FloatPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                       strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                       applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc, min=min, max=max,
+                       lessThan=lessThan, greaterThan=greaterThan,
+                       strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputChoice(choices, prompt='_default', default=None, blank=False, timeout=None, limit=None,
                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
-                caseSensitive=False):
+                caseSensitive=False, strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter one of the provided choices.
     Returns the selected choice as a string.
 
@@ -463,9 +1788,12 @@ def inputChoice(choices, prompt='_default', default=None, blank=False, timeout=N
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
     * caseSensitive (bool): If True, the user must enter a choice that matches the case of the string in choices. Defaults to False.
@@ -490,40 +1818,44 @@ def inputChoice(choices, prompt='_default', default=None, blank=False, timeout=N
     >>> response
     'dog'
     """
-
-    # Validate the arguments passed to pysv.validateChoice().
-    pysv._validateParamsFor_validateChoice(choices, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
-                   numbered=False, lettered=False, caseSensitive=caseSensitive)
-
-    validationFunc = lambda value: pysv.validateChoice(value, choices=choices, blank=blank,
-                    strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, numbered=False, lettered=False,
-                    caseSensitive=False)
-
-    if prompt == '_default':
-        prompt = 'Please select one of: %s\n' % (', '.join(choices))
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return ChoicePrompt(choices=choices, prompt=prompt, default=default, blank=blank, timeout=timeout,
+                        limit=limit, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                        applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                        caseSensitive=caseSensitive, strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                        ioBackend=ioBackend).ask()
 
 
 def inputMenu(choices, prompt='_default', default=None, blank=False, timeout=None, limit=None,
               strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
-              numbered=False, lettered=False, caseSensitive=False):
+              numbered=False, lettered=False, caseSensitive=False, strictTimeout=False, attemptTimeout=None,
+              ioBackend=None, pageSize=None):
     """Prompts the user to enter one of the provided choices.
     Also displays a small menu with bulleted, numbered, or lettered options.
     Returns the selected choice as a string.
 
+    For menus with many choices, pageSize shows only that many choices at a
+    time. The user can then enter > or < to see the next or previous page, or
+    /text to only list the choices that contain text (ignoring case), and /
+    to list all of them again. These commands don't count as tries. Any
+    choice can be selected from any page.
+
     * prompt (str): The text to display before each prompt for user input. Identical to the prompt argument for Python's raw_input() and input() functions.
     * default (str, None): A default value to use should the user time out or exceed the number of tries to enter valid input.
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
+    * numbered (bool): If True, the choices are numbered and can be selected by entering their number.
+    * lettered (bool): If True, the choices are lettered and can be selected by entering their letter.
+    * caseSensitive (bool): If True, the exact case of the choice must be entered.
+    * pageSize (int, None): If not None, the number of choices to list at a time. When prompt is not '_default', it is displayed after the list.
 
     >>> import pyinputplus as pyip
     >>> response = pyip.inputMenu(['dog', 'cat'])
@@ -567,43 +1899,31 @@ def inputMenu(choices, prompt='_default', default=None, blank=False, timeout=Non
     dog
     >>> response
     'dog'
+    >>> response = pyip.inputMenu(['SKU%05d' % (i) for i in range(10000)], numbered=True, pageSize=3)
+    Please select one of the following (page 1 of 3334):
+    1. SKU00000
+    2. SKU00001
+    3. SKU00002
+    (Enter > or < to see the next or previous page, or /text to only list the choices containing text.)
+    /9999
+    Choices containing '9999' (page 1 of 1):
+    10000. SKU09999
+    (Enter > or < to see the next or previous page, or /text to only list the choices containing text.)
+    10000
+    >>> response
+    'SKU09999'
     """
-    # Validate the arguments passed to pysv.validateChoice().
-    pysv._validateParamsFor_validateChoice(choices, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
-                   numbered=numbered, lettered=lettered, caseSensitive=caseSensitive)
-
-    validationFunc = lambda value: pysv.validateChoice(value, choices=choices, blank=blank,
-                    strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
-                    numbered=numbered, lettered=lettered, caseSensitive=caseSensitive)
-
-    if prompt == '_default':
-        prompt = 'Please select one of the following:\n'
-        if numbered:
-            prompt += '\n'.join([str(i + 1) + '. ' + choices[i] for i in range(len(choices))])
-        elif lettered:
-            prompt += '\n'.join([chr(65 + i) + '. ' + choices[i] for i in range(len(choices))])
-        else:
-            prompt += '\n'.join(['* ' + choice for choice in choices])
-        prompt += '\n'
-
-    result = _genericInput(prompt=prompt, default=default, timeout=timeout,
-                           limit=limit, applyFunc=applyFunc,
-                           validationFunc=validationFunc)
-
-    # Since `result` could be a number or letter of the option selected, we
-    # need to find the string in `choices` to return. Call pysv.validateChoice()
-    # again to get it.
-    result = pysv.validateChoice(result, choices, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
-                                 numbered=numbered, lettered=lettered,
-                                 caseSensitive=caseSensitive)
-    if postValidateApplyFunc is None:
-        return result
-    else:
-        return postValidateApplyFunc(result)
+    return MenuPrompt(choices=choices, prompt=prompt, default=default, blank=blank, timeout=timeout,
+                      limit=limit, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                      applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc, numbered=numbered,
+                      lettered=lettered, caseSensitive=caseSensitive,
+                      strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend,
+                      pageSize=pageSize).ask()
 
 
 def inputDate(prompt='', formats=None, default=None, blank=False, timeout=None, limit=None,
-             strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+             strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+              strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a date, formatted as a strptime-format in the formats list.
     Returns a datetime.date object.
 
@@ -612,9 +1932,12 @@ def inputDate(prompt='', formats=None, default=None, blank=False, timeout=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -634,21 +1957,17 @@ def inputDate(prompt='', formats=None, default=None, blank=False, timeout=None,
     >>> response
     datetime.date(2019, 10, 1)
     """
-    if formats is None:
-        formats = ('%m/%d/%Y', '%m/%d/%y', '%Y/%m/%d', '%y/%m/%d', '%x')
-
-    validationFunc = lambda value: pysv.validateDate(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, formats=formats)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return DatePrompt(prompt=prompt, formats=formats, default=default, blank=blank, timeout=timeout,
+                      limit=limit, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                      applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                      strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputDatetime(prompt='', default=None, blank=False, timeout=None, limit=None,
 				  strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
 				  formats=('%m/%d/%Y %H:%M:%S', '%m/%d/%y %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%y/%m/%d %H:%M:%S', '%x %H:%M:%S',
-                   '%m/%d/%Y %H:%M', '%m/%d/%y %H:%M', '%Y/%m/%d %H:%M', '%y/%m/%d %H:%M', '%x %H:%M',
-                   '%m/%d/%Y %H:%M:%S', '%m/%d/%y %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%y/%m/%d %H:%M:%S', '%x %H:%M:%S')):
+                   '%m/%d/%Y %H:%M', '%m/%d/%y %H:%M', '%Y/%m/%d %H:%M', '%y/%m/%d %H:%M', '%x %H:%M'),
+                  strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a datetime, formatted as a strptime-format in the formats list.
     Returns a datetime.datetime object.
 
@@ -657,9 +1976,12 @@ def inputDatetime(prompt='', default=None, blank=False, timeout=None, limit=None
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -673,16 +1995,15 @@ def inputDatetime(prompt='', default=None, blank=False, timeout=None, limit=None
     >>> response
     datetime.datetime(1900, 1, 1, 12, 1)
     """
-    validationFunc = lambda value: pysv.validateDatetime(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, formats=formats)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return DatetimePrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                          strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                          applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc, formats=formats,
+                          strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputTime(prompt='', default=None, blank=False, timeout=None, limit=None,
 			  strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
-			  formats=('%H:%M:%S', '%H:%M', '%X')):
+			  formats=('%H:%M:%S', '%H:%M', '%X'), strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a date, formatted as a strptime-format in the formats list.
     Returns a datetime.time object.
 
@@ -691,9 +2012,12 @@ def inputTime(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -711,16 +2035,15 @@ def inputTime(prompt='', default=None, blank=False, timeout=None, limit=None,
     >>> response
     datetime.time(12, 1)
     """
-
-    validationFunc = lambda value: pysv.validateTime(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, formats=formats)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return TimePrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit, strip=strip,
+                      allowRegexes=allowRegexes, blockRegexes=blockRegexes, applyFunc=applyFunc,
+                      postValidateApplyFunc=postValidateApplyFunc, formats=formats,
+                      strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputState(prompt='', default=None, blank=False, timeout=None, limit=None,
-               strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None, returnStateName=False):
+               strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None, returnStateName=False,
+               strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter United States state name or abbreviation.
     Returns the state abbreviation (uness returnStateName is True, in which case the full state name in titlecase is returned.)
 
@@ -729,9 +2052,12 @@ def inputState(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
     * returnStateName (bool): If True, the full state name is returned, i.e. 'California'. Otherwise, the abbreviation, i.e. 'CA'. Defaults to False.
@@ -750,15 +2076,16 @@ def inputState(prompt='', default=None, blank=False, timeout=None, limit=None,
     >>> response
     'California'
     """
-    validationFunc = lambda value: pysv.validateState(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, returnStateName=returnStateName)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return StatePrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                       strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                       applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                       returnStateName=returnStateName, strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                       ioBackend=ioBackend).ask()
 
 
 def inputMonth(prompt='', default=None, blank=False, timeout=None, limit=None,
-               strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+               strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+               strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a month name.
     Returns a string of the selected month name in titlecase.
 
@@ -767,9 +2094,12 @@ def inputMonth(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -787,15 +2117,15 @@ def inputMonth(prompt='', default=None, blank=False, timeout=None, limit=None,
     >>> response
     'March'
     """
-    validationFunc = lambda value: pysv.validateMonth(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return MonthPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                       strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                       applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                       strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputDayOfWeek(prompt='', default=None, blank=False, timeout=None, limit=None,
-                   strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+                   strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                   strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user for a day of the week.
     Returns the day name in titlecase.
 
@@ -804,9 +2134,12 @@ def inputDayOfWeek(prompt='', default=None, blank=False, timeout=None, limit=Non
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -820,15 +2153,15 @@ def inputDayOfWeek(prompt='', default=None, blank=False, timeout=None, limit=Non
     >>> response
     'Friday'
     """
-    validationFunc = lambda value: pysv.validateDayOfWeek(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return DayOfWeekPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                           strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                           applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                           strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputDayOfMonth(year, month, prompt='', default=None, blank=False, timeout=None, limit=None,
-                    strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+                    strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                    strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a numeric month from 1 to 28, 30, or 31
     (or 29 for leap years), depending on the given month and year.
     Returns the entered day as an integer.
@@ -840,9 +2173,12 @@ def inputDayOfMonth(year, month, prompt='', default=None, blank=False, timeout=N
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -862,15 +2198,16 @@ def inputDayOfMonth(year, month, prompt='', default=None, blank=False, timeout=N
     >>> response
     1
     """
-    validationFunc = lambda value: pysv.validateDayOfMonth(value, year, month, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return DayOfMonthPrompt(year=year, month=month, prompt=prompt, default=default, blank=blank,
+                            timeout=timeout, limit=limit, strip=strip, allowRegexes=allowRegexes,
+                            blockRegexes=blockRegexes, applyFunc=applyFunc,
+                            postValidateApplyFunc=postValidateApplyFunc,
+                            strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputIp(prompt='', default=None, blank=False, timeout=None, limit=None,
-				strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+				strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+            strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompt the user to enter an IPv4 or IPv6 address.
     Returns the entered IP address as a string.
 
@@ -879,22 +2216,25 @@ def inputIp(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
     """
-    validationFunc = lambda value: pysv.validateIp(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return IpPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit, strip=strip,
+                    allowRegexes=allowRegexes, blockRegexes=blockRegexes, applyFunc=applyFunc,
+                    postValidateApplyFunc=postValidateApplyFunc,
+                    strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputRegex(regex, flags=0, prompt='', default=None, blank=False, timeout=None, limit=None,
-			   strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+			   strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+               strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompt the user to enter a string that matches the provided regex string (or regex object) and flags.
     Returns the entered string.
 
@@ -903,22 +2243,26 @@ def inputRegex(regex, flags=0, prompt='', default=None, blank=False, timeout=Non
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
     """
-    validationFunc = lambda value: pysv.validateRegex(value, regex=regex, flags=flags, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return RegexPrompt(regex=regex, flags=flags, prompt=prompt, default=default, blank=blank,
+                       timeout=timeout, limit=limit, strip=strip, allowRegexes=allowRegexes,
+                       blockRegexes=blockRegexes, applyFunc=applyFunc,
+                       postValidateApplyFunc=postValidateApplyFunc,
+                       strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputRegexStr(prompt='', default=None, blank=False, timeout=None, limit=None,
-				      strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+				      strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                  strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompt the user to enter a regular expression string. (Only Python-style
     regex strings are accepted, not Perl- or JavaScript-style.)
     Returns the entered regular expression string.
@@ -928,23 +2272,26 @@ def inputRegexStr(prompt='', default=None, blank=False, timeout=None, limit=None
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
 
     """
-    validationFunc = lambda value: pysv.validateRegex(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return RegexStrPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                          strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                          applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                          strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputURL(prompt='', default=None, blank=False, timeout=None, limit=None,
-		     strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+		     strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+             strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a URL.
     Returns the URL as a string.
 
@@ -953,9 +2300,12 @@ def inputURL(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -975,16 +2325,16 @@ def inputURL(prompt='', default=None, blank=False, timeout=None, limit=None,
     >>> response
     'mailto:al@inventwithpython.com'
     """
-    validationFunc = lambda value: pysv.validateURL(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return URLPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit, strip=strip,
+                     allowRegexes=allowRegexes, blockRegexes=blockRegexes, applyFunc=applyFunc,
+                     postValidateApplyFunc=postValidateApplyFunc,
+                     strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputYesNo(prompt='', yesVal='yes', noVal='no', caseSensitive=False,
 			   default=None, blank=False, timeout=None, limit=None,
-			   strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+			   strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+               strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a yes/no response.
     The user can also enter y/n and use any case.
     Returns the yesVal or noVal argument (which default to 'yes' and 'no'), depending on the user's selection.
@@ -994,9 +2344,12 @@ def inputYesNo(prompt='', yesVal='yes', noVal='no', caseSensitive=False,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -1018,24 +2371,17 @@ def inputYesNo(prompt='', yesVal='yes', noVal='no', caseSensitive=False,
     >>> response
     'oui'
     """
-    validationFunc = lambda value: pysv.validateYesNo(value, yesVal=yesVal, noVal=noVal, caseSensitive=caseSensitive, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    result = _genericInput(prompt=prompt, default=default, timeout=timeout,
-                           limit=limit, applyFunc=applyFunc,
-                           validationFunc=validationFunc)
-
-    # If validation passes, return the value that pysv.validateYesNo() returned rather than necessarily what the user typed in.
-    result = pysv.validateYesNo(result, yesVal=yesVal, noVal=noVal, caseSensitive=caseSensitive, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    if postValidateApplyFunc is None:
-        return result
-    else:
-        return postValidateApplyFunc(result)
+    return YesNoPrompt(prompt=prompt, yesVal=yesVal, noVal=noVal, caseSensitive=caseSensitive,
+                       default=default, blank=blank, timeout=timeout, limit=limit, strip=strip,
+                       allowRegexes=allowRegexes, blockRegexes=blockRegexes, applyFunc=applyFunc,
+                       postValidateApplyFunc=postValidateApplyFunc,
+                       strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputBool(prompt='', trueVal='True', falseVal='False', caseSensitive=False,
                default=None, blank=False, timeout=None, limit=None,
-               strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+               strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+              strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a True/False response.
     The user can also enter t/f and in any case.
     Returns a boolean value.
@@ -1045,9 +2391,12 @@ def inputBool(prompt='', trueVal='True', falseVal='False', caseSensitive=False,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -1063,23 +2412,16 @@ def inputBool(prompt='', trueVal='True', falseVal='False', caseSensitive=False,
     >>> response
     False
     """
-    validationFunc = lambda value: pysv.validateYesNo(value, yesVal=trueVal, noVal=falseVal, caseSensitive=caseSensitive, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    result = _genericInput(prompt=prompt, default=default, timeout=timeout,
-                           limit=limit, applyFunc=applyFunc,
-                           validationFunc=validationFunc)
-
-    # If the user entered a response that is compatible with trueVal or falseVal exactly, get those particular exact strings.
-    result = pysv.validateBool(result, caseSensitive=caseSensitive, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    if postValidateApplyFunc is None:
-        return result
-    else:
-        return postValidateApplyFunc(result)
+    return BoolPrompt(prompt=prompt, trueVal=trueVal, falseVal=falseVal, caseSensitive=caseSensitive,
+                      default=default, blank=blank, timeout=timeout, limit=limit, strip=strip,
+                      allowRegexes=allowRegexes, blockRegexes=blockRegexes, applyFunc=applyFunc,
+                      postValidateApplyFunc=postValidateApplyFunc,
+                      strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputZip(prompt='', default=None, blank=False, timeout=None, limit=None,
-             strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+             strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+             strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a 3 to 5-digit US zip code.
     Returns the zipcode as a string.
 
@@ -1088,18 +2430,20 @@ def inputZip(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
     """
-    validationFunc = lambda value: pysv.validateRegex(value, regex=r'(\d){3,5}(-\d\d\d\d)?', blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, excMsg='That is not a valid zip code.')
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return ZipPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit, strip=strip,
+                     allowRegexes=allowRegexes, blockRegexes=blockRegexes, applyFunc=applyFunc,
+                     postValidateApplyFunc=postValidateApplyFunc,
+                     strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 # TODO - Finish the following
@@ -1119,7 +2463,8 @@ def inputPhone(prompt='', default=None, blank=False, timeout=None, limit=None,
 
 
 def inputFilename(prompt='', default=None, blank=False, timeout=None, limit=None,
-                  strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+                  strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                  strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a filename.
     Filenames can't contain \\ / : * ? " < > | or end with a space.
     Note that this validates filenames, not filepaths. The / and \\ characters are invalid for filenames.
@@ -1130,23 +2475,25 @@ def inputFilename(prompt='', default=None, blank=False, timeout=None, limit=None
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
     """
-    validationFunc = lambda value: pysv.validateFilename(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return FilenamePrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                          strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                          applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                          strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputFilepath(prompt='', default=None, blank=False, timeout=None, limit=None,
                   strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
-                  mustExist=False):
+                  mustExist=False, strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a filepath. If mustExist is True, then this filepath must exist on the local filesystem.
     Returns the filepath as a string.
 
@@ -1155,22 +2502,26 @@ def inputFilepath(prompt='', default=None, blank=False, timeout=None, limit=None
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
     """
-    validationFunc = lambda value: pysv.validateFilepath(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, mustExist=mustExist)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return FilepathPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                          strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                          applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                          mustExist=mustExist, strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                          ioBackend=ioBackend).ask()
 
 
 def inputEmail(prompt='', default=None, blank=False, timeout=None, limit=None,
-               strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+               strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+               strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter an email address.
     Returns the email address as a string.
 
@@ -1179,9 +2530,12 @@ def inputEmail(prompt='', default=None, blank=False, timeout=None, limit=None,
     * blank (bool): If True, a blank string will be accepted. Defaults to False.
     * timeout (int, float): The number of seconds since the first prompt for input after which a TimeoutException is raised the next time the user enters input.
     * limit (int): The number of tries the user has to enter valid input before the default value is returned.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for the user to enter input, so the TimeoutException is raised (or the default value returned) as soon as it passes. Defaults to False.
+    * attemptTimeout (int, float, None): If not None, the number of seconds the user has to enter each response. A response that isn't entered in time counts as a try towards the limit.
+    * ioBackend (IOBackend, None): The IOBackend object that displays the prompt and reads the user's input. If None, the backend set with setIOBackend() is used, which uses stdin and stdout unless changed.
     * strip (bool, str, None): If None, whitespace is stripped from value. If a str, the characters in it are stripped from value. If False, nothing is stripped.
-    * allowRegexes (Sequence, None): A sequence of regex str that will explicitly pass validation.
-    * blockRegexes (Sequence, None): A sequence of regex str or (regex_str, error_msg_str) tuples that, if matched, will explicitly fail validation.
+    * allowRegexes (Sequence, None): A sequence of regex str or compiled regex objects that will explicitly pass validation.
+    * blockRegexes (Sequence, None): A sequence of regex str, compiled regex objects, or (regex, error_msg_str) tuples that, if matched, will explicitly fail validation.
     * applyFunc (Callable, None): An optional function that is passed the user's input, and returns the new value to use as the input.
     * postValidateApplyFunc (Callable, None): An optional function that is passed the user's input after it has passed validation, and returns a transformed version for the input*() function to return.
 
@@ -1193,16 +2547,16 @@ def inputEmail(prompt='', default=None, blank=False, timeout=None, limit=None,
     >>> response
     'al@inventwithpython.com'
     """
-    validationFunc = lambda value: pysv.validateEmail(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes)
-
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc)
+    return EmailPrompt(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                       strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                       applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                       strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
 
 
 def inputPassword(prompt='', mask='*',
                   default=None, blank=False, timeout=None, limit=None,
-                  strip='', allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None):
+                  strip='', allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                  strictTimeout=False, attemptTimeout=None, ioBackend=None):
     """Prompts the user to enter a password. Mask characters will be displayed
     instead of the actual characters. If correctPassword is None, then any input
     is accepted and returned by inputPassword(). The default for strip is '' so
@@ -1220,15 +2574,2477 @@ def inputPassword(prompt='', mask='*',
     anything as the user types), or a single-character string (show this
     character instead of the keystroke). It can't be set to a multi-character
     string."""
+    return PasswordPrompt(prompt=prompt, mask=mask, default=default, blank=blank, timeout=timeout,
+                          limit=limit, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                          applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                          strictTimeout=strictTimeout, attemptTimeout=attemptTimeout, ioBackend=ioBackend).ask()
+
+
+class ValidationCache(object):
+    """A bounded, least-recently-used cache of validation results, for
+    programs that validate the same responses over and over (such as state
+    codes, months, or menu numbers typed during data entry). The cache is
+    disabled until enable() is called on the module's validationCache object.
+
+    Results are keyed on the type of prompt, the arguments that affect
+    validation, and the input after applyFunc has been applied, so applyFunc
+    and postValidateApplyFunc are still called for every response. Both valid
+    results and validation exceptions are cached.
+
+    Only prompts whose validation always gives the same result for the same
+    input use the cache. inputCustom() prompts only use it if their
+    customValidationFunc has been declared pure with declarePure(), and
+    inputFilepath() prompts with mustExist=True and inputPassword() prompts
+    never use it.
+
+    >>> import pyinputplus as pyip
+    >>> pyip.validationCache.enable(maxSize=256)
+    >>> pyip.inputState()
+    ca
+    'CA'
+    >>> pyip.inputState()
+    ca
+    'CA'
+    >>> pyip.validationCache.hits, pyip.validationCache.misses
+    (1, 1)
+    """
+
+    def __init__(self):
+        self.maxSize = 0 # The cache is disabled when maxSize is 0.
+        self.hits = 0
+        self.misses = 0
+        self._entries = {} # Ordered from least to most recently used.
+        self._pureFunctions = set()
+        self._lock = None
+
+    def enable(self, maxSize=1024):
+        """Enables the cache, keeping the results for up to maxSize of the
+        most recently validated responses."""
+        if not isinstance(maxSize, int) or maxSize < 1:
+            raise PyInputPlusException('maxSize argument must be a positive int')
+        if self._lock is None:
+            self._lock = threading.Lock()
+        with self._lock:
+            self.maxSize = maxSize
+            self._trim()
+
+    def disable(self):
+        """Disables the cache and removes its entries."""
+        self.maxSize = 0
+        self.clear()
+
+    def clear(self):
+        """Removes all the cached results and resets the hits and misses
+        counters to 0."""
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def declarePure(self, func):
+        """Declares that func, a customValidationFunc for inputCustom(),
+        always gives the same result for the same input and has no side
+        effects, so that its results can be cached. Returns func, so this can
+        be used as a decorator."""
+        if not callable(func):
+            raise PyInputPlusException('func argument must be a function')
+        self._pureFunctions.add(func)
+        return func
+
+    def isPure(self, func):
+        """Returns True if func has been declared pure with declarePure()."""
+        return func in self._pureFunctions
+
+    def _validate(self, key, validationFunc, value):
+        """Returns the cached result of validationFunc(value) for key, or
+        raises the cached validation exception. On a miss, validationFunc is
+        called and its result is cached."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries[key] = entry # Move the entry to the most recently used end.
+                self.hits += 1
+
+        if entry is None:
+            try:
+                entry = (True, validationFunc(value))
+            except Exception as exc:
+                entry = (False, exc)
+            with self._lock:
+                if self.maxSize:
+                    self._entries[key] = entry
+                    self._trim()
+
+        succeeded, result = entry
+        if succeeded:
+            return result
+        else:
+            raise result.with_traceback(None) # Don't let tracebacks pile up on the shared exception object.
+
+    def _trim(self):
+        # Removes the least recently used entries until there are at most maxSize.
+        while len(self._entries) > self.maxSize:
+            del self._entries[next(iter(self._entries))]
+
+
+validationCache = ValidationCache()
+
+
+def _freezeForCacheKey(value):
+    """Returns a hashable version of value by converting lists, tuples, sets,
+    and dicts (and their contents) to tuples and frozensets."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple([_freezeForCacheKey(item) for item in value])
+    if isinstance(value, (set, frozenset)):
+        return frozenset([_freezeForCacheKey(item) for item in value])
+    if isinstance(value, dict):
+        return frozenset([(key, _freezeForCacheKey(item)) for key, item in value.items()])
+    return value
+
+
+class _ValidationParamsKey(tuple):
+    """A tuple of a prompt's type and validation arguments, used in
+    validationCache keys. Its hash is computed once, since tuples don't cache
+    their hash and the arguments (such as a long list of menu choices) would
+    otherwise be hashed again for every response."""
+
+    def __new__(cls, items):
+        self = super(_ValidationParamsKey, cls).__new__(cls, items)
+        self._hash = tuple.__hash__(self) # Raises TypeError if an item can't be hashed.
+        return self
+
+    def __hash__(self):
+        return self._hash
+
+
+# Prompt objects
+#
+# Each input*() function is implemented by creating one of the Prompt objects
+# below and calling its ask() method once. A Prompt object checks its
+# arguments and sets up its validation when it is created, so code that asks
+# the same question many times can create the Prompt object once and call
+# ask() repeatedly, which only runs the read/validate loop.
+#
+# Prompt objects should be treated as immutable: changing their attributes
+# after they've been created bypasses the argument checks.
+
+# The names of the regex flags that can be applied to part of a regex, and
+# their letters.
+_INLINE_FLAGS = (('ASCII', 'a'), ('IGNORECASE', 'i'), ('MULTILINE', 'm'), ('DOTALL', 's'), ('VERBOSE', 'x'))
+
+# Matches the regex syntax that refers to a group by its number or name,
+# which would refer to a different group (or none) if the regex were
+# combined with others.
+_GROUP_REFERENCE_REGEX_SOURCE = r'\\[1-9]|\(\?P=|\(\?\('
+
+
+class _RegexFilter(object):
+    """The allowRegexes and blockRegexes of a prompt, compiled once. Values
+    are checked against them the same way pysv._prevalidationCheck() does,
+    but without compiling or looking up each regex for every value.
+
+    The allow regexes are combined into a single regex, so that one search
+    checks all of them. The block regexes are combined the same way, and the
+    combined regex only needs to be searched to find that a value isn't
+    blocked. Each block regex has its own response, so when the combined
+    regex matches, the block regexes are searched in order to find which
+    one's response to use. Regexes with flags or group references are
+    searched separately instead.
+
+    Use _RegexFilter.forRegexes() to get the filter for the arguments,
+    which is reused by prompts created with the same arguments.
+
+    * allowRegexes (Sequence, None): A sequence of regex strs or compiled regex objects.
+    * blockRegexes (Sequence, None): A sequence of regex strs, compiled regex objects, or (regex, response_str) tuples.
+    """
+
+    _filters = {}
+
+    @classmethod
+    def forRegexes(cls, allowRegexes, blockRegexes):
+        try:
+            key = (None if allowRegexes is None else tuple(allowRegexes),
+                   None if blockRegexes is None else tuple([item if isinstance(item, (str, re.Pattern)) else tuple(item)
+                                                            for item in blockRegexes]))
+            regexFilter = cls._filters.get(key)
+        except TypeError:
+            return cls(allowRegexes, blockRegexes) # The arguments are invalid or can't be hashed.
+        if regexFilter is None:
+            regexFilter = cls(allowRegexes, blockRegexes)
+            if len(cls._filters) >= 128:
+                cls._filters.clear()
+            cls._filters[key] = regexFilter
+        return regexFilter
+
+    def __init__(self, allowRegexes, blockRegexes):
+        if allowRegexes is None:
+            allowRegexes = []
+        if blockRegexes is None:
+            blockRegexes = []
+
+        # These checks match pysv._validateGenericParameters(), except that
+        # compiled regex objects are also accepted.
+        try:
+            len(allowRegexes)
+        except TypeError:
+            raise pysv.PySimpleValidateException('allowRegexes must be a sequence of regex_strs')
+        for regex in allowRegexes:
+            if not isinstance(regex, (str, re.Pattern)):
+                raise pysv.PySimpleValidateException('allowRegexes must be a sequence of regex_strs')
+
+        blockRegexesAndResponses = []
+        try:
+            len(blockRegexes)
+        except TypeError:
+            raise pysv.PySimpleValidateException('blockRegexes must be a sequence of (regex_str, str) tuples or regex_strs')
+        for item in blockRegexes:
+            if isinstance(item, (str, re.Pattern)):
+                blockRegexesAndResponses.append((item, pysv.DEFAULT_BLOCKLIST_RESPONSE))
+            elif (isinstance(item, (tuple, list)) and len(item) == 2 and isinstance(item[0], (str, re.Pattern))
+                  and isinstance(item[1], str)):
+                blockRegexesAndResponses.append(tuple(item))
+            else:
+                raise pysv.PySimpleValidateException('blockRegexes must be a sequence of (regex_str, str) tuples or regex_strs')
+
+        self.isEmpty = not allowRegexes and not blockRegexes
+        self.hasAllowRegexes = bool(allowRegexes)
+        self._allowRegexes = [re.compile(regex) for regex in allowRegexes]
+        self._blockRegexesAndResponses = [(re.compile(regex), response) for regex, response in blockRegexesAndResponses]
+        self._combinedAllowRegex = self._combine(self._allowRegexes)
+        self._combinedBlockRegex = self._combine([regex for regex, response in self._blockRegexesAndResponses])
+
+    @staticmethod
+    def _combine(regexes):
+        """Returns a compiled regex that matches wherever any of regexes
+        matches, or None if they can't be combined or there's only one."""
+        if len(regexes) < 2:
+            return None
+        parts = []
+        for regex in regexes:
+            if not isinstance(regex.pattern, str) or re.search(_GROUP_REFERENCE_REGEX_SOURCE, regex.pattern) is not None:
+                return None
+
+            # Each regex's flags (whether passed to re.compile() or at the
+            # start of the pattern, like (?i)) only apply to its own part.
+            flags = regex.flags & ~re.UNICODE
+            flagLetters = ''
+            for flagName, letter in _INLINE_FLAGS:
+                flag = getattr(re, flagName)
+                if flags & flag:
+                    flagLetters += letter
+                    flags &= ~flag
+            if flags:
+                return None # For example, re.LOCALE can't be applied to part of a regex.
+            pattern = re.sub(r'^\(\?[aiLmsux]+\)', '', regex.pattern)
+            if 'x' in flagLetters:
+                pattern += '\n' # End any comment at the end of a verbose regex.
+            parts.append('(?%s:%s)' % (flagLetters, pattern))
+        try:
+            return re.compile('|'.join(parts))
+        except re.error:
+            return None # For example, two of the regexes have a group with the same name.
+
+    def isAllowed(self, value):
+        """Returns True if value matches any of the allow regexes."""
+        if self._combinedAllowRegex is not None:
+            return self._combinedAllowRegex.search(value) is not None
+        for regex in self._allowRegexes:
+            if regex.search(value) is not None:
+                return True
+        return False
+
+    def blockResponse(self, value):
+        """Returns the response of the first block regex that value matches,
+        or None if it doesn't match any of them."""
+        if self._combinedBlockRegex is not None and self._combinedBlockRegex.search(value) is None:
+            return None
+        for regex, response in self._blockRegexesAndResponses:
+            if regex.search(value) is not None:
+                return response
+        return None
+
+
+# Passed as allowRegexes to a pysv validation function to make it treat the
+# value as allowed, after _RegexFilter.isAllowed() found that it is.
+_ALLOW_ANYTHING = ('^',)
+
+
+def _prevalidationCheck(value, blank, strip, regexFilter):
+    """Like pysv._prevalidationCheck(), but checks value against the compiled
+    regexes of regexFilter (a _RegexFilter object). Returns a tuple of a bool
+    of whether the caller should return the value immediately and the
+    possibly stripped value, or raises ValidationException."""
+    value = pysv._getStrippedValue(str(value), strip)
+    if value == '':
+        if not blank:
+            raise pysv.ValidationException('Blank values are not allowed.')
+        return True, value
+    if regexFilter.isEmpty:
+        return False, value
+    if regexFilter.isAllowed(value):
+        return True, value
+    response = regexFilter.blockResponse(value)
+    if response is not None:
+        raise pysv.ValidationException(response)
+    return False, value
+
+
+class Prompt(object):
+    """Base class for the reusable prompt objects. Subclasses accept the same
+    arguments as their corresponding input*() function, check them once when
+    the object is created, and can then prompt the user any number of times
+    by calling ask().
+
+    >>> import pyinputplus as pyip
+    >>> percentPrompt = pyip.NumPrompt('Percent> ', min=0, max=100, limit=3)
+    >>> percentPrompt.ask()
+    Percent> 42
+    42
+    """
+
+    # Subclasses that transform the value returned by the input loop (for
+    # example, IntPrompt converts it to an int) implement _convertResult(). For
+    # these subclasses, postValidateApplyFunc is also applied to the default
+    # value, the same as their input*() functions have always done.
+    _convertResult = None
+
+    _passwordMask = None
+
+    # Subclasses that can tell whether the (stripped) text typed so far could
+    # still become a valid response implement _isValidPrefix(), which returns
+    # False if it can't. It's used by IO backends that check the input as
+    # it's typed, such as KeystrokeIOBackend.
+    _isValidPrefix = None
+
+    # Subclasses that can complete the text typed so far (for Tab completion)
+    # implement _complete(), which returns the completed text or None.
+    _complete = None
+
+    # Whether the valid responses are kept in the history of this class's
+    # prompts (see getHistory()).
+    _keepsHistory = True
+
+    # The arguments that don't affect validation, which are left out of the
+    # validationCache keys.
+    _NOT_VALIDATION_PARAMS = frozenset(['prompt', 'default', 'timeout', 'limit', 'applyFunc', 'postValidateApplyFunc',
+                                        'strictTimeout', 'attemptTimeout', 'ioBackend'])
+    _validationParamsKey = None
+
+    def __init__(self, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.prompt = prompt
+        self.default = default
+        self.blank = blank
+        self.timeout = timeout
+        self.limit = limit
+        self.strip = strip
+        self.allowRegexes = allowRegexes
+        self.blockRegexes = blockRegexes
+        self.applyFunc = applyFunc
+        self.postValidateApplyFunc = postValidateApplyFunc
+
+        self.strictTimeout = strictTimeout
+        self.attemptTimeout = attemptTimeout
+        self.ioBackend = ioBackend
+
+        # The allowRegexes and blockRegexes arguments are checked and compiled
+        # here, so they aren't passed to pysv's functions that check arguments
+        # (which don't accept compiled regex objects).
+        self._regexFilter = _RegexFilter.forRegexes(allowRegexes, blockRegexes)
+        self._validateParams()
+        _validateGenericInputParameters(prompt=prompt, default=default, timeout=timeout, limit=limit,
+                                        applyFunc=applyFunc, validationFunc=self._validate,
+                                        postValidateApplyFunc=postValidateApplyFunc, passwordMask=self._passwordMask,
+                                        strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                        ioBackend=ioBackend)
+
+    def _validateParams(self):
+        """Raises an exception if the subclass-specific arguments are invalid.
+        Called once by __init__()."""
+        pass
+
+    def _validate(self, value):
+        """Raises an exception if value isn't valid, otherwise returns the
+        (possibly transformed) value. This is the validationFunc passed to
+        the input loop."""
+        raise NotImplementedError()
+
+    def _regexArguments(self, value):
+        """Returns a tuple of the allowRegexes and blockRegexes arguments to
+        pass to a pysv validation function for value. The value is checked
+        against this prompt's compiled regexes here, so pysv is passed at
+        most one trivial regex that gives the same result."""
+        if self._regexFilter.isEmpty:
+            return None, None
+        value = pysv._getStrippedValue(str(value), self.strip)
+        if value == '':
+            return None, None # pysv checks blank values before the regexes.
+        if self._regexFilter.isAllowed(value):
+            return _ALLOW_ANYTHING, None
+        response = self._regexFilter.blockResponse(value)
+        if response is not None:
+            return None, (('^', response),)
+        return None, None
+
+    def ask(self):
+        """Prompts the user for input and returns the validated response."""
+        return self._ask(self._inputLoopArguments())
+
+    def _ask(self, loopArguments):
+        """Runs the input loop with loopArguments (from _inputLoopArguments(),
+        possibly changed by the caller, as Form does) and returns the result."""
+        try:
+            result = self._finishResult(_consoleInputLoop(**loopArguments), loopArguments['metrics'])
+        except _FormRecordEntered:
+            raise # Not an outcome of this prompt: the Form that asked it got a whole record instead.
+        except Exception as exc:
+            if loopArguments['metrics'] is not None:
+                loopArguments['metrics']._finish(exc)
+            loopArguments['ioBackend'].promptFinished(None, exc)
+            raise
+        if loopArguments['metrics'] is not None:
+            loopArguments['metrics']._finish(None)
+        loopArguments['ioBackend'].promptFinished(result, None)
+        return result
 
-    if mask is not None and len(mask) > 1:
-        raise PyInputPlusException("mask argument must be None, '', or a single-character string.")
+    def _inputLoopArguments(self):
+        """Returns a dict of the keyword arguments to pass to the input loop.
+        If this object's ioBackend is None, the global IO backend is used.
+        If a metrics callback is set, this includes a new PromptMetrics
+        object. If an AnswerStore is set, the history (and possibly the
+        default) comes from it."""
+        default, history = self.default, None
+        if self._keepsHistory:
+            answerStore = _answerStore # Read once, in case another thread sets a different store.
+            if answerStore is None:
+                history = _historyFor(type(self))
+            else:
+                key = self._answerStoreKey()
+                history = _StoredHistory(answerStore, key)
+                if default is None and answerStore.defaults:
+                    default = answerStore.lastAnswer(key)
+        return dict(prompt=self.prompt, default=default, timeout=self.timeout, limit=self.limit,
+                    applyFunc=self.applyFunc, validationFunc=self._validationFunc(),
+                    postValidateApplyFunc=self.postValidateApplyFunc if self._convertResult is None else None,
+                    passwordMask=self._passwordMask, strictTimeout=self.strictTimeout,
+                    attemptTimeout=self.attemptTimeout,
+                    ioBackend=_ioBackend if self.ioBackend is None else self.ioBackend, commandFunc=None,
+                    prefixFunc=self._prefixFunc(), completeFunc=self._complete, history=history,
+                    metrics=None if _metricsCallback is None else PromptMetrics(type(self).__name__))
+
+    def _answerStoreKey(self):
+        """Returns the key that this prompt's answers are kept under in an
+        AnswerStore."""
+        return '%s:%s' % (type(self).__name__, self.prompt if isinstance(self.prompt, str) else '')
+
+    def _prefixFunc(self):
+        """Returns the prefixFunc to pass to the input loop, or None if this
+        prompt can't check partial responses. Prompts with an applyFunc or
+        allowRegexes can't, since those can turn any text into a valid
+        response."""
+        if self._isValidPrefix is None or self.applyFunc is not None or self._regexFilter.hasAllowRegexes:
+            return None
+        return self._checkPrefix
+
+    def _checkPrefix(self, text):
+        text = pysv._getStrippedValue(text, self.strip)
+        if text == '':
+            return True # Blank responses are checked once Enter is pressed.
+        return self._isValidPrefix(text)
+
+    def _finishResult(self, result, metrics=None):
+        """Returns the final result for ask() given the result of the input
+        loop."""
+        if self._convertResult is None:
+            return result # postValidateApplyFunc was already applied by the input loop.
+
+        result = self._convertResult(result)
+        if self.postValidateApplyFunc is None:
+            return result
+        elif metrics is None and _validationBudget is None:
+            return self.postValidateApplyFunc(result)
+        else:
+            stageStartTime = time.perf_counter()
+            result = self.postValidateApplyFunc(result)
+            _stageFinished('postValidateApplyFunc', self.postValidateApplyFunc, stageStartTime, metrics)
+            return result
+
+    def validate(self, value):
+        """Runs value through the same steps that ask() runs on the user's
+        input (applyFunc, validation, and postValidateApplyFunc) without
+        prompting the user. Returns the result, or raises the validation
+        exception if value is invalid."""
+        if self.applyFunc is not None:
+            value = self.applyFunc(value)
+
+        possibleNewValue = self._validationFunc()(value)
+        if possibleNewValue is not None:
+            value = possibleNewValue
+
+        if self._convertResult is not None:
+            value = self._convertResult(value)
+
+        if self.postValidateApplyFunc is not None:
+            value = self.postValidateApplyFunc(value)
+        return value
+
+    def _validationFunc(self):
+        """Returns _validate(), or a version of it that uses validationCache if
+        the cache is enabled and this prompt's validation is pure."""
+        if validationCache.maxSize and self._isPure():
+            return self._validateWithCache
+        return self._validate
+
+    def _isPure(self):
+        """Returns True if _validate() always gives the same result for the
+        same value, so that its results can be cached."""
+        return True
+
+    def _validateWithCache(self, value):
+        if self._validationParamsKey is None:
+            cls = type(self)
+            paramNames = cls.__dict__.get('_validationParamNames')
+            if paramNames is None:
+                # Every object of a class sets its attributes in the same order.
+                paramNames = cls._validationParamNames = tuple([name for name in vars(self)
+                                                                if not name.startswith('_') and name not in self._NOT_VALIDATION_PARAMS])
+            try:
+                self._validationParamsKey = _ValidationParamsKey(
+                    [cls] + [_freezeForCacheKey(getattr(self, name)) for name in paramNames])
+            except TypeError:
+                self._validationParamsKey = False # The arguments can't be hashed, so this prompt isn't cached.
+        if self._validationParamsKey is False:
+            return self._validate(value)
+
+        key = (self._validationParamsKey, value)
+        try:
+            hash(key)
+        except TypeError:
+            return self._validate(value) # A value that can't be hashed (returned by applyFunc) isn't cached.
+        return validationCache._validate(key, self._validate, value)
+
+
+class StrPrompt(Prompt):
+    """A reusable prompt for inputStr(). See inputStr() for a description of
+    the arguments."""
+
+    def _validateParams(self):
+        pysv._validateGenericParameters(self.blank, self.strip, None, None)
+
+    def _validate(self, value):
+        return _prevalidationCheck(value, blank=self.blank, strip=self.strip, regexFilter=self._regexFilter)[1]
+
+
+class CustomPrompt(StrPrompt):
+    """A reusable prompt for inputCustom(). See inputCustom() for a description
+    of the arguments."""
+
+    def __init__(self, customValidationFunc, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.customValidationFunc = customValidationFunc
+        super(CustomPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                           strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                           applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                           strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                           ioBackend=ioBackend)
+
+    def _validate(self, value):
+        # Our validationFunc must also call _prevalidationCheck()
+        value = super(CustomPrompt, self)._validate(value)
+        return self.customValidationFunc(value)
+
+    def _isPure(self):
+        return validationCache.isPure(self.customValidationFunc)
+
+
+class NumPrompt(Prompt):
+    """A reusable prompt for inputNum(). See inputNum() for a description of
+    the arguments."""
+
+    _numType = 'num'
+
+    def __init__(self, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 min=None, max=None, greaterThan=None, lessThan=None, strictTimeout=False, attemptTimeout=None,
+                 ioBackend=None):
+        self.min = min
+        self.max = max
+        self.greaterThan = greaterThan
+        self.lessThan = lessThan
+        super(NumPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                        strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                        applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                        strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                        ioBackend=ioBackend)
+
+    def _validateParams(self):
+        pysv._validateParamsFor_validateNum(min=self.min, max=self.max, lessThan=self.lessThan, greaterThan=self.greaterThan)
+
+    def _validate(self, value):
+        # This does the same checks as pysv.validateNum() (with the same
+        # messages), except that IntPrompt parses integers exactly.
+        returnNow, value = _prevalidationCheck(value, self.blank, self.strip, self._regexFilter)
+        if returnNow:
+            # Blank and allowed values are returned as numbers if they are numbers.
+            try:
+                return float(value) if self._numType == 'float' or self._numType == 'num' and '.' in value else int(value)
+            except ValueError:
+                return value
+
+        number = self._parseNumber(value)
+        self._checkRange(number)
+        return number
+
+    def _parseNumber(self, value):
+        """Returns value, a stripped string, as a number, or raises
+        ValidationException if it isn't one."""
+        try:
+            if self._numType == 'float' or '.' in value:
+                return float(value)
+            return int(value)
+        except ValueError:
+            raise pysv.ValidationException('%r is not %s.' % (pysv._errstr(value), 'a float' if self._numType == 'float' else 'a number'))
+
+    def _checkRange(self, number):
+        """Raises ValidationException if number is outside of the min, max,
+        lessThan, and greaterThan arguments."""
+        if self.min is not None and number < self.min:
+            raise pysv.ValidationException('Number must be at minimum %s.' % (self.min))
+        if self.max is not None and number > self.max:
+            raise pysv.ValidationException('Number must be at maximum %s.' % (self.max))
+        if self.lessThan is not None and number >= self.lessThan:
+            raise pysv.ValidationException('Number must be less than %s.' % (self.lessThan))
+        if self.greaterThan is not None and number <= self.greaterThan:
+            raise pysv.ValidationException('Number must be greater than %s.' % (self.greaterThan))
+
+    def _isValidPrefix(self, text):
+        text = text.strip() # int() and float() ignore surrounding whitespace.
+        if self._numType == 'float':
+            word = text[1:] if text[:1] in ('+', '-') else text
+            if word and 'NAN'.startswith(word.upper()):
+                return True # NaN isn't outside of any range.
+            if word and 'INFINITY'.startswith(word.upper()):
+                return self._signCanBeInRange(text)
+        if text.endswith('_'):
+            # An underscore can separate digits, so it must come after one.
+            if not text[-2:-1].isdigit():
+                return False
+            text = text[:-1]
+        return _numberPrefixRegex('num' if self._numType == 'num' else 'float').match(text) is not None and self._signCanBeInRange(text)
+
+    def _signCanBeInRange(self, text):
+        """Returns False if every number that starts with text is outside of
+        the min, max, lessThan, and greaterThan arguments because of its
+        sign."""
+        if text.startswith('-'):
+            return not (self.min is not None and self.min > 0 or self.greaterThan is not None and self.greaterThan >= 0)
+        return not (self.max is not None and self.max < 0 or self.lessThan is not None and self.lessThan <= 0)
+
+    def validateArray(self, values, useNumpy=None):
+        """Validates many strings at once, such as a column of imported data,
+        the same way that ask() validates the user's input. Returns a tuple
+        of an array of the numbers and an array of bools that are True where
+        the value is invalid (and the number is 0).
+
+        * values (Iterable): The strings to validate.
+        * useNumpy (bool, None): If True, NumPy arrays are returned. If False, an array.array (or a list, if an int is too large for one) and a list of bools are returned. If None, NumPy is used if it is installed.
+
+        With NumPy, plain decimal numbers (such as '-42' or '2.5') are parsed
+        and checked against min, max, lessThan, and greaterThan a whole array
+        at a time, and other values (such as '1e3' or blank values) are
+        validated one at a time. If the prompt has allowRegexes,
+        blockRegexes, or a strip argument, every value is validated one at a
+        time.
+
+        The numbers are int64 for IntPrompt (or Python ints, if one doesn't
+        fit), float64 for FloatPrompt, and for NumPrompt, int64 if every
+        valid value is an int, otherwise float64. Values that are valid but
+        aren't numbers (blank values if blank is True, or values allowed by
+        allowRegexes) are marked invalid, since they can't go in the array.
+        applyFunc and postValidateApplyFunc aren't called.
+
+        >>> import pyinputplus as pyip
+        >>> numbers, invalid = pyip.IntPrompt(min=0).validateArray(['42', '-1', '9007199254740993', 'cat'])
+        >>> numbers.tolist()
+        [42, 0, 9007199254740993, 0]
+        >>> invalid
+        array([False,  True, False,  True])
+        """
+        numpy = _importNumpy(useNumpy)
+        values = list(values)
+        if numpy is not None and self.strip is None and self._regexFilter.isEmpty:
+            result = self._validateArrayWithNumpy(numpy, values)
+            if result is not None:
+                return result
+
+        numbers = []
+        invalid = []
+        for value in values:
+            try:
+                number = self._validate(value)
+            except pysv.ValidationException:
+                number = None
+            isNumber = isinstance(number, (int, float)) and not isinstance(number, bool)
+            numbers.append(number if isNumber else 0)
+            invalid.append(not isNumber)
+
+        floats = self._numType == 'float' or self._numType == 'num' and any(isinstance(number, float) for number in numbers)
+        if numpy is not None:
+            try:
+                return numpy.array(numbers, dtype=numpy.float64 if floats else numpy.int64), numpy.array(invalid, dtype=bool)
+            except OverflowError:
+                return numpy.array(numbers, dtype=object), numpy.array(invalid, dtype=bool)
+        try:
+            return array.array('d' if floats else 'q', numbers), invalid
+        except OverflowError:
+            return numbers, invalid
+
+    def _validateArrayWithNumpy(self, numpy, values):
+        """Parses and range checks the plain decimal numbers in values (such
+        as '-42' or '2.5') as whole NumPy arrays, and validates the other
+        values (such as '1e3' or blank values) one at a time. Returns None if
+        NumPy can't parse a value or an int doesn't fit in int64."""
+        strings = numpy.char.strip(numpy.array([str(value) for value in values], dtype=str))
+        unsigned = numpy.char.lstrip(strings, '+-')
+        digits = unsigned if self._numType == 'int' else numpy.char.replace(unsigned, '.', '', 1)
+        isPlain = numpy.char.isdecimal(digits) & (numpy.char.str_len(strings) - numpy.char.str_len(unsigned) <= 1)
+        hasPeriod = numpy.char.find(strings, '.') != -1
+
+        otherNumbers = {} # Maps the indexes of the other values to their numbers, or None if invalid.
+        for i in numpy.flatnonzero(~isPlain):
+            try:
+                number = self._validate(values[i])
+            except pysv.ValidationException:
+                number = None
+            otherNumbers[i] = number if isinstance(number, (int, float)) and not isinstance(number, bool) else None
+
+        floats = self._numType == 'float' or self._numType == 'num' and bool(
+            (isPlain & hasPeriod).any() or any(isinstance(number, float) for number in otherNumbers.values()))
+        numbers = numpy.zeros(len(strings), dtype=numpy.float64 if floats else numpy.int64)
+        try:
+            if self._numType == 'float':
+                numbers[isPlain] = strings[isPlain].astype(numpy.float64)
+            else:
+                # Like pysv.validateNum(), 'num' values with a period are floats.
+                numbers[isPlain & hasPeriod] = strings[isPlain & hasPeriod].astype(numpy.float64)
+                numbers[isPlain & ~hasPeriod] = strings[isPlain & ~hasPeriod].astype(numpy.int64) # Parsed like int(), so exactly.
+            for i, number in otherNumbers.items():
+                if number is not None:
+                    numbers[i] = number
+        except (ValueError, OverflowError):
+            return None
+
+        outOfRange = numpy.zeros(len(numbers), dtype=bool)
+        if self.min is not None:
+            outOfRange |= numbers < self.min
+        if self.max is not None:
+            outOfRange |= numbers > self.max
+        if self.lessThan is not None:
+            outOfRange |= numbers >= self.lessThan
+        if self.greaterThan is not None:
+            outOfRange |= numbers <= self.greaterThan
+        invalid = outOfRange & isPlain # The other values were already range checked.
+        for i, number in otherNumbers.items():
+            invalid[i] = number is None
+        numbers[invalid] = 0
+        return numbers, invalid
+
+
+# The regexes that match the beginnings of the numbers that NumPrompt ('num')
+# and IntPrompt and FloatPrompt ('float') parse (except for infinity and NaN),
+# with no underscore at the end. NumPrompt parses numbers with a '.' with
+# float() and other numbers with int(), and IntPrompt also accepts numbers
+# such as '42.0' and '1e3'. Compiled when first needed.
+_NUMBER_PREFIX_REGEX_SOURCES = {
+    'num': r'[+-]?(?:D(?:\.(?:D)?(?:[eE][+-]?(?:D)?)?)?|\.(?:D(?:[eE][+-]?(?:D)?)?)?)?\Z',
+    'float': r'[+-]?(?:(?:D(?:\.(?:D)?)?|\.D)(?:[eE][+-]?(?:D)?)?|\.)?\Z',
+}
+_numberPrefixRegexes = {}
+
+
+def _numberPrefixRegex(numType):
+    regex = _numberPrefixRegexes.get(numType)
+    if regex is None:
+        # D is a run of digits, which can have single underscores between them.
+        regex = _numberPrefixRegexes[numType] = re.compile(_NUMBER_PREFIX_REGEX_SOURCES[numType].replace('D', r'\d(?:_?\d)*'))
+    return regex
+
+
+def _importNumpy(useNumpy):
+    """Returns the numpy module, or None if useNumpy is False or if useNumpy
+    is None and NumPy isn't installed."""
+    if useNumpy is False:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if useNumpy:
+            raise PyInputPlusException('useNumpy argument is True, but NumPy is not installed')
+        return None
+    return numpy
+
+
+class IntPrompt(NumPrompt):
+    """A reusable prompt for inputInt(). See inputInt() for a description of
+    the arguments."""
+
+    _numType = 'int'
+
+    def __init__(self, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 min=None, max=None, lessThan=None, greaterThan=None, strictTimeout=False, attemptTimeout=None,
+                 ioBackend=None):
+        super(IntPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                        strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                        applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                        min=min, max=max, lessThan=lessThan, greaterThan=greaterThan,
+                                        strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                        ioBackend=ioBackend)
+
+    def _parseNumber(self, value):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+
+        # Values such as '42.0' and '1e3' are also integers. Decimal parses
+        # them exactly, unlike float(). Like float(), it rejects values
+        # above about 1e308.
+        try:
+            number = decimal.Decimal(value)
+        except decimal.InvalidOperation:
+            number = None
+        if number is not None and number.is_finite() and number.adjusted() <= 308 and number == number.to_integral_value():
+            return int(number)
+        raise pysv.ValidationException('%r is not an integer.' % (pysv._errstr(value)))
+
+    def _convertResult(self, result):
+        if isinstance(result, int):
+            return result # The validated value is already an exact int.
+        try:
+            return int(result)
+        except ValueError:
+            pass
+        try:
+            return int(float(result))
+        except (ValueError, OverflowError):
+            # In case the input loop returned the default value or an allowlist value, return that as is instead.
+            return result
+
+
+class FloatPrompt(NumPrompt):
+    """A reusable prompt for inputFloat(). See inputFloat() for a description
+    of the arguments."""
+
+    _numType = 'float'
+
+    def __init__(self, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 min=None, max=None, lessThan=None, greaterThan=None, strictTimeout=False, attemptTimeout=None,
+                 ioBackend=None):
+        super(FloatPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                          strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                          applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                          min=min, max=max, lessThan=lessThan, greaterThan=greaterThan,
+                                          strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                          ioBackend=ioBackend)
+
+    def _convertResult(self, result):
+        try:
+            return float(result)
+        except ValueError:
+            # In case the input loop returned the default value or an allowlist value, return that as is instead.
+            return result
+
+
+class _ChoiceIndex(object):
+    """Looks up a response in a list of choices the same way that
+    pysv.validateChoice() does, using dicts built once instead of scanning the
+    choices for every response.
+
+    * choices (Sequence): The choices, which have already been checked by pysv._validateParamsFor_validateChoice().
+    * numbered (bool): If True, '1', '2', etc. select the choices in order.
+    * lettered (bool): If True, 'A', 'B', etc. (in either case) select the choices in order.
+    * caseSensitive (bool): If False, a choice can be entered in any case.
+    """
+
+    def __init__(self, choices, numbered, lettered, caseSensitive):
+        self._numChoices = len(choices)
+        self._choices = list(choices)
+        self._exact = dict((choice, choice) for choice in choices)
+        self._numbered = numbered
+        self._lettered = lettered
+        if caseSensitive:
+            self._upper = None
+        else:
+            self._upper = dict((choice.upper(), choice) for choice in choices)
+        self._sortedChoices = None # The sorted choices and upper case choices, for isPrefix() and complete().
+
+    def __contains__(self, value):
+        """Returns True if value is exactly one of the choices."""
+        return value in self._exact
+
+    def lookup(self, value):
+        """Returns the choice that value selects, or None if it doesn't select
+        any of them."""
+        choice = self._exact.get(value)
+        if choice is not None:
+            return choice
+        if self._numbered and value.isdigit() and 0 < int(value) <= self._numChoices:
+            return self._choices[int(value) - 1] # The numbers start at 1, not 0.
+        if self._lettered and len(value) == 1 and value.isalpha() and 0 < ord(value.upper()) - 64 <= self._numChoices:
+            return self._choices[ord(value.upper()) - 65] # The letters are always case-insensitive.
+        if self._upper is not None:
+            return self._upper.get(value.upper())
+        return None
+
+    def _getSortedChoices(self):
+        if self._sortedChoices is None:
+            self._sortedChoices = (sorted(self._exact), None if self._upper is None else sorted(self._upper))
+        return self._sortedChoices
+
+    def isPrefix(self, value):
+        """Returns True if value is the beginning of a response that selects
+        a choice."""
+        sortedChoices, sortedUpperChoices = self._getSortedChoices()
+        if self._startsAnyOf(sortedChoices, value):
+            return True
+        if self._numbered and value.isdigit():
+            try:
+                return int(value) <= self._numChoices # A leading 0 can be followed by more digits.
+            except ValueError:
+                pass # value has digits that int() doesn't accept, such as superscripts.
+        if self._lettered and len(value) == 1 and value.isalpha() and 0 < ord(value.upper()) - 64 <= self._numChoices:
+            return True
+        return sortedUpperChoices is not None and self._startsAnyOf(sortedUpperChoices, value.upper())
+
+    @staticmethod
+    def _startsAnyOf(sortedStrings, prefix):
+        i = bisect.bisect_left(sortedStrings, prefix)
+        return i < len(sortedStrings) and sortedStrings[i].startswith(prefix)
+
+    def complete(self, value):
+        """Returns value completed with the characters that every choice that
+        starts with it has next, or None if no choice starts with it. If the
+        choices are case-insensitive, the characters added have the case of
+        the first of those choices in sorted order."""
+        sortedChoices, sortedUpperChoices = self._getSortedChoices()
+        if sortedUpperChoices is None:
+            return _completeFromSorted(sortedChoices, value)
+        completedUpper = _completeFromSorted(sortedUpperChoices, value.upper())
+        if completedUpper is None:
+            return None
+        choice = self._upper[sortedUpperChoices[bisect.bisect_left(sortedUpperChoices, completedUpper)]]
+        if len(choice) != len(choice.upper()):
+            return value # Changing the case changed the length (as it does for 'ß'), so the characters don't line up.
+        return value + choice[len(value):len(completedUpper)]
+
+
+def _completeFromSorted(sortedStrings, prefix):
+    """Returns the longest string that every string in the sorted list
+    sortedStrings that starts with prefix also starts with, or None if none
+    of them start with prefix. Only the range of strings that start with
+    prefix is looked at, which is found by bisecting the list."""
+    start = bisect.bisect_left(sortedStrings, prefix)
+    if start == len(sortedStrings) or not sortedStrings[start].startswith(prefix):
+        return None
+    end = bisect.bisect_right(sortedStrings, prefix + '\U0010ffff', start)
+    # The common prefix of the first and last strings of a sorted range is
+    # the common prefix of every string in it.
+    return os.path.commonprefix([sortedStrings[start], sortedStrings[end - 1]])
+
+
+def _validateChoiceWithIndex(value, choiceIndex, blank, strip, regexFilter):
+    """Like pysv.validateChoice(), but looks up value in choiceIndex (a
+    _ChoiceIndex object) instead of checking its arguments and scanning the
+    choices each time it's called."""
+    if '' in choiceIndex:
+        blank = True # Otherwise, '' wouldn't be accepted as a choice.
+
+    returnNow, value = _prevalidationCheck(value, blank, strip, regexFilter)
+    if returnNow:
+        return value
+
+    choice = choiceIndex.lookup(value)
+    if choice is None:
+        raise pysv.ValidationException('%r is not a valid choice.' % (pysv._errstr(value)))
+    return choice
+
+
+class ChoicePrompt(Prompt):
+    """A reusable prompt for inputChoice(). See inputChoice() for a
+    description of the arguments."""
+
+    def __init__(self, choices, prompt='_default', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 caseSensitive=False, strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.choices = choices
+        self.caseSensitive = caseSensitive
+
+        # Validate the arguments passed to pysv.validateChoice().
+        pysv._validateParamsFor_validateChoice(choices, blank=blank, strip=strip, allowRegexes=None, blockRegexes=None,
+                       numbered=False, lettered=False, caseSensitive=caseSensitive)
+        # inputChoice() has always matched choices case-insensitively, whatever caseSensitive is.
+        self._choiceIndex = _ChoiceIndex(choices, numbered=False, lettered=False, caseSensitive=False)
+
+        if prompt == '_default':
+            prompt = 'Please select one of: %s\n' % (', '.join(choices))
+
+        super(ChoicePrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                           strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                           applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                           strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                           ioBackend=ioBackend)
+
+    def _validate(self, value):
+        return _validateChoiceWithIndex(value, self._choiceIndex, blank=self.blank, strip=self.strip,
+                                        regexFilter=self._regexFilter)
+
+    def _isValidPrefix(self, text):
+        return self._choiceIndex.isPrefix(text)
+
+    def _complete(self, text):
+        return self._choiceIndex.complete(text)
+
+
+class MenuPrompt(Prompt):
+    """A reusable prompt for inputMenu(). See inputMenu() for a description of
+    the arguments. When pageSize is used, the rendered pages and filter
+    results are cached on the object and reused by later calls to ask()."""
+
+    def __init__(self, choices, prompt='_default', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 numbered=False, lettered=False, caseSensitive=False, strictTimeout=False, attemptTimeout=None,
+                 ioBackend=None, pageSize=None):
+        self.choices = choices
+        self.numbered = numbered
+        self.lettered = lettered
+        self.caseSensitive = caseSensitive
+        self.pageSize = pageSize
+
+        # Validate the arguments passed to pysv.validateChoice().
+        pysv._validateParamsFor_validateChoice(choices, blank=blank, strip=strip, allowRegexes=None, blockRegexes=None,
+                       numbered=numbered, lettered=lettered, caseSensitive=caseSensitive)
+        self._choiceIndex = _ChoiceIndex(choices, numbered=numbered, lettered=lettered, caseSensitive=caseSensitive)
+
+        if pageSize is not None:
+            if not isinstance(pageSize, int) or isinstance(pageSize, bool) or pageSize < 1:
+                raise PyInputPlusException('pageSize argument must be a positive int or None')
+            if prompt == '_default':
+                prompt = '' # The pages have their own heading.
+            self._upperChoices = [choice.upper() for choice in choices]
+            self._trigramIndex = None # Built the first time the choices are filtered.
+            self._filterResults = {}
+            self._renderedPages = {}
+        elif prompt == '_default':
+            prompt = 'Please select one of the following:\n'
+            if numbered:
+                prompt += '\n'.join([str(i + 1) + '. ' + choices[i] for i in range(len(choices))])
+            elif lettered:
+                prompt += '\n'.join([chr(65 + i) + '. ' + choices[i] for i in range(len(choices))])
+            else:
+                prompt += '\n'.join(['* ' + choice for choice in choices])
+            prompt += '\n'
+
+        super(MenuPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                         strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                         applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                         strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                         ioBackend=ioBackend)
+
+    def _validate(self, value):
+        return _validateChoiceWithIndex(value, self._choiceIndex, blank=self.blank, strip=self.strip,
+                                        regexFilter=self._regexFilter)
+
+    def _isValidPrefix(self, text):
+        return self._choiceIndex.isPrefix(text)
+
+    def _complete(self, text):
+        return self._choiceIndex.complete(text)
+
+    def _convertResult(self, result):
+        # _validate() already turned a number or letter the user entered into
+        # the choice it selects, so a valid response is returned as is. Other
+        # results, such as the default value, are validated to find the
+        # choice they select.
+        if result in self._choiceIndex:
+            return result
+        return self._validate(result)
+
+    def _inputLoopArguments(self):
+        loopArguments = super(MenuPrompt, self)._inputLoopArguments()
+        if self.pageSize is not None:
+            pager = _MenuPager(self)
+            loopArguments['prompt'] = pager.render
+            loopArguments['commandFunc'] = pager.handleCommand
+            loopArguments['prefixFunc'] = None # The commands aren't choices.
+        return loopArguments
+
+    def _choiceLabel(self, i):
+        """Returns how the choice at index i is listed in the menu."""
+        if self.numbered:
+            return '%s. %s' % (i + 1, self.choices[i])
+        elif self.lettered:
+            return '%s. %s' % (chr(65 + i), self.choices[i])
+        else:
+            return '* ' + self.choices[i]
+
+    def _matchingChoices(self, filterText):
+        """Returns a list of the indexes of the choices that contain
+        filterText, ignoring case."""
+        if filterText == '':
+            return range(len(self.choices))
+
+        filterText = filterText.upper()
+        matches = self._filterResults.get(filterText)
+        if matches is not None:
+            return matches
+
+        # The user usually types more of the same filter text, so narrow down
+        # the matches for the longest previously-used prefix of it if there
+        # is one, otherwise use the trigram index to find the candidates.
+        candidates = None
+        for prefixLen in range(len(filterText) - 1, 0, -1):
+            candidates = self._filterResults.get(filterText[:prefixLen])
+            if candidates is not None:
+                break
+        if candidates is None:
+            candidates = self._trigramCandidates(filterText)
+
+        upperChoices = self._upperChoices
+        matches = [i for i in candidates if filterText in upperChoices[i]]
+        if len(self._filterResults) >= 256:
+            self._filterResults.clear()
+        self._filterResults[filterText] = matches
+        return matches
+
+    def _trigramCandidates(self, filterText):
+        """Returns the indexes of the choices that could contain filterText,
+        which is upper case: the choices containing its rarest three-character
+        substring, or all the choices if filterText is shorter than that."""
+        if len(filterText) < 3:
+            return range(len(self.choices))
+
+        if self._trigramIndex is None:
+            self._trigramIndex = {}
+            for i, choice in enumerate(self._upperChoices):
+                for trigram in set([choice[j:j + 3] for j in range(len(choice) - 2)]):
+                    self._trigramIndex.setdefault(trigram, []).append(i)
+
+        rarest = None
+        for j in range(len(filterText) - 2):
+            indexes = self._trigramIndex.get(filterText[j:j + 3], [])
+            if rarest is None or len(indexes) < len(rarest):
+                rarest = indexes
+        return rarest
+
+    def _numPages(self, filterText):
+        return max(1, -(-len(self._matchingChoices(filterText)) // self.pageSize)) # Round up.
+
+    def _renderPage(self, filterText, page):
+        """Returns the prompt text listing the given page (starting at 0) of
+        the choices that contain filterText. The text is cached, so going
+        back to a page doesn't build it again."""
+        key = (filterText, page)
+        pageText = self._renderedPages.get(key)
+        if pageText is not None:
+            return pageText
+
+        matches = self._matchingChoices(filterText)
+        if filterText == '':
+            heading = 'Please select one of the following'
+        elif matches:
+            heading = 'Choices containing %r' % (filterText)
+        else:
+            heading = 'No choices contain %r.' % (filterText)
+
+        lines = []
+        if matches:
+            lines.append('%s (page %s of %s):' % (heading, page + 1, self._numPages(filterText)))
+            start = page * self.pageSize
+            lines.extend([self._choiceLabel(i) for i in matches[start:start + self.pageSize]])
+        else:
+            lines.append(heading)
+        lines.append('(Enter > or < to see the next or previous page, or /text to only list the choices containing text.)')
+        pageText = '\n'.join(lines) + '\n' + self.prompt
+
+        if len(self._renderedPages) >= 256:
+            self._renderedPages.clear()
+        self._renderedPages[key] = pageText
+        return pageText
+
+
+class _MenuPager(object):
+    """The page and filter text of a paged MenuPrompt while ask() runs."""
+
+    def __init__(self, menuPrompt):
+        self._menuPrompt = menuPrompt
+        self._page = 0
+        self._filterText = ''
+
+    def render(self):
+        return self._menuPrompt._renderPage(self._filterText, self._page)
+
+    def handleCommand(self, response):
+        """Changes the page or filter text and returns True if response is a
+        paging command, otherwise returns False. A response that is one of
+        the choices is never a command."""
+        command = response.strip()
+        if command in self._menuPrompt._choiceIndex:
+            return False
+
+        if command == '>':
+            self._page = min(self._page + 1, self._menuPrompt._numPages(self._filterText) - 1)
+        elif command == '<':
+            self._page = max(self._page - 1, 0)
+        elif command.startswith('/'):
+            self._filterText = command[1:].strip()
+            self._page = 0
+        else:
+            return False
+        return True
+
+
+# The regexes that the _strptime module uses for the strptime directives that
+# _DatetimeParser converts without calling strptime().
+_DATETIME_DIRECTIVE_REGEXES = {
+    'd': r'3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9]',
+    'H': r'2[0-3]|[0-1]\d|\d',
+    'm': r'1[0-2]|0[1-9]|[1-9]',
+    'M': r'[0-5]\d|\d',
+    'S': r'6[0-1]|[0-5]\d|\d',
+    'y': r'\d\d',
+    'Y': r'\d\d\d\d',
+}
+
+
+class _DatetimeParser(object):
+    """Parses a string that is in one of several strptime formats. The result
+    is the same as calling datetime.datetime.strptime() with each format in
+    turn until one of them succeeds, but most formats are compiled once into
+    regexes instead of having strptime() fail for each one that doesn't match.
+
+    Formats that only use the %d, %H, %m, %M, %S, %y, and %Y directives are
+    compiled. A single regex that combines them checks the shape of the value
+    first, so a value that isn't in any of them is rejected in one pass. Other
+    formats (such as %x, which depends on the current locale) are passed to
+    strptime() in their place in the order.
+
+    Use _DatetimeParser.forFormats() to get the parser for a sequence of
+    formats, which is only created the first time it's needed. Like
+    _RegexFilter's, the cache is cleared once it has 128 parsers.
+
+    * formats (Sequence): The strptime format strings. Duplicate formats are ignored.
+    """
+
+    _parsers = {}
+
+    @classmethod
+    def forFormats(cls, formats):
+        formats = tuple(formats)
+        parser = cls._parsers.get(formats)
+        if parser is None:
+            parser = cls(formats)
+            if len(cls._parsers) >= 128:
+                cls._parsers.clear()
+            cls._parsers[formats] = parser
+        return parser
+
+    def __init__(self, formats):
+        self.formats = []
+        for format in formats:
+            if format not in self.formats:
+                self.formats.append(format)
+
+        self._steps = [] # (format, compiled regex or None for strptime()) tuples.
+        shapeRegexes = []
+        for format in self.formats:
+            regex = self._formatToRegex(format, '(?P<%s>%s)')
+            if regex is None:
+                self._steps.append((format, None))
+            else:
+                self._steps.append((format, re.compile(regex, re.IGNORECASE)))
+                shapeRegexes.append(self._formatToRegex(format, '(?:%s)'))
+        if shapeRegexes:
+            self._shapeRegex = re.compile(r'(?:%s)\Z' % ('|'.join(shapeRegexes)), re.IGNORECASE)
+        else:
+            self._shapeRegex = None
+
+    @staticmethod
+    def _formatToRegex(format, groupTemplate):
+        """Returns the regex that strptime() would match format against, with
+        each directive's regex put in groupTemplate, or None if format uses a
+        directive that isn't compiled."""
+        regexParts = []
+        directives = set()
+        i = 0
+        while i < len(format):
+            if format[i] == '%':
+                directive = format[i + 1:i + 2]
+                if directive == '%':
+                    regexParts.append('%')
+                elif directive in _DATETIME_DIRECTIVE_REGEXES and directive not in directives:
+                    directives.add(directive)
+                    if groupTemplate.count('%s') == 2:
+                        regexParts.append(groupTemplate % (directive, _DATETIME_DIRECTIVE_REGEXES[directive]))
+                    else:
+                        regexParts.append(groupTemplate % (_DATETIME_DIRECTIVE_REGEXES[directive]))
+                else:
+                    return None
+                i += 2
+            elif format[i].isspace():
+                # Like strptime(), any run of whitespace matches any run of whitespace.
+                while i < len(format) and format[i].isspace():
+                    i += 1
+                regexParts.append(r'\s+')
+            else:
+                regexParts.append(re.escape(format[i]))
+                i += 1
+        if 'y' in directives and 'Y' in directives:
+            return None
+        return ''.join(regexParts)
+
+    def parse(self, value):
+        """Returns a datetime.datetime object of value, or raises ValueError if
+        value isn't in any of the formats."""
+        hasShape = self._shapeRegex is not None and self._shapeRegex.match(value) is not None
+        for format, regex in self._steps:
+            if regex is None:
+                try:
+                    return datetime.datetime.strptime(value, format)
+                except ValueError:
+                    continue
+            elif hasShape:
+                # Like strptime(), only the first way the regex matches is used.
+                match = regex.match(value)
+                if match is None or match.end() != len(value):
+                    continue
+                try:
+                    return self._matchToDatetime(match.groupdict())
+                except ValueError:
+                    continue # For example, the 31st of a month with 30 days.
+        raise ValueError('%r is not in any of the formats' % (value))
+
+    @staticmethod
+    def _matchToDatetime(fields):
+        """Returns the datetime.datetime object that strptime() would return
+        for a match with the directive values in fields."""
+        if 'Y' in fields:
+            year = int(fields['Y'])
+        elif 'y' in fields:
+            year = int(fields['y'])
+            year += 2000 if year <= 68 else 1900 # The same cutoff as strptime() uses.
+        else:
+            year = 1900
+        return datetime.datetime(year, int(fields.get('m', 1)), int(fields.get('d', 1)),
+                                 int(fields.get('H', 0)), int(fields.get('M', 0)), int(fields.get('S', 0)))
+
+
+class _DatetimeFormatPrompt(Prompt):
+    """Base class for DatePrompt, DatetimePrompt, and TimePrompt. Instead of
+    calling pysv.validateDate() and similar functions, which try each format
+    with strptime() every time, the formats are compiled into a
+    _DatetimeParser when the prompt is created."""
+
+    _invalidMessage = None # Set by the subclasses.
+
+    def _validateParams(self):
+        pysv._validateParamsFor__validateToDateTimeFormat(self.formats, blank=self.blank, strip=self.strip,
+                                                           allowRegexes=None, blockRegexes=None)
+        self._datetimeParser = _DatetimeParser.forFormats(self.formats)
+
+    def _validate(self, value):
+        try:
+            returnNow, strippedValue = _prevalidationCheck(value, self.blank, self.strip, self._regexFilter)
+            if returnNow:
+                return strippedValue
+            return self._fromDatetime(self._datetimeParser.parse(strippedValue))
+        except (pysv.ValidationException, ValueError):
+            raise pysv.ValidationException(self._invalidMessage % (pysv._errstr(value)))
+
+    def _fromDatetime(self, dt):
+        """Returns the value to return for the parsed datetime.datetime object
+        dt."""
+        return dt
+
+
+class DatePrompt(_DatetimeFormatPrompt):
+    """A reusable prompt for inputDate(). See inputDate() for a description of
+    the arguments."""
+
+    _invalidMessage = '%r is not a valid date.'
+
+    def __init__(self, prompt='', formats=None, default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        if formats is None:
+            formats = ('%m/%d/%Y', '%m/%d/%y', '%Y/%m/%d', '%y/%m/%d', '%x')
+        self.formats = formats
+        super(DatePrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                         strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                         applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                         strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                         ioBackend=ioBackend)
+
+    def _fromDatetime(self, dt):
+        return datetime.date(dt.year, dt.month, dt.day)
+
+
+class DatetimePrompt(_DatetimeFormatPrompt):
+    """A reusable prompt for inputDatetime(). See inputDatetime() for a
+    description of the arguments."""
+
+    _invalidMessage = '%r is not a valid date and time.'
+
+    def __init__(self, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 formats=('%m/%d/%Y %H:%M:%S', '%m/%d/%y %H:%M:%S', '%Y/%m/%d %H:%M:%S', '%y/%m/%d %H:%M:%S', '%x %H:%M:%S',
+                          '%m/%d/%Y %H:%M', '%m/%d/%y %H:%M', '%Y/%m/%d %H:%M', '%y/%m/%d %H:%M', '%x %H:%M'),
+                 strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.formats = formats
+        super(DatetimePrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                             strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                             applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                             strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                             ioBackend=ioBackend)
+
+
+class TimePrompt(_DatetimeFormatPrompt):
+    """A reusable prompt for inputTime(). See inputTime() for a description of
+    the arguments."""
+
+    _invalidMessage = '%r is not a valid time.'
+
+    def __init__(self, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 formats=('%H:%M:%S', '%H:%M', '%X'), strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.formats = formats
+        super(TimePrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                         strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                         applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                         strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                         ioBackend=ioBackend)
+
+    def _fromDatetime(self, dt):
+        return datetime.time(dt.hour, dt.minute, dt.second, dt.microsecond)
+
+
+class StatePrompt(Prompt):
+    """A reusable prompt for inputState(). See inputState() for a description
+    of the arguments."""
+
+    def __init__(self, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 returnStateName=False, strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.returnStateName = returnStateName
+        super(StatePrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                          strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                          applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                          strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                          ioBackend=ioBackend)
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        # Newer versions of PySimpleValidate (such as 0.2.12) call it validateUSState().
+        validateState = getattr(pysv, 'validateState', None) or pysv.validateUSState
+        return validateState(value, blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                             blockRegexes=blockRegexes, returnStateName=self.returnStateName)
+
+
+class MonthPrompt(Prompt):
+    """A reusable prompt for inputMonth(). See inputMonth() for a description
+    of the arguments."""
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateMonth(value, blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                                  blockRegexes=blockRegexes)
+
+
+class DayOfWeekPrompt(Prompt):
+    """A reusable prompt for inputDayOfWeek(). See inputDayOfWeek() for a
+    description of the arguments."""
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateDayOfWeek(value, blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                                      blockRegexes=blockRegexes)
+
+
+class DayOfMonthPrompt(Prompt):
+    """A reusable prompt for inputDayOfMonth(). See inputDayOfMonth() for a
+    description of the arguments."""
+
+    def __init__(self, year, month, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.year = year
+        self.month = month
+        super(DayOfMonthPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                               strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                               applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                               strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                               ioBackend=ioBackend)
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateDayOfMonth(value, self.year, self.month, blank=self.blank, strip=self.strip,
+                                       allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+
+
+class IpPrompt(Prompt):
+    """A reusable prompt for inputIp(). See inputIp() for a description of the
+    arguments."""
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateIP(value, blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                               blockRegexes=blockRegexes)
+
+
+class RegexPrompt(Prompt):
+    """A reusable prompt for inputRegex(). See inputRegex() for a description
+    of the arguments."""
+
+    def __init__(self, regex, flags=0, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.regex = regex
+        self.flags = flags
+        super(RegexPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                          strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                          applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                          strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                          ioBackend=ioBackend)
+
+    def _validateParams(self):
+        # Compile the regex once instead of every time a response is validated.
+        if isinstance(self.regex, str):
+            self._compiledRegex = re.compile(self.regex, self.flags)
+        elif isinstance(self.regex, re.Pattern):
+            self._compiledRegex = self.regex
+        else:
+            raise pysv.PySimpleValidateException('regex must be a str or regex object')
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateRegex(value, regex=self._compiledRegex, blank=self.blank, strip=self.strip,
+                                  allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+
+
+class RegexStrPrompt(Prompt):
+    """A reusable prompt for inputRegexStr(). See inputRegexStr() for a
+    description of the arguments."""
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        # pysv.validateRegexStr() returns a compiled regex object, but
+        # inputRegexStr() returns the regex string itself.
+        regexObj = pysv.validateRegexStr(value, blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                                         blockRegexes=blockRegexes)
+        return getattr(regexObj, 'pattern', regexObj)
+
+
+class URLPrompt(Prompt):
+    """A reusable prompt for inputURL(). See inputURL() for a description of
+    the arguments."""
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateURL(value, blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                                blockRegexes=blockRegexes)
+
+
+class YesNoPrompt(Prompt):
+    """A reusable prompt for inputYesNo(). See inputYesNo() for a description
+    of the arguments."""
+
+    def __init__(self, prompt='', yesVal='yes', noVal='no', caseSensitive=False,
+                 default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.yesVal = yesVal
+        self.noVal = noVal
+        self.caseSensitive = caseSensitive
+        super(YesNoPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                          strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                          applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                          strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                          ioBackend=ioBackend)
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateYesNo(value, yesVal=self.yesVal, noVal=self.noVal, caseSensitive=self.caseSensitive,
+                                  blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                                  blockRegexes=blockRegexes)
+
+    def _isValidPrefix(self, text):
+        return _isYesNoPrefix(text, self.yesVal, self.noVal, self.caseSensitive)
+
+    def _convertResult(self, result):
+        # If validation passes, return the value that pysv.validateYesNo() returned rather than necessarily what the user typed in.
+        return self._validate(result)
+
+
+def _isYesNoPrefix(value, yesVal, noVal, caseSensitive):
+    """Returns True if value is the beginning of a response that
+    pysv.validateYesNo() accepts for yesVal and noVal."""
+    yesVal = str(yesVal)
+    noVal = str(noVal)
+    if not caseSensitive:
+        value, yesVal, noVal = value.upper(), yesVal.upper(), noVal.upper()
+    return yesVal.startswith(value) or noVal.startswith(value)
+
+
+class BoolPrompt(Prompt):
+    """A reusable prompt for inputBool(). See inputBool() for a description of
+    the arguments."""
+
+    def __init__(self, prompt='', trueVal='True', falseVal='False', caseSensitive=False,
+                 default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.trueVal = trueVal
+        self.falseVal = falseVal
+        self.caseSensitive = caseSensitive
+        super(BoolPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                         strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                         applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                         strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                         ioBackend=ioBackend)
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateYesNo(value, yesVal=self.trueVal, noVal=self.falseVal, caseSensitive=self.caseSensitive,
+                                  blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                                  blockRegexes=blockRegexes)
+
+    def _isValidPrefix(self, text):
+        return _isYesNoPrefix(text, self.trueVal, self.falseVal, self.caseSensitive)
+
+    def _convertResult(self, result):
+        # If the user entered a response that is compatible with trueVal or falseVal exactly, get those particular exact strings.
+        allowRegexes, blockRegexes = self._regexArguments(result)
+        return pysv.validateBool(result, caseSensitive=self.caseSensitive, blank=self.blank, strip=self.strip,
+                                 allowRegexes=allowRegexes, blockRegexes=blockRegexes)
+
+
+class ZipPrompt(Prompt):
+    """A reusable prompt for inputZip(). See inputZip() for a description of
+    the arguments."""
+
+    _zipRegex = None # Compiled the first time a ZipPrompt is created.
+
+    def _validateParams(self):
+        if ZipPrompt._zipRegex is None:
+            ZipPrompt._zipRegex = re.compile(r'(\d){3,5}(-\d\d\d\d)?')
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateRegex(value, regex=self._zipRegex, blank=self.blank, strip=self.strip,
+                                  allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                  excMsg='That is not a valid zip code.')
+
+
+class FilenamePrompt(Prompt):
+    """A reusable prompt for inputFilename(). See inputFilename() for a
+    description of the arguments."""
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateFilename(value, blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                                     blockRegexes=blockRegexes)
+
+
+class FilepathPrompt(Prompt):
+    """A reusable prompt for inputFilepath(). See inputFilepath() for a
+    description of the arguments."""
+
+    def __init__(self, prompt='', default=None, blank=False, timeout=None, limit=None,
+                 strip=None, allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 mustExist=False, strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        self.mustExist = mustExist
+        super(FilepathPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                             strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                             applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                             strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                             ioBackend=ioBackend)
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateFilepath(value, blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                                     blockRegexes=blockRegexes, mustExist=self.mustExist)
+
+    def _isPure(self):
+        return not self.mustExist # Whether the file exists can change between responses.
+
+    def _complete(self, text):
+        directory, partialName = os.path.split(text)
+        completedName = _completeFromSorted(_listDirectory(os.path.expanduser(directory) or os.curdir), partialName)
+        if completedName is None:
+            return None
+        return text[:len(text) - len(partialName)] + completedName
+
+
+# Maps each directory path to a tuple of its modification time and the sorted
+# names in it, for completing file paths. The oldest listing is discarded
+# once there are _DIRECTORY_LISTINGS_SIZE of them.
+_directoryListings = {}
+_DIRECTORY_LISTINGS_SIZE = 64
+
+
+def _listDirectory(directory):
+    """Returns the sorted names of the files and folders in directory, with
+    os.sep after the names of folders, or [] if it can't be read. A listing
+    is reused until the directory's modification time changes, which happens
+    when a file is added to it, removed, or renamed."""
+    try:
+        modifiedTime = os.stat(directory).st_mtime_ns
+    except (OSError, ValueError):
+        return []
+    listing = _directoryListings.get(directory)
+    if listing is not None and listing[0] == modifiedTime:
+        return listing[1]
+
+    names = []
+    try:
+        with os.scandir(directory) as dirEntries:
+            for dirEntry in dirEntries:
+                try:
+                    isDir = dirEntry.is_dir()
+                except OSError:
+                    isDir = False
+                names.append(dirEntry.name + os.sep if isDir else dirEntry.name)
+    except OSError:
+        return []
+    names.sort()
+
+    _directoryListings.pop(directory, None)
+    if len(_directoryListings) >= _DIRECTORY_LISTINGS_SIZE:
+        del _directoryListings[next(iter(_directoryListings))] # dicts keep their insertion order, so this is the oldest.
+    _directoryListings[directory] = (modifiedTime, names)
+    return names
+
+
+class EmailPrompt(Prompt):
+    """A reusable prompt for inputEmail(). See inputEmail() for a description
+    of the arguments."""
+
+    def _validate(self, value):
+        allowRegexes, blockRegexes = self._regexArguments(value)
+        return pysv.validateEmail(value, blank=self.blank, strip=self.strip, allowRegexes=allowRegexes,
+                                  blockRegexes=blockRegexes)
+
+
+class PasswordPrompt(StrPrompt):
+    """A reusable prompt for inputPassword(). See inputPassword() for a
+    description of the arguments."""
+
+    def __init__(self, prompt='', mask='*',
+                 default=None, blank=False, timeout=None, limit=None,
+                 strip='', allowRegexes=None, blockRegexes=None, applyFunc=None, postValidateApplyFunc=None,
+                 strictTimeout=False, attemptTimeout=None, ioBackend=None):
+        if mask is not None and len(mask) > 1:
+            raise PyInputPlusException("mask argument must be None, '', or a single-character string.")
+        self._passwordMask = mask
+        super(PasswordPrompt, self).__init__(prompt=prompt, default=default, blank=blank, timeout=timeout, limit=limit,
+                                             strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes,
+                                             applyFunc=applyFunc, postValidateApplyFunc=postValidateApplyFunc,
+                                             strictTimeout=strictTimeout, attemptTimeout=attemptTimeout,
+                                             ioBackend=ioBackend)
+
+    def _isPure(self):
+        return False # Don't keep passwords in the cache.
+
+    _keepsHistory = False # Or in the history.
+
+
+# Maps the name of each input*() function to the Prompt class that implements it.
+_PROMPT_CLASSES = {
+    'inputStr': StrPrompt, 'inputCustom': CustomPrompt, 'inputNum': NumPrompt, 'inputInt': IntPrompt,
+    'inputFloat': FloatPrompt, 'inputChoice': ChoicePrompt, 'inputMenu': MenuPrompt, 'inputDate': DatePrompt,
+    'inputDatetime': DatetimePrompt, 'inputTime': TimePrompt, 'inputState': StatePrompt, 'inputMonth': MonthPrompt,
+    'inputDayOfWeek': DayOfWeekPrompt, 'inputDayOfMonth': DayOfMonthPrompt, 'inputIp': IpPrompt,
+    'inputRegex': RegexPrompt, 'inputRegexStr': RegexStrPrompt, 'inputURL': URLPrompt, 'inputYesNo': YesNoPrompt,
+    'inputBool': BoolPrompt, 'inputZip': ZipPrompt, 'inputFilename': FilenamePrompt,
+    'inputFilepath': FilepathPrompt, 'inputEmail': EmailPrompt, 'inputPassword': PasswordPrompt,
+}
+
+
+def _getPromptObject(kind, params):
+    """Returns a Prompt object for kind, which can be a Prompt object, a
+    Prompt subclass, an input*() function, or the name of an input*()
+    function. params are the keyword arguments used to create the Prompt
+    object. Raises PyInputPlusException if kind isn't one of these."""
+    if isinstance(kind, Prompt):
+        if params:
+            raise PyInputPlusException('keyword arguments cannot be given along with a Prompt object')
+        return kind
+
+    return _getPromptClass(kind)(**params)
+
+
+def _getPromptClass(kind):
+    """Returns the Prompt subclass for kind, which can be a Prompt subclass, an
+    input*() function, or the name of an input*() function. Raises
+    PyInputPlusException if kind isn't one of these."""
+    if isinstance(kind, type) and issubclass(kind, Prompt):
+        return kind
+
+    if callable(kind):
+        kind = getattr(kind, '__name__', None)
+    if kind not in _PROMPT_CLASSES:
+        raise PyInputPlusException('kind argument must be a Prompt object, a Prompt subclass, an input*() function, or the name of an input*() function')
+    return _PROMPT_CLASSES[kind]
+
+
+def validateMany(kind, values, **params):
+    """Validates each string in values the same way the input*() function
+    given by kind would validate the user's input, without reading from stdin
+    or writing to stdout. Returns an iterator of (value, result) tuples, where
+    result is either the value that the input*() function would return, or
+    the exception raised because value is invalid. The values are validated
+    lazily, one at a time, so values can be a generator of any length.
+
+    * kind: An input*() function (such as inputDate), its name (such as 'inputDate'), a Prompt subclass, or a Prompt object.
+    * values (Iterable): The strings to validate.
+    * params: The keyword arguments to pass to the input*() function, such as formats, choices, strip, allowRegexes, blockRegexes, or postValidateApplyFunc. (Arguments such as prompt, timeout, and limit are accepted but have no effect.) Not allowed if kind is a Prompt object.
+
+    The arguments are checked once, when validateMany() is called.
+
+    >>> import pyinputplus as pyip
+    >>> list(pyip.validateMany(pyip.inputMenu, ['2', 'CAT', 'moose'], choices=['dog', 'cat'], numbered=True))
+    [('2', 'cat'), ('CAT', 'cat'), ('moose', ValidationException("'moose' is not a valid choice."))]
+    """
+    return _validateManyGenerator(_getPromptObject(kind, params), values)
+
+
+def _validateManyGenerator(promptObj, values):
+    # This is a separate generator function so that validateMany() can check
+    # its arguments when it is called instead of when iteration begins.
+    for value in values:
+        try:
+            yield value, promptObj.validate(value)
+        except Exception as exc:
+            yield value, exc
+
+
+class _History(object):
+    """The last _HISTORY_SIZE valid responses to one kind of prompt, oldest
+    first. A response that is entered again moves to the end instead of
+    being kept twice."""
+
+    def __init__(self):
+        self._responses = collections.deque(maxlen=_HISTORY_SIZE)
+        self._lock = _thread.allocate_lock()
 
-    pysv._validateGenericParameters(blank, strip, allowRegexes, blockRegexes)
+    def add(self, response):
+        if response == '':
+            return
+        with self._lock:
+            if self._responses and self._responses[-1] == response:
+                return # The most common case: the same answer as last time.
+            try:
+                self._responses.remove(response)
+            except ValueError:
+                pass
+            self._responses.append(response)
 
-    validationFunc = lambda value: pysv._prevalidationCheck(value, blank=blank, strip=strip, allowRegexes=allowRegexes, blockRegexes=blockRegexes, excMsg=None)[1]
+    def entries(self):
+        with self._lock:
+            return list(self._responses)
 
-    return _genericInput(prompt=prompt, default=default, timeout=timeout,
-                         limit=limit, applyFunc=applyFunc,
-                         postValidateApplyFunc=postValidateApplyFunc, validationFunc=validationFunc,
-                         passwordMask=mask)
+
+_HISTORY_SIZE = 100
+_histories = {} # Maps each Prompt subclass to the _History of its prompts.
+
+
+def _historyFor(promptClass):
+    history = _histories.get(promptClass)
+    if history is None:
+        history = _histories.setdefault(promptClass, _History())
+    return history
+
+
+def getHistory(kind):
+    """Returns a list of the last 100 valid responses to the prompts of the
+    input*() function given by kind, oldest first, which KeystrokeIOBackend
+    lets the user recall with the up arrow key. Responses to inputPassword()
+    aren't kept.
+
+    * kind: An input*() function (such as inputInt), its name, or a Prompt subclass.
+
+    >>> import pyinputplus as pyip
+    >>> pyip.inputInt(ioBackend=pyip.ScriptedIOBackend(['42']))
+    42
+    >>> pyip.getHistory(pyip.inputInt)
+    ['42']
+    """
+    return _historyFor(_getPromptClass(kind)).entries()
+
+
+def clearHistory():
+    """Forgets the responses kept for every input*() function's history."""
+    _histories.clear()
+
+
+class AnswerStore(object):
+    """Remembers the last valid answers to each prompt in a file, so that a
+    program that asks the same questions every time it runs can offer the
+    previous answers. Once set with setAnswerStore(), prompts use the
+    answers stored for them as their history (which KeystrokeIOBackend lets
+    the user recall with the up arrow key) instead of keeping it in memory,
+    and if defaults is True, a prompt without a default argument uses its
+    last stored answer as its default.
+
+    Each prompt's answers are stored under a key made from the name of its
+    Prompt class and its prompt text, such as 'StrPrompt:Operator name> ', so
+    the same prompt gets the same answers every time the program runs.
+    Answers to inputPassword() are never stored.
+
+    The file has a JSON object of a key and an answer on each line. It isn't
+    read until a prompt first needs its answers, so creating the store
+    doesn't slow down the program's startup. New answers are appended to it
+    batchSize at a time (and when the program exits or flush() or close()
+    is called), with one write and one fsync for each batch. Once most of
+    the file's lines are answers that are no longer kept, it's rewritten
+    with only the kept answers. The store is meant to be used by one process
+    at a time.
+
+    * path (str): The file to keep the answers in. It's created if it doesn't exist.
+    * maxAnswers (int): The number of answers to keep for each prompt.
+    * batchSize (int): The number of new answers to hold before writing them to the file.
+    * defaults (bool): If True, prompts without a default use their last stored answer as the default.
+
+    >>> import pyinputplus as pyip
+    >>> pyip.setAnswerStore(pyip.AnswerStore('answers.jsonl', defaults=True))
+    >>> pyip.inputStr('Operator name> ', timeout=10)
+    Operator name> Al
+    'Al'
+
+    If the program runs again and the prompt times out, 'Al' is returned.
+    """
+
+    def __init__(self, path, maxAnswers=10, batchSize=20, defaults=False):
+        if not isinstance(maxAnswers, int) or isinstance(maxAnswers, bool) or maxAnswers < 1:
+            raise PyInputPlusException('maxAnswers argument must be a positive int')
+        if not isinstance(batchSize, int) or isinstance(batchSize, bool) or batchSize < 1:
+            raise PyInputPlusException('batchSize argument must be a positive int')
+        self.path = path
+        self.maxAnswers = maxAnswers
+        self.batchSize = batchSize
+        self.defaults = bool(defaults)
+        self._answers = None # Maps each key to a list of its answers, oldest first. None until the file is read.
+        self._fileLines = 0 # The number of answers in the file, including ones that are no longer kept.
+        self._endsMidLine = False # True if the file's last line was cut short, so it has no newline.
+        self._pending = [] # The (key, answer) tuples not yet written to the file.
+        self._exitHandlerRegistered = False
+        self._lock = threading.RLock()
+
+    def getAnswers(self, key):
+        """Returns a list of the answers stored for key, oldest first."""
+        with self._lock:
+            return list(self._getAnswersDict().get(key, ()))
+
+    def lastAnswer(self, key):
+        """Returns the last answer stored for key, or None if there isn't one."""
+        with self._lock:
+            answers = self._getAnswersDict().get(key)
+            return answers[-1] if answers else None
+
+    def add(self, key, answer):
+        """Stores answer as the last answer for key. An answer that was
+        already stored for key moves to the end instead of being kept twice.
+        The answer is written to the file with the next batch."""
+        if answer == '':
+            return
+        with self._lock:
+            answers = self._getAnswersDict().setdefault(key, [])
+            if answers and answers[-1] == answer:
+                return # The same answer as last time, so nothing changes.
+            if answer in answers:
+                answers.remove(answer)
+            answers.append(answer)
+            del answers[:-self.maxAnswers]
+
+            self._pending.append((key, answer))
+            if not self._exitHandlerRegistered:
+                atexit.register(self.flush)
+                self._exitHandlerRegistered = True
+            if len(self._pending) >= self.batchSize:
+                self.flush()
+
+    def flush(self):
+        """Writes the answers that haven't been written yet to the file."""
+        with self._lock:
+            if not self._pending:
+                return
+            if self._fileLines + len(self._pending) > max(2 * sum(map(len, self._answers.values())), 100):
+                self.compact() # Most of the file would be old answers, so rewrite it instead.
+                return
+            lines = ''.join([self._encode(key, answer) for key, answer in self._pending])
+            if self._endsMidLine:
+                lines = '\n' + lines # Keep the first new answer off of the damaged line.
+                self._endsMidLine = False
+            with io.open(self.path, 'a', encoding='utf-8') as storeFile:
+                storeFile.write(lines)
+                storeFile.flush()
+                os.fsync(storeFile.fileno())
+            self._fileLines += len(self._pending)
+            self._pending = []
+
+    def compact(self):
+        """Rewrites the file with only the answers that are kept, including
+        the ones that haven't been written yet."""
+        with self._lock:
+            answers = self._getAnswersDict()
+            lines = [self._encode(key, answer) for key in answers for answer in answers[key]]
+            tempPath = self.path + '.tmp'
+            with io.open(tempPath, 'w', encoding='utf-8') as storeFile:
+                storeFile.write(''.join(lines))
+                storeFile.flush()
+                os.fsync(storeFile.fileno())
+            os.replace(tempPath, self.path)
+            self._endsMidLine = False
+            self._fileLines = len(lines)
+            self._pending = []
+
+    def close(self):
+        """Writes the answers that haven't been written yet. The store can
+        still be used afterwards."""
+        self.flush()
+
+    def _getAnswersDict(self):
+        """Returns the dict of answers, reading the file the first time it's
+        needed. Lines that can't be read (such as a line cut short when the
+        program was killed while writing it) are skipped."""
+        if self._answers is None:
+            answers = {}
+            fileLines = 0
+            try:
+                with io.open(self.path, encoding='utf-8') as storeFile:
+                    for line in storeFile:
+                        fileLines += 1
+                        self._endsMidLine = not line.endswith('\n')
+                        try:
+                            entry = json.loads(line)
+                            key, answer = entry['key'], entry['answer']
+                        except (ValueError, TypeError, KeyError):
+                            continue
+                        keyAnswers = answers.setdefault(key, [])
+                        if answer in keyAnswers:
+                            keyAnswers.remove(answer)
+                        keyAnswers.append(answer)
+                        del keyAnswers[:-self.maxAnswers]
+            except (IOError, OSError):
+                pass # There's no file yet, so there are no answers.
+            self._answers = answers
+            self._fileLines = fileLines
+        return self._answers
+
+    @staticmethod
+    def _encode(key, answer):
+        return json.dumps({'key': key, 'answer': answer}) + '\n'
+
+
+class _StoredHistory(object):
+    """The history of one prompt, kept in an AnswerStore under key. It has
+    the same methods as _History."""
+
+    def __init__(self, answerStore, key):
+        self._answerStore = answerStore
+        self._key = key
+
+    def add(self, response):
+        self._answerStore.add(self._key, response)
+
+    def entries(self):
+        return self._answerStore.getAnswers(self._key)
+
+
+_answerStore = None # The AnswerStore set by setAnswerStore(), or None.
+
+
+def setAnswerStore(answerStore):
+    """Sets the AnswerStore that prompts keep their answers in and get their
+    history (and, if the store's defaults is True, their default) from. If
+    answerStore is None (the default), answers aren't stored, and each
+    kind of prompt keeps its history in memory. The store that was set
+    before, if any, has its answers written to its file.
+
+    >>> import pyinputplus as pyip
+    >>> pyip.setAnswerStore(pyip.AnswerStore('answers.jsonl'))
+    """
+    global _answerStore
+    if not (isinstance(answerStore, AnswerStore) or answerStore is None):
+        raise PyInputPlusException('answerStore argument must be an AnswerStore object or None')
+    if _answerStore is not None and _answerStore is not answerStore:
+        _answerStore.flush()
+    _answerStore = answerStore
+
+
+def getAnswerStore():
+    """Returns the AnswerStore set by setAnswerStore(), or None."""
+    return _answerStore
+
+
+class _FormRecordEntered(Exception):
+    """Raised by a Form's command function to stop asking a field's prompt
+    once the user has entered a whole record instead of answering it."""
+    pass
+
+
+class Form(object):
+    """Asks for several fields one after another, each validated by its own
+    Prompt, and returns their results as a FormRecord namedtuple. The fields
+    share one timeout and one budget of retries. If acceptRecords is True,
+    the user can enter the whole record on one line instead of answering the
+    first field, either as comma-separated values in field order or as
+    name=value pairs. Comma-separated values are only a record if every one
+    of them is valid, so that a first field's answer can have commas in it.
+    Any fields that name=value pairs leave out or give invalid values are
+    then asked for one at a time.
+
+    * fields (Sequence): (name, kind) or (name, kind, params) tuples, where name is a valid namedtuple field name, and kind and params are the same as the arguments of validateMany(), such as ('age', pyip.inputInt, {'min': 0}). The prompt text comes from params.
+    * timeout (int, float, None): The number of seconds since the first prompt for the user to fill in every field. Each field's own timeout still applies.
+    * retries (int, None): The total number of retries (invalid or unanswered responses after a field's first one) the user gets across all fields. Each field's own limit still applies.
+    * strictTimeout (bool): If True, the timeout is enforced while waiting for each response, the same as the input*() functions.
+    * ioBackend (IOBackend, None): The IOBackend for every field, or None for the one set with setIOBackend().
+    * acceptRecords (bool): If True, the user can enter a whole record instead of answering the first field.
+
+    When the timeout passes or the retries run out, the field being asked
+    returns its default, or raises TimeoutException or RetryLimitException.
+    The fields and arguments are checked once, when the Form is created.
+    Password fields are never filled in from a record. The fields are asked
+    in one consoleSession(), so other threads' prompts wait until the form
+    is finished (and the timeout counts the time spent waiting for them).
+
+    >>> import pyinputplus as pyip
+    >>> form = pyip.Form([('name', 'inputStr', {'prompt': 'Name: '}),
+    ...                   ('age', 'inputInt', {'prompt': 'Age: ', 'min': 0})], retries=3, acceptRecords=True)
+    >>> form.ask()
+    Name: Al, 42
+    FormRecord(name='Al', age=42)
+    >>> form.ask()
+    Name: name=Al, age=forty
+    age: 'forty' is not an integer.
+    Age: 42
+    FormRecord(name='Al', age=42)
+    >>> form.parseRecord('age=42, name=Al')
+    FormRecord(name='Al', age=42)
+    """
+
+    def __init__(self, fields, timeout=None, retries=None, strictTimeout=False, ioBackend=None, acceptRecords=False):
+        if not isinstance(timeout, (int, float, type(None))):
+            raise PyInputPlusException('timeout argument must be an int or float')
+        if not (retries is None or isinstance(retries, int) and retries >= 0):
+            raise PyInputPlusException('retries argument must be None or an int of 0 or more')
+        if not isinstance(strictTimeout, bool):
+            raise PyInputPlusException('strictTimeout argument must be a bool')
+        if not isinstance(ioBackend, (IOBackend, type(None))):
+            raise PyInputPlusException('ioBackend argument must be an IOBackend object or None')
+        if not isinstance(acceptRecords, bool):
+            raise PyInputPlusException('acceptRecords argument must be a bool')
+
+        self.fields = []
+        for field in fields:
+            if not isinstance(field, (tuple, list)) or len(field) not in (2, 3):
+                raise PyInputPlusException('fields argument must be a sequence of (name, kind) or (name, kind, params) tuples')
+            self.fields.append((field[0], _getPromptObject(field[1], field[2] if len(field) == 3 else {})))
+        if not self.fields:
+            raise PyInputPlusException('fields argument must have at least one field')
+
+        try:
+            self.recordType = collections.namedtuple('FormRecord', [name for name, promptObj in self.fields])
+        except (TypeError, ValueError) as exc:
+            raise PyInputPlusException('invalid field name: %s' % (exc))
+
+        self.timeout = timeout
+        self.retries = retries
+        self.strictTimeout = strictTimeout
+        self.ioBackend = ioBackend
+        self.acceptRecords = acceptRecords
+        # Comma-separated records fill in these fields, in order.
+        self._recordFieldNames = [name for name, promptObj in self.fields if promptObj._passwordMask is None]
+
+    def ask(self):
+        """Asks for each field and returns a FormRecord of their results."""
+        ioBackend = _ioBackend if self.ioBackend is None else self.ioBackend
+        startTime = time.time()
+        # The fields are asked in one console session, so other threads'
+        # prompts can't come between them.
+        with consoleSession(ioBackend, self.timeout):
+            return self._askFields(ioBackend, startTime)
+
+    def _askFields(self, ioBackend, startTime):
+        retriesLeft = self.retries
+        values = {}
+        acceptRecord = self.acceptRecords and len(self._recordFieldNames) > 1
+
+        for name, promptObj in self.fields:
+            while name not in values:
+                loopArguments = promptObj._inputLoopArguments()
+                loopArguments['ioBackend'] = ioBackend
+                if self.timeout is not None:
+                    timeLeft = max(startTime + self.timeout - time.time(), 0)
+                    loopArguments['timeout'] = timeLeft if promptObj.timeout is None else min(timeLeft, promptObj.timeout)
+                    loopArguments['strictTimeout'] = self.strictTimeout or promptObj.strictTimeout
+                if retriesLeft is not None:
+                    loopArguments['limit'] = retriesLeft + 1 if promptObj.limit is None else min(retriesLeft + 1, promptObj.limit)
+                    if loopArguments['metrics'] is None:
+                        loopArguments['metrics'] = PromptMetrics(type(promptObj).__name__) # Counts the retries used.
+                if acceptRecord and promptObj._passwordMask is None:
+                    loopArguments['commandFunc'] = self._recordCommandFunc(values, ioBackend,
+                                                                           loopArguments['commandFunc'])
+                    loopArguments['prefixFunc'] = None # A record isn't a valid response to the field.
+                acceptRecord = False # Only the first field's prompt accepts a record.
+
+                try:
+                    values[name] = promptObj._ask(loopArguments)
+                except _FormRecordEntered:
+                    pass # values now has the valid fields of the record.
+                if retriesLeft is not None:
+                    retriesLeft = max(retriesLeft - loopArguments['metrics'].retries, 0)
+
+        return self.recordType(**values)
+
+    def _recordCommandFunc(self, values, ioBackend, commandFunc):
+        """Returns a commandFunc for the input loop that adds the valid fields
+        of a record to values and raises _FormRecordEntered, and passes any
+        other response to commandFunc (such as a paged menu's commands)."""
+
+        def recordCommandFunc(userInput):
+            record, named = self._splitRecord(userInput)
+            results = [] if record is None else list(self._validateRecord(record))
+            if record is None or not named and any(isinstance(value, Exception) for name, value in results):
+                # An answer to the first field, which can have commas in it.
+                return commandFunc is not None and commandFunc(userInput)
+            for name, value in results:
+                if isinstance(value, Exception):
+                    ioBackend.writeMessage('%s: %s' % (name, value))
+                else:
+                    values[name] = value
+            raise _FormRecordEntered()
+
+        return recordCommandFunc
+
+    def _splitRecord(self, line):
+        """Returns a tuple of a dict of the field names and values in line
+        (or None if line isn't a record) and a bool of whether the record is
+        name=value pairs. A record is either comma-separated values in the
+        order of the fields (quoted like CSV if a value has a comma), or
+        comma-separated name=value pairs."""
+        try:
+            items = next(csv.reader([line], skipinitialspace=True))
+        except (csv.Error, StopIteration):
+            return None, False
+
+        pairs = [item.split('=', 1) for item in items]
+        if pairs and all(len(pair) == 2 and pair[0].strip() in self._recordFieldNames for pair in pairs):
+            return dict((key.strip(), value) for key, value in pairs), True
+        if len(items) == len(self._recordFieldNames) > 1:
+            return dict(zip(self._recordFieldNames, items)), False
+        return None, False
+
+    def _validateRecord(self, record):
+        """Yields a (name, value) tuple for each field in record, in field
+        order, where value is either the field's result or the exception
+        raised because it is invalid."""
+        for name, promptObj in self.fields:
+            if name in record:
+                try:
+                    yield name, promptObj.validate(record[name])
+                except Exception as exc:
+                    yield name, exc
+
+    def parseRecord(self, line):
+        """Validates a whole record (comma-separated values in field order, or
+        name=value pairs) without prompting the user, and returns a FormRecord
+        of the results. Raises ValidationException if line isn't a record,
+        leaves out a field, or has an invalid value."""
+        record, named = self._splitRecord(line)
+        if record is None:
+            raise pysv.ValidationException('%r is not a record of %s.' % (line, ', '.join(self.recordType._fields)))
+
+        values = {}
+        errors = []
+        for name, value in self._validateRecord(record):
+            if isinstance(value, Exception):
+                errors.append('%s: %s' % (name, value))
+            else:
+                values[name] = value
+        errors.extend(['%s: missing' % (name) for name in self.recordType._fields
+                       if name not in values and name not in record])
+        if errors:
+            raise pysv.ValidationException(' '.join(errors))
+        return self.recordType(**values)
+
+
+def submitInput(kind, **params):
+    """Starts a prompt without waiting for the user to answer it, so the
+    program can do other work while the user types. Returns a
+    concurrent.futures.Future that resolves to the validated result, or to
+    the exception the prompt raised (such as TimeoutException or
+    RetryLimitException). The prompts are asked one at a time, in the order
+    they were submitted, by a background thread.
+
+    * kind: An input*() function (such as inputInt), its name, a Prompt subclass, or a Prompt object.
+    * params: The keyword arguments to pass to the input*() function, such as prompt, min, or timeout. Not allowed if kind is a Prompt object.
+
+    The future's cancel() method cancels a prompt that hasn't started yet.
+    Once the prompt is displayed, the future is running and cancel() returns
+    False, as it does for any concurrent.futures.Future. To stop a prompt
+    that is already waiting for the user's response, call cancelInput().
+
+    >>> import pyinputplus as pyip
+    >>> future = pyip.submitInput(pyip.inputInt, prompt='Quantity> ', min=1)
+    >>> prefetchPrices() # Runs while the user types.
+    Quantity> 42
+    >>> future.result()
+    42
+    """
+    global _submittedPrompts
+    promptObj = _getPromptObject(kind, params)
+    import concurrent.futures
+    future = concurrent.futures.Future()
+    with _submittedPromptsLock:
+        if _submittedPrompts is None:
+            _submittedPrompts = queue.Queue()
+            readerThread = threading.Thread(target=_submittedPromptsThreadTarget, args=(_submittedPrompts,),
+                                            name='pyinputplus-reader')
+            readerThread.daemon = True # Don't keep the program running while a prompt waits for the user.
+            readerThread.start()
+        _submittedPrompts.put((future, promptObj))
+    return future
+
+
+def cancelInput(future):
+    """Stops a prompt started by submitInput(), whose future is passed. If the
+    prompt hasn't started, its future is cancelled. If it's running, it stops
+    the next time it checks (within a fraction of a second while it waits for
+    the user's response), and the future's result() raises
+    concurrent.futures.CancelledError. (A line the user was partway through
+    typing is then read by the next prompt.) A password prompt can't be
+    stopped while it's waiting for the user's response.
+
+    Returns False if the prompt had already finished, and True otherwise.
+    """
+    if future.cancel():
+        return True
+    with _submittedPromptsLock:
+        if future.done():
+            return False
+        _stoppedFutures.add(future)
+    return True
+
+
+_submittedPrompts = None # The queue of (future, Prompt object) tuples that submitInput()'s thread asks.
+_submittedPromptsLock = _thread.allocate_lock()
+_stoppedFutures = set() # The futures of running prompts that cancelInput() was called for.
+
+# How often, in seconds, a prompt started by submitInput() checks if it was
+# cancelled while it waits for the user's response.
+_CANCEL_POLL_INTERVAL = 0.05
+
+
+def _submittedPromptsThreadTarget(submittedPrompts):
+    while True:
+        future, promptObj = submittedPrompts.get()
+        if not future.set_running_or_notify_cancel():
+            continue # The future was cancelled before the prompt started.
+
+        loopArguments = promptObj._inputLoopArguments()
+        loopArguments['ioBackend'] = _CancellableIOBackend(loopArguments['ioBackend'], future)
+        try:
+            result = promptObj._ask(loopArguments)
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+        with _submittedPromptsLock:
+            _stoppedFutures.discard(future)
+
+
+class _CancellableIOBackend(IOBackend):
+    """Wraps the IO backend of a prompt started by submitInput(), so that the
+    prompt raises concurrent.futures.CancelledError once cancelInput() is
+    called for its future. Reads are split into short reads so cancellation
+    is noticed while waiting for the user."""
+
+    def __init__(self, ioBackend, future):
+        self._ioBackend = ioBackend
+        self._future = future
+
+    def _checkCancelled(self):
+        if self._future in _stoppedFutures:
+            import concurrent.futures
+            raise concurrent.futures.CancelledError()
+
+    def getConsoleLock(self):
+        return self._ioBackend.getConsoleLock()
+
+    def write(self, text):
+        self._ioBackend.write(text)
+
+    def writePrompt(self, prompt):
+        self._checkCancelled()
+        self._ioBackend.writePrompt(prompt)
+
+    def writeMessage(self, message):
+        self._ioBackend.writeMessage(message)
+
+    def flush(self):
+        self._ioBackend.flush()
+
+    def readLine(self, timeout):
+        self._checkCancelled()
+        if isinstance(self._ioBackend, ScriptedIOBackend):
+            return self._ioBackend.readLine(timeout) # It never waits, and a None answer means no response.
+
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            self._checkCancelled()
+            readTimeout = _CANCEL_POLL_INTERVAL if deadline is None else min(_CANCEL_POLL_INTERVAL, max(deadline - time.time(), 0))
+            line = self._ioBackend.readLine(readTimeout)
+            if line is not None or deadline is not None and time.time() >= deadline:
+                return line
+
+    def readLineIncrementally(self, timeout, isValidPrefix, complete=None, history=None):
+        if type(self._ioBackend).readLineIncrementally is IOBackend.readLineIncrementally:
+            return self.readLine(timeout) # Read with short reads, the same as the backend would.
+        # Cancellation can't interrupt the user while they type, so it's
+        # noticed once they press Enter.
+        self._checkCancelled()
+        line = self._ioBackend.readLineIncrementally(timeout, isValidPrefix, complete, history)
+        self._checkCancelled()
+        return line
+
+    def readPassword(self, mask):
+        self._checkCancelled()
+        return self._ioBackend.readPassword(mask)
+
+    def promptFinished(self, result, exception):
+        self._ioBackend.promptFinished(result, exception)
+
+
+def __getattr__(name):
+    # The awaitable ainput*() functions live in the asyncinput module, which
+    # is only imported when one of them is first used so that importing
+    # pyinputplus doesn't import asyncio.
+    if name.startswith('ainput') and name[1:] in _PROMPT_CLASSES or name == 'askAsync':
+        from pyinputplus import asyncinput
+        return getattr(asyncinput, name)
+    # Likewise, the classes that aggregate PromptMetrics are only needed
+    # once a metrics callback is set.
+    if name in ('MetricsCollector', 'Histogram'):
+        from pyinputplus import metrics
+        return getattr(metrics, name)
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
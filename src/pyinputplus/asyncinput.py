@@ -0,0 +1,283 @@
+"""Awaitable versions of PyInputPlus's input*() functions, for asyncio programs.
+
+The input*() functions block on input(), which stalls the whole event loop.
+The ainput*() functions in this module read stdin without blocking it, so
+other tasks keep running while a prompt is waiting for the user. Each
+ainput*() function takes the same arguments as its input*() function and
+validates the input the same way.
+
+    >>> import asyncio
+    >>> import pyinputplus as pyip
+    >>> asyncio.run(pyip.ainputInt('Enter a number> ', min=0))
+    Enter a number> 42
+    42
+
+Unlike the input*() functions, the timeout is always enforced while waiting
+for input (as if strictTimeout were True) using asyncio.wait_for().
+
+Only one prompt reads stdin at a time. If several tasks call ainput*()
+functions at once, their prompts are displayed one after another. Like the
+input*() functions, each prompt also holds its IO backend's ConsoleLock, so
+prompts from other threads wait for it (and it waits for them without
+blocking the event loop).
+
+Other IO backends (see pyinputplus.IOBackend) are read in a background thread.
+"""
+
+import _thread
+import asyncio
+import functools
+import os
+import select
+import sys
+import time
+import weakref
+
+import pyinputplus
+from pyinputplus import (_ASK_AGAIN, _PROMPT_CLASSES, _ReadTimeoutException, _consoleLockTimedOut,
+                         _getReadTimeout, _processReadTimeout, _processResponse, _stdinIsTerminal,
+                         _stdinThreadedReaderIsBusy, _threadedInput, getConsolePriority, StdIOBackend)
+
+
+# Maps each event loop to the _StdinReader that reads stdin for it.
+_stdinReaders = weakref.WeakKeyDictionary()
+
+# The beginning of a line that a _StdinReader read from stdin before the
+# prompt reading it timed out. It's kept here rather than in the reader, so
+# the next event loop that reads stdin gets it too.
+_partialLine = b''
+
+
+class _StdinReader(object):
+    """Reads lines from stdin for one event loop. If stdin is a terminal
+    whose file descriptor can be watched by the event loop, lines are read as
+    soon as it is readable. Otherwise (for example, on Windows or if stdin is
+    a pipe or file), input() is called in a background thread, so that lines
+    go through sys.stdin's buffer, which input() and other event loops also
+    read from."""
+
+    def __init__(self, loop):
+        self.lock = asyncio.Lock() # Held by the prompt that is currently reading stdin.
+        self._loop = loop
+        self._eof = False
+        self._encoding = getattr(sys.stdin, 'encoding', None) or 'utf-8'
+
+        self._fd = None
+        if _stdinIsTerminal() and not _stdinThreadedReaderIsBusy():
+            try:
+                loop.add_reader(sys.stdin.fileno(), lambda: None)
+                loop.remove_reader(sys.stdin.fileno())
+                self._fd = sys.stdin.fileno()
+            except (ValueError, OSError, NotImplementedError):
+                pass
+
+    async def readLine(self, timeout):
+        """Returns the next line of input without its newline, or None if it
+        isn't entered within timeout seconds (waiting forever if timeout is
+        None), the same as IOBackend.readLine()."""
+        try:
+            if self._fd is None:
+                return await self._loop.run_in_executor(None, _threadedInput, timeout)
+            line = await asyncio.wait_for(self._readLine(), timeout)
+        except (_ReadTimeoutException, asyncio.TimeoutError):
+            return None
+        return line.decode(self._encoding)
+
+    async def _readLine(self):
+        # stdin is read one byte at a time and never past the end of the line,
+        # so whatever is typed after it is left for input() and other event
+        # loops.
+        global _partialLine
+        while True:
+            if self._eof:
+                if _partialLine:
+                    line, _partialLine = _partialLine, b''
+                    return line
+                raise EOFError('EOF when reading a line') # The same exception input() raises.
+
+            await self._waitUntilReadable()
+            while True:
+                data = os.read(self._fd, 1)
+                if data == b'':
+                    self._eof = True
+                    break
+                if data == b'\n':
+                    line, _partialLine = _partialLine, b''
+                    return line
+                _partialLine += data
+                if not select.select([self._fd], [], [], 0)[0]:
+                    break # Wait for the rest of the line without blocking the event loop.
+
+    def _waitUntilReadable(self):
+        # stdin is only watched while a prompt is waiting for it, so that it
+        # can still be read normally in between prompts.
+        future = self._loop.create_future()
+
+        def onReadable():
+            if not future.done():
+                future.set_result(None)
+
+        self._loop.add_reader(self._fd, onReadable)
+        future.add_done_callback(lambda future: self._loop.remove_reader(self._fd))
+        return future
+
+
+def _getStdinReader():
+    loop = asyncio.get_running_loop()
+    stdinReader = _stdinReaders.get(loop)
+    if stdinReader is None:
+        stdinReader = _stdinReaders[loop] = _StdinReader(loop)
+    return stdinReader
+
+
+async def askAsync(promptObj):
+    """The awaitable version of promptObj.ask(), where promptObj is one of
+    PyInputPlus's Prompt objects such as NumPrompt or ChoicePrompt.
+
+    >>> import asyncio
+    >>> import pyinputplus as pyip
+    >>> percentPrompt = pyip.NumPrompt('Percent> ', min=0, max=100)
+    >>> asyncio.run(askAsync(percentPrompt))
+    Percent> 42
+    42
+    """
+    stdinReader = _getStdinReader()
+    loopArguments = promptObj._inputLoopArguments()
+    try:
+        async with stdinReader.lock:
+            result = promptObj._finishResult(await _consoleInputLoopAsync(stdinReader, **loopArguments),
+                                             loopArguments['metrics'])
+    except Exception as exc:
+        if loopArguments['metrics'] is not None:
+            loopArguments['metrics']._finish(exc)
+        loopArguments['ioBackend'].promptFinished(None, exc)
+        raise
+    if loopArguments['metrics'] is not None:
+        loopArguments['metrics']._finish(None)
+    loopArguments['ioBackend'].promptFinished(result, None)
+    return result
+
+
+async def _consoleInputLoopAsync(stdinReader, **loopArguments):
+    """The awaitable version of pyinputplus._consoleInputLoop(). The console
+    lock is waited for in a background thread, and is held by the event
+    loop's thread while the prompt runs."""
+    loop = stdinReader._loop
+    consoleLock = loopArguments['ioBackend'].getConsoleLock()
+    timeout = loopArguments['timeout']
+    waitStartTime = time.time()
+    acquireFuture = loop.run_in_executor(None, consoleLock._acquireFor, _thread.get_ident(), timeout,
+                                         getConsolePriority())
+    try:
+        acquired = await asyncio.shield(acquireFuture)
+    except asyncio.CancelledError:
+        # The background thread keeps waiting, so give the lock back if it
+        # gets it. Done callbacks run in the event loop's thread.
+        acquireFuture.add_done_callback(lambda future: future.result() and consoleLock.release())
+        raise
+    if not acquired:
+        return _consoleLockTimedOut(loopArguments, waitStartTime)
+
+    try:
+        if timeout is not None:
+            loopArguments['timeout'] = timeout - (time.time() - waitStartTime)
+        return await _genericInputLoopAsync(stdinReader, **loopArguments)
+    finally:
+        consoleLock.release()
+
+
+async def _genericInputLoopAsync(stdinReader, prompt, default, timeout, limit, applyFunc, validationFunc,
+                                 postValidateApplyFunc, passwordMask, strictTimeout, attemptTimeout, ioBackend,
+                                 commandFunc, prefixFunc, completeFunc, history, metrics):
+    """The awaitable version of pyinputplus._genericInputLoop(). The timeout
+    is always enforced while waiting for input, regardless of strictTimeout."""
+    loop = stdinReader._loop
+
+    startTime = time.time()
+    tries = 0
+    if metrics is not None:
+        metrics.startTime = startTime
+
+    while True:
+        readTimeout, deadlinePassedOnTimeout = _getReadTimeout(startTime=startTime, timeout=timeout,
+                                                               strictTimeout=True, attemptTimeout=attemptTimeout)
+
+        # Get the user input.
+        ioBackend.writePrompt(prompt() if callable(prompt) else prompt)
+        if metrics is not None:
+            waitStartTime = time.time()
+        if passwordMask is not None:
+            # Masked input reads keystrokes directly, so it is read in a
+            # background thread and can't be interrupted by a timeout.
+            userInput = await loop.run_in_executor(None, ioBackend.readPassword, passwordMask)
+        elif type(ioBackend) is StdIOBackend:
+            ioBackend.flush()
+            sys.stdout.flush() # Like input(), also display anything else printed without a newline.
+            userInput = await stdinReader.readLine(readTimeout)
+        elif prefixFunc is not None or completeFunc is not None or history is not None:
+            userInput = await loop.run_in_executor(None, ioBackend.readLineIncrementally, readTimeout, prefixFunc,
+                                                   completeFunc, None if history is None else history.entries())
+        else:
+            userInput = await loop.run_in_executor(None, ioBackend.readLine, readTimeout)
+        if metrics is not None:
+            metrics._responseRead(waitStartTime, userInput)
+
+        if userInput is not None and commandFunc is not None and commandFunc(userInput):
+            continue
+
+        tries += 1
+        if metrics is not None:
+            metrics.tries = tries
+        if userInput is None:
+            result = _processReadTimeout(deadlinePassedOnTimeout=deadlinePassedOnTimeout, startTime=startTime,
+                                         timeout=timeout, tries=tries, limit=limit, default=default,
+                                         ioBackend=ioBackend, metrics=metrics)
+        else:
+            result = _processResponse(userInput, startTime=startTime, timeout=timeout, tries=tries, limit=limit,
+                                      default=default, applyFunc=applyFunc, validationFunc=validationFunc,
+                                      postValidateApplyFunc=postValidateApplyFunc, ioBackend=ioBackend,
+                                      history=history, metrics=metrics)
+
+        if result is not _ASK_AGAIN:
+            return result
+
+
+def _makeAsyncInputFunction(inputFunc):
+    """Returns an awaitable version of inputFunc, which takes the same
+    arguments and uses the same Prompt class."""
+    promptClass = _PROMPT_CLASSES[inputFunc.__name__]
+
+    @functools.wraps(inputFunc)
+    async def asyncInputFunc(*args, **kwargs):
+        return await askAsync(promptClass(*args, **kwargs))
+
+    asyncInputFunc.__name__ = asyncInputFunc.__qualname__ = 'a' + inputFunc.__name__
+    asyncInputFunc.__doc__ = 'The awaitable version of %s(), which takes the same arguments.' % (inputFunc.__name__)
+    return asyncInputFunc
+
+
+ainputStr = _makeAsyncInputFunction(pyinputplus.inputStr)
+ainputCustom = _makeAsyncInputFunction(pyinputplus.inputCustom)
+ainputNum = _makeAsyncInputFunction(pyinputplus.inputNum)
+ainputInt = _makeAsyncInputFunction(pyinputplus.inputInt)
+ainputFloat = _makeAsyncInputFunction(pyinputplus.inputFloat)
+ainputChoice = _makeAsyncInputFunction(pyinputplus.inputChoice)
+ainputMenu = _makeAsyncInputFunction(pyinputplus.inputMenu)
+ainputDate = _makeAsyncInputFunction(pyinputplus.inputDate)
+ainputDatetime = _makeAsyncInputFunction(pyinputplus.inputDatetime)
+ainputTime = _makeAsyncInputFunction(pyinputplus.inputTime)
+ainputState = _makeAsyncInputFunction(pyinputplus.inputState)
+ainputMonth = _makeAsyncInputFunction(pyinputplus.inputMonth)
+ainputDayOfWeek = _makeAsyncInputFunction(pyinputplus.inputDayOfWeek)
+ainputDayOfMonth = _makeAsyncInputFunction(pyinputplus.inputDayOfMonth)
+ainputIp = _makeAsyncInputFunction(pyinputplus.inputIp)
+ainputRegex = _makeAsyncInputFunction(pyinputplus.inputRegex)
+ainputRegexStr = _makeAsyncInputFunction(pyinputplus.inputRegexStr)
+ainputURL = _makeAsyncInputFunction(pyinputplus.inputURL)
+ainputYesNo = _makeAsyncInputFunction(pyinputplus.inputYesNo)
+ainputBool = _makeAsyncInputFunction(pyinputplus.inputBool)
+ainputZip = _makeAsyncInputFunction(pyinputplus.inputZip)
+ainputFilename = _makeAsyncInputFunction(pyinputplus.inputFilename)
+ainputFilepath = _makeAsyncInputFunction(pyinputplus.inputFilepath)
+ainputEmail = _makeAsyncInputFunction(pyinputplus.inputEmail)
+ainputPassword = _makeAsyncInputFunction(pyinputplus.inputPassword)
@@ -0,0 +1,203 @@
+"""Aggregation of the PromptMetrics objects that PyInputPlus records for each
+prompt once a metrics callback is set with pyinputplus.setMetricsCallback().
+
+A MetricsCollector can be used as that callback. It keeps a Histogram of each
+measurement for each type of prompt, which can be exported as a dict (for
+example, to save as JSON) for capacity planning:
+
+    >>> import json
+    >>> import pyinputplus as pyip
+    >>> collector = pyip.MetricsCollector()
+    >>> pyip.setMetricsCallback(collector)
+    >>> pyip.inputInt('Quantity> ')
+    Quantity> 42
+    42
+    >>> collector.histogram('firstAnswerTime', 'IntPrompt').count
+    1
+    >>> report = json.dumps(collector.export())
+
+This module is imported the first time pyinputplus.MetricsCollector or
+pyinputplus.Histogram is used.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import bisect
+import threading
+
+
+def _timeBounds():
+    """Returns the default bucket upper bounds for times: 1, 2, and 5 times
+    each power of ten from 1 microsecond to 1000 seconds."""
+    bounds = []
+    for exponent in range(-6, 4):
+        for multiplier in (1, 2, 5):
+            bounds.append(float('%se%s' % (multiplier, exponent)))
+    return tuple(bounds)
+
+
+# The bucket upper bounds for histograms of times, in seconds.
+TIME_BOUNDS = _timeBounds()
+
+# The bucket upper bounds for histograms of counts, such as retries.
+COUNT_BOUNDS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# The PromptMetrics attributes that MetricsCollector keeps histograms of.
+HISTOGRAM_METRICS = (('duration', TIME_BOUNDS), ('firstAnswerTime', TIME_BOUNDS), ('waitTime', TIME_BOUNDS),
+                     ('validationTime', TIME_BOUNDS), ('applyFuncTime', TIME_BOUNDS),
+                     ('validationFuncTime', TIME_BOUNDS), ('postValidateApplyFuncTime', TIME_BOUNDS),
+                     ('retries', COUNT_BOUNDS))
+
+# The PromptMetrics attributes that MetricsCollector counts the calls where
+# they are true.
+COUNTED_METRICS = ('timedOut', 'limitReached', 'usedDefault', 'exception')
+
+
+class Histogram(object):
+    """Counts values in buckets with fixed upper bounds, along with their
+    total, minimum, and maximum. Adding a value doesn't store it, so a
+    histogram uses the same memory no matter how many values it has.
+
+    * bounds (Sequence): The ascending upper bounds of the buckets. Values above the last bound go in an extra overflow bucket.
+
+    >>> import pyinputplus as pyip
+    >>> histogram = pyip.Histogram((1, 2, 5))
+    >>> for value in (0.5, 1.5, 1.8, 7):
+    ...     histogram.add(value)
+    >>> histogram.bucketCounts
+    [1, 2, 0, 1]
+    >>> histogram.percentile(50)
+    2
+    """
+
+    def __init__(self, bounds=TIME_BOUNDS):
+        if not bounds or list(bounds) != sorted(bounds):
+            raise ValueError('bounds argument must be a non-empty sequence of ascending numbers')
+        self.bounds = tuple(bounds)
+        self.bucketCounts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        """Adds value to the histogram."""
+        self.bucketCounts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        """The mean of the values, or None if there are none."""
+        return None if self.count == 0 else self.total / self.count
+
+    def percentile(self, percent):
+        """Returns the upper bound of the bucket that contains the given
+        percentile (from 0 to 100) of the values, or the maximum value if that
+        is in the overflow bucket. Returns None if there are no values."""
+        if self.count == 0:
+            return None
+        rank = percent / 100 * self.count
+        seen = 0
+        for i, bucketCount in enumerate(self.bucketCounts):
+            seen += bucketCount
+            if bucketCount and seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def toDict(self):
+        """Returns a dict of this histogram that can be saved as JSON."""
+        return {'bounds': list(self.bounds), 'bucketCounts': list(self.bucketCounts), 'count': self.count,
+                'total': self.total, 'min': self.min, 'max': self.max, 'mean': self.mean,
+                'p50': self.percentile(50), 'p90': self.percentile(90), 'p99': self.percentile(99)}
+
+
+class _PromptTypeStats(object):
+    """The histograms and counts of one type of prompt."""
+
+    def __init__(self):
+        self.calls = 0
+        self.histograms = dict((name, Histogram(bounds)) for name, bounds in HISTOGRAM_METRICS)
+        self.counts = dict((name, 0) for name in COUNTED_METRICS)
+
+
+class MetricsCollector(object):
+    """A callback for pyinputplus.setMetricsCallback() that aggregates the
+    PromptMetrics of every prompt into histograms, both for all prompts and
+    for each type of prompt (such as 'IntPrompt'). Prompts in different
+    threads can be recorded at the same time.
+
+    >>> import pyinputplus as pyip
+    >>> collector = pyip.MetricsCollector()
+    >>> pyip.setMetricsCallback(collector)
+    >>> pyip.inputYesNo(limit=2, default='no')
+    maybe
+    'maybe' is not a valid yes/no response.
+    perhaps
+    'perhaps' is not a valid yes/no response.
+    'no'
+    >>> collector.export()['YesNoPrompt']['usedDefault']
+    1
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def __call__(self, metrics):
+        self.record(metrics)
+
+    def record(self, metrics):
+        """Adds the measurements of a PromptMetrics object."""
+        with self._lock:
+            for promptType in (None, metrics.promptType):
+                stats = self._stats.get(promptType)
+                if stats is None:
+                    stats = self._stats[promptType] = _PromptTypeStats()
+                stats.calls += 1
+                for name, histogram in stats.histograms.items():
+                    value = getattr(metrics, name)
+                    if value is not None:
+                        histogram.add(value)
+                for name in COUNTED_METRICS:
+                    if getattr(metrics, name):
+                        stats.counts[name] += 1
+                if metrics.promptType is None:
+                    break # Calls to _genericInput() are only recorded once, in the totals.
+
+    def histogram(self, metricName, promptType=None):
+        """Returns the Histogram of metricName (a PromptMetrics attribute such
+        as 'waitTime' or 'retries') for promptType (a Prompt class name such
+        as 'IntPrompt'), or for all prompts if promptType is None. Returns an
+        empty Histogram if no prompts of that type were recorded."""
+        with self._lock:
+            stats = self._stats.get(promptType)
+            if stats is None:
+                return Histogram(dict(HISTOGRAM_METRICS)[metricName])
+            return stats.histograms[metricName]
+
+    def export(self):
+        """Returns a dict of everything recorded that can be saved as JSON.
+        Its keys are 'all' for the totals of all prompts and the names of
+        the prompt types. Each value is a dict with the number of 'calls',
+        the number of calls where each of timedOut, limitReached,
+        usedDefault, and exception were true, and a dict from
+        Histogram.toDict() for each histogram."""
+        with self._lock:
+            report = {}
+            for promptType, stats in self._stats.items():
+                promptTypeReport = {'calls': stats.calls}
+                promptTypeReport.update(stats.counts)
+                for name, histogram in stats.histograms.items():
+                    promptTypeReport[name] = histogram.toDict()
+                report['all' if promptType is None else promptType] = promptTypeReport
+            return report
+
+    def reset(self):
+        """Discards everything recorded so far."""
+        with self._lock:
+            self._stats = {}
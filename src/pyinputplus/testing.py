@@ -0,0 +1,238 @@
+"""Utilities for testing programs that use PyInputPlus, without a terminal or
+a user typing at it.
+
+A FakeConsole replaces sys.stdin and sys.stdout with in-memory files while it
+is used in a with statement. The text passed to its type() method is what the
+"user" types, and everything the prompts display is captured:
+
+    >>> import pyinputplus as pyip
+    >>> from pyinputplus.testing import FakeConsole
+    >>> with FakeConsole('forty\\n42\\n') as console:
+    ...     quantity = pyip.inputInt('Quantity> ')
+    >>> quantity
+    42
+    >>> console.output
+    "Quantity> 'forty' is not an integer.\\nQuantity> "
+
+Password prompts read the typed text too, with backspaces erasing the
+previous character the same way stdiomask.getpass() does, so no terminal is
+needed for them either.
+
+Time is faked as well: the clock PyInputPlus sees only moves forward when a
+prompt waits for typing that was given a delay, so timeouts can be tested in
+no time and with the same result on every run:
+
+    >>> with FakeConsole() as console:
+    ...     console.type('42\\n', delay=10)
+    ...     quantity = pyip.inputInt(timeout=5, default='0')
+    >>> quantity
+    0
+
+If a prompt reads more text than was typed, it raises EOFError (the same as
+input() at the end of a file) instead of waiting forever.
+
+FakeConsole patches module-level state (sys.stdin, sys.stdout, and the
+pyinputplus module's clock and password reader), so only one thread should
+use it at a time. Tests that use it can still run in parallel in separate
+processes, such as with pytest-xdist. It works with the default IO backend,
+StdIOBackend, and with KeystrokeIOBackend, which reads lines the same way
+when stdin isn't a terminal.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import io
+import sys
+import time
+
+import pyinputplus
+
+
+class FakeConsole(object):
+    """Stands in for the terminal while used in a with statement, so that
+    prompts read the text passed to type() and their output is captured in
+    the output attribute.
+
+    * text (str): Text to type right away, as if passed to type().
+    * delay (int, float): The delay for text, as in type().
+    """
+
+    def __init__(self, text='', delay=0):
+        self._lines = [] # A list of [delay, line] lists of the lines not read yet.
+        self._now = 0.0 # The number of seconds on the fake clock since this object was created.
+        self._startTime = time.time()
+        self._outputRead = 0 # The length of the output already returned by readOutput().
+        self._patched = []
+        self.stdin = _FakeStdin(self)
+        self.stdout = io.StringIO()
+        self.type(text, delay)
+
+    def __enter__(self):
+        self._patched.append((sys.stdin, sys.stdout, pyinputplus.time, pyinputplus.stdiomask,
+                              pyinputplus._stdinThreadedReader))
+        sys.stdin, sys.stdout = self.stdin, self.stdout
+        pyinputplus.time = _FakeTime(self)
+        pyinputplus.stdiomask = _FakeStdiomask(self)
+        pyinputplus._stdinThreadedReader = _FakeLineReader(self)
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        (sys.stdin, sys.stdout, pyinputplus.time, pyinputplus.stdiomask,
+         pyinputplus._stdinThreadedReader) = self._patched.pop()
+
+    def type(self, text, delay=0):
+        """Adds text to what the user has typed. The first line of it
+        arrives delay seconds (on the fake clock) after a prompt starts
+        waiting for it, and the lines after that arrive right away.
+
+        * text (str): The text to type. Each line of it, ending with '\\n', answers one prompt.
+        * delay (int, float): The number of seconds before the first line arrives.
+        """
+        lines = [line + '\n' for line in text.split('\n')]
+        lines[-1] = lines[-1][:-1]
+        if lines[-1] == '':
+            lines.pop()
+        for i, line in enumerate(lines):
+            if i == 0 and self._lines and not self._lines[-1][1].endswith('\n'):
+                self._lines[-1][1] += line # Finish the line that the last call to type() left unfinished.
+            else:
+                self._lines.append([delay if i == 0 else 0, line])
+
+    @property
+    def output(self):
+        """All of the text that has been written to stdout."""
+        return self.stdout.getvalue()
+
+    def readOutput(self):
+        """Returns the text written to stdout since the last call to
+        readOutput() (or since this object was created)."""
+        output = self.stdout.getvalue()
+        newOutput = output[self._outputRead:]
+        self._outputRead = len(output)
+        return newOutput
+
+    def unreadText(self):
+        """Returns the typed text that no prompt has read yet."""
+        return ''.join([line for delay, line in self._lines])
+
+    def _readLine(self, timeout):
+        """Returns the next typed line (including its '\\n', if it has one),
+        '' if there are no more, or None if the line doesn't arrive within
+        timeout seconds. Moves the fake clock forward by the time waited.
+
+        * timeout (int, float, None): The number of seconds to wait, or None to wait however long it takes.
+        """
+        if not self._lines:
+            return ''
+        delay, line = self._lines[0]
+        if timeout is not None and delay > timeout:
+            timeout = max(timeout, 0)
+            self._now += timeout
+            self._lines[0][0] -= timeout
+            return None
+        self._now += delay
+        del self._lines[0]
+        return line
+
+
+def answer(func, text, delay=0):
+    """Calls func() with a FakeConsole that text was typed into, and returns
+    a tuple of func()'s return value and its output.
+
+    >>> import pyinputplus as pyip
+    >>> from pyinputplus.testing import answer
+    >>> answer(lambda: pyip.inputYesNo('Continue? '), 'y\\n')
+    ('yes', 'Continue? ')
+
+    * func (Callable): The function to call with no arguments.
+    * text (str): The text to type.
+    * delay (int, float): The delay for text, as in FakeConsole.type().
+    """
+    with FakeConsole(text, delay) as console:
+        result = func()
+    return result, console.output
+
+
+class _FakeStdin(io.TextIOBase):
+    """The sys.stdin of a FakeConsole. It has no file descriptor, so input()
+    calls its readline() method."""
+
+    encoding = 'utf-8'
+
+    def __init__(self, console):
+        super(_FakeStdin, self).__init__()
+        self._console = console
+
+    def readable(self):
+        return True
+
+    def readline(self, size=-1):
+        return self._console._readLine(None)
+
+
+class _FakeLineReader(object):
+    """Replaces pyinputplus's _ThreadedLineReader for stdin, so that reads
+    with a timeout use the fake clock instead of waiting in a thread."""
+
+    def __init__(self, console):
+        self._console = console
+
+    def read(self, timeout):
+        line = self._console._readLine(timeout)
+        if line is None:
+            raise pyinputplus._ReadTimeoutException()
+        if line == '':
+            raise EOFError('EOF when reading a line')
+        return line[:-1] if line.endswith('\n') else line
+
+    def isBusy(self):
+        return False
+
+
+class _FakeStdiomask(object):
+    """Replaces the stdiomask module, so that password prompts read the
+    typed text instead of keystrokes from the terminal."""
+
+    def __init__(self, console):
+        self._console = console
+
+    def getpass(self, prompt='Password: ', mask='*'):
+        line = self._console._readLine(None)
+        if line == '':
+            raise EOFError('EOF when reading a line')
+        output = self._console.stdout
+        output.write(prompt)
+        enteredPassword = []
+        for character in line.rstrip('\n'):
+            if character in ('\b', '\x7f'): # Backspace erases the previous character, if there is one.
+                if enteredPassword:
+                    output.write('\b \b' if mask else '')
+                    enteredPassword.pop()
+            elif ord(character) >= 32: # Unprintable characters are ignored.
+                enteredPassword.append(character)
+                output.write(mask)
+        output.write('\n')
+        return ''.join(enteredPassword)
+
+
+class _FakeTime(object):
+    """Replaces the time module in pyinputplus, with a clock that only moves
+    forward when a FakeConsole waits for typed text (or sleep() is called).
+    Its other attributes are the time module's."""
+
+    def __init__(self, console):
+        self._console = console
+
+    def time(self):
+        return self._console._startTime + self._console._now
+
+    def perf_counter(self):
+        return self._console._now
+
+    monotonic = perf_counter
+
+    def sleep(self, seconds):
+        self._console._now += max(seconds, 0)
+
+    def __getattr__(self, name):
+        return getattr(time, name)
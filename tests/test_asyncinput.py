@@ -0,0 +1,140 @@
+from __future__ import absolute_import, division, print_function
+
+import asyncio
+import io
+import os
+import sys
+import time
+import unittest
+
+import pyinputplus as pyip
+
+try:
+    import pty
+except ImportError:
+    pty = None
+
+
+class test_asyncInputWithPipe(unittest.TestCase):
+    # stdin is a pipe, which is read through sys.stdin in a background thread.
+    def setUp(self):
+        self.origStdin, self.origStdout = sys.stdin, sys.stdout
+        readFd, self.writeFd = os.pipe()
+        sys.stdin = io.open(readFd, 'r')
+        sys.stdout = io.StringIO()
+
+    def tearDown(self):
+        # Closing the other end first ends any read left running by a
+        # timeout. The line or exception it read is thrown away.
+        if self.writeFd is not None:
+            os.close(self.writeFd)
+        sys.stdin.close()
+        pyip._stdinThreadedReader = None
+        sys.stdin, sys.stdout = self.origStdin, self.origStdout
+
+    def typeLater(self, text, delay):
+        asyncio.get_running_loop().call_later(delay, os.write, self.writeFd, text.encode('utf-8'))
+
+    def test_ainputInt(self):
+        async def main():
+            self.typeLater('forty\n42\n', 0.05)
+            return await pyip.ainputInt('> ')
+
+        self.assertEqual(asyncio.run(main()), 42)
+        self.assertEqual(sys.stdout.getvalue(), "> 'forty' is not an integer.\n> ")
+
+    def test_otherTasksKeepRunning(self):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.time())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            tickerTask = asyncio.ensure_future(ticker())
+            self.typeLater('cat\n', 0.2)
+            response = await pyip.ainputChoice(['cat', 'dog'])
+            tickerTask.cancel()
+            return response
+
+        self.assertEqual(asyncio.run(main()), 'cat')
+        self.assertGreater(len(ticks), 5)
+
+    def test_timeout(self):
+        async def main():
+            return await pyip.ainputStr(timeout=0.1)
+
+        startTime = time.time()
+        self.assertRaises(pyip.TimeoutException, asyncio.run, main())
+        self.assertLess(time.time() - startTime, 5)
+
+        self.assertEqual(asyncio.run(pyip.ainputStr(timeout=0.1, default='def')), 'def')
+
+    def test_concurrentPromptsTakeTurns(self):
+        async def main():
+            self.typeLater('first\nsecond\n', 0.05)
+            return await asyncio.gather(pyip.ainputStr('1> '), pyip.ainputStr('2> '))
+
+        self.assertEqual(asyncio.run(main()), ['first', 'second'])
+        self.assertEqual(sys.stdout.getvalue(), '1> 2> ')
+
+    def test_linesAfterEventLoopEnds(self):
+        # Lines after the one a prompt reads are left for later prompts,
+        # whether or not they are in the same event loop.
+        os.write(self.writeFd, b'one\ntwo\nthree\n')
+        self.assertEqual(asyncio.run(pyip.ainputStr()), 'one')
+        self.assertEqual(sys.stdin.readline(), 'two\n')
+        self.assertEqual(asyncio.run(pyip.ainputStr()), 'three')
+
+    def test_partialLineAfterTimeout(self):
+        os.write(self.writeFd, b'tw')
+        self.assertEqual(asyncio.run(pyip.ainputStr(timeout=0.1, default='def')), 'def')
+        os.write(self.writeFd, b'o\n')
+        self.assertEqual(asyncio.run(pyip.ainputStr()), 'two')
+
+    def test_eof(self):
+        os.close(self.writeFd)
+        self.writeFd = None
+        self.assertRaises(EOFError, asyncio.run, pyip.ainputStr())
+
+
+@unittest.skipIf(pty is None or sys.platform == 'win32', 'requires a POSIX pseudoterminal')
+class test_asyncInputWithTerminal(test_asyncInputWithPipe):
+    # stdin is a terminal, which the event loop can watch for input.
+    def setUp(self):
+        self.origStdin, self.origStdout = sys.stdin, sys.stdout
+        self.writeFd, slaveFd = pty.openpty()
+        sys.stdin = io.open(slaveFd, 'r')
+        sys.stdout = io.StringIO()
+
+    def test_eof(self):
+        os.write(self.writeFd, b'\x04') # Ctrl-D at the start of a line.
+        self.assertRaises(EOFError, asyncio.run, pyip.ainputStr())
+
+
+class test_asyncInputWithoutFileno(unittest.TestCase):
+    # stdin has no file descriptor, so it is read in a background thread.
+    def setUp(self):
+        self.origStdin, self.origStdout = sys.stdin, sys.stdout
+        sys.stdout = io.StringIO()
+
+    def tearDown(self):
+        sys.stdin, sys.stdout = self.origStdin, self.origStdout
+
+    def test_ainputMenu(self):
+        sys.stdin = io.StringIO('3\n2\n')
+        self.assertEqual(asyncio.run(pyip.ainputMenu(['cat', 'dog'], numbered=True)), 'dog')
+
+    def test_askAsync(self):
+        sys.stdin = io.StringIO('101\n42\n')
+        percentPrompt = pyip.NumPrompt('> ', min=0, max=100)
+        self.assertEqual(asyncio.run(pyip.askAsync(percentPrompt)), 42)
+
+    def test_names(self):
+        self.assertEqual(pyip.ainputYesNo.__name__, 'ainputYesNo')
+        self.assertRaises(AttributeError, getattr, pyip, 'ainputNothing')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,272 @@
+from __future__ import absolute_import, division, print_function
+
+import asyncio
+import threading
+import time
+import unittest
+
+import pyinputplus as pyip
+
+
+class NumberedPromptBackend(pyip.IOBackend):
+    """Answers each prompt 'N> ' with N, except that the first answer to an
+    odd N is invalid. It lets other threads run between displaying a prompt
+    and reading its answer, so prompts that aren't serialized interleave and
+    get each other's answers."""
+
+    def __init__(self):
+        self.writes = []
+        self.readTimeouts = []
+        self._lastPrompt = None
+        self._answered = set()
+
+    def write(self, text):
+        self.writes.append(text)
+
+    def writePrompt(self, prompt):
+        self.writes.append(prompt)
+        self._lastPrompt = prompt
+        time.sleep(0.0001)
+
+    def readLine(self, timeout):
+        self.readTimeouts.append(timeout)
+        time.sleep(0.0001)
+        number = int(self._lastPrompt[:-2])
+        if number % 2 and number not in self._answered:
+            self._answered.add(number)
+            return 'nope'
+        return str(number)
+
+
+def startThread(target, *args):
+    thread = threading.Thread(target=target, args=args)
+    thread.daemon = True
+    thread.start()
+    return thread
+
+
+def waitForWaiters(consoleLock, count):
+    deadline = time.time() + 5
+    while len(consoleLock._waiters) < count:
+        if time.time() > deadline:
+            raise AssertionError('threads never waited for the console lock')
+        time.sleep(0.001)
+
+
+class test_concurrentPrompts(unittest.TestCase):
+    def test_stress(self):
+        backend = NumberedPromptBackend()
+        results = {}
+
+        def ask(number):
+            results[number] = pyip.inputInt('%d> ' % (number), ioBackend=backend)
+
+        threads = [startThread(ask, number) for number in range(60)]
+        for thread in threads:
+            thread.join(30)
+
+        # Every thread got its own answer...
+        self.assertEqual(results, dict((number, number) for number in range(60)))
+        # ...and each prompt's output wasn't interrupted by another thread's.
+        writes = list(backend.writes)
+        while writes:
+            number = int(writes.pop(0)[:-2])
+            if number % 2:
+                self.assertEqual(writes[:2], ["'nope' is not an integer.\n", '%d> ' % (number)])
+                del writes[:2]
+
+    def test_sessions(self):
+        backend = NumberedPromptBackend()
+        results = {}
+
+        def askTwice(number):
+            with pyip.consoleSession(backend):
+                results[number] = (pyip.inputInt('%d> ' % (number), ioBackend=backend),
+                                   pyip.IntPrompt('%d> ' % (number + 100), ioBackend=backend).ask())
+
+        threads = [startThread(askTwice, number) for number in range(0, 60, 2)]
+        for thread in threads:
+            thread.join(30)
+        self.assertEqual(results, dict((number, (number, number + 100)) for number in range(0, 60, 2)))
+        for i in range(0, len(backend.writes), 2):
+            self.assertEqual(int(backend.writes[i][:-2]) + 100, int(backend.writes[i + 1][:-2]))
+
+    def test_form(self):
+        backend = NumberedPromptBackend()
+        form = pyip.Form([('first', 'inputInt', {'prompt': '1> '}), ('second', 'inputInt', {'prompt': '2> '})],
+                         ioBackend=backend)
+        results = []
+        threads = [startThread(lambda: results.append(form.ask())) for i in range(20)]
+        for thread in threads:
+            thread.join(30)
+        self.assertEqual(results, [(1, 2)] * 20)
+        self.assertEqual(backend.writes, ['1> ', "'nope' is not an integer.\n", '1> ', '2> '] + ['1> ', '2> '] * 19)
+
+
+class test_asyncPrompts(unittest.TestCase):
+    def test_asyncAndThreadPromptsTakeTurns(self):
+        backend = NumberedPromptBackend()
+        consoleLock = backend.getConsoleLock()
+        results = []
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(time.time())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            tickerTask = asyncio.ensure_future(ticker())
+            result = await pyip.ainputInt('1> ', ioBackend=backend)
+            tickerTask.cancel()
+            return result
+
+        with pyip.consoleSession(backend):
+            thread = startThread(lambda: results.append(pyip.inputInt('3> ', ioBackend=backend)))
+            waitForWaiters(consoleLock, 1)
+            asyncThread = startThread(lambda: results.append(asyncio.run(main())))
+            waitForWaiters(consoleLock, 2)
+            time.sleep(0.1)
+        thread.join(30)
+        asyncThread.join(30)
+        self.assertEqual(results, [3, 1])
+        self.assertEqual(backend.writes, ['3> ', "'nope' is not an integer.\n", '3> ', '1> ', "'nope' is not an integer.\n", '1> '])
+        self.assertGreater(len(ticks), 5) # The event loop kept running while the prompt waited for the lock.
+        self.assertIsNone(consoleLock._owner)
+
+    def test_asyncTimeoutWhileWaiting(self):
+        backend = NumberedPromptBackend()
+        results = []
+
+        async def main():
+            results.append(await pyip.ainputInt('1> ', timeout=0.1, default='7', ioBackend=backend))
+            try:
+                await pyip.ainputInt('2> ', timeout=0.1, ioBackend=backend)
+            except pyip.TimeoutException as exc:
+                results.append(exc)
+
+        with pyip.consoleSession(backend):
+            startThread(asyncio.run, main()).join(30)
+        self.assertEqual(results[0], 7)
+        self.assertIsInstance(results[1], pyip.TimeoutException)
+        self.assertEqual(backend.writes, []) # Neither prompt was displayed.
+
+
+class test_priority(unittest.TestCase):
+    def tearDown(self):
+        pyip.setConsolePriority(0)
+
+    def test_priorityOrder(self):
+        backend = NumberedPromptBackend()
+        consoleLock = backend.getConsoleLock()
+
+        def ask(number, priority):
+            pyip.setConsolePriority(priority)
+            pyip.inputInt('%d> ' % (number), ioBackend=backend)
+
+        with pyip.consoleSession(backend):
+            threads = []
+            for i, (number, priority) in enumerate([(10, 1), (20, 5), (30, 3), (40, 5), (50, 0)]):
+                threads.append(startThread(ask, number, priority))
+                waitForWaiters(consoleLock, i + 1)
+        for thread in threads:
+            thread.join(30)
+        self.assertEqual(backend.writes, ['20> ', '40> ', '30> ', '10> ', '50> '])
+
+    def test_sessionPriority(self):
+        self.assertEqual(pyip.getConsolePriority(), 0)
+        pyip.setConsolePriority(2.5)
+        self.assertEqual(pyip.getConsolePriority(), 2.5)
+        self.assertRaises(pyip.PyInputPlusException, pyip.setConsolePriority, 'high')
+
+        # Each thread has its own priority.
+        priorities = []
+        startThread(lambda: priorities.append(pyip.getConsolePriority())).join(30)
+        self.assertEqual(priorities, [0])
+
+
+class test_timeouts(unittest.TestCase):
+    def test_timeoutWhileWaiting(self):
+        backend = NumberedPromptBackend()
+        results = []
+
+        def ask():
+            results.append(pyip.inputInt('1> ', timeout=0.1, default='7', ioBackend=backend))
+            try:
+                pyip.IntPrompt('2> ', timeout=0.1, ioBackend=backend).ask()
+            except pyip.TimeoutException as exc:
+                results.append(exc)
+
+        with pyip.consoleSession(backend):
+            startThread(ask).join(30)
+        self.assertEqual(results[0], 7)
+        self.assertIsInstance(results[1], pyip.TimeoutException)
+        self.assertEqual(backend.writes, []) # Neither prompt was displayed.
+
+    def test_waitCountsTowardTimeout(self):
+        backend = NumberedPromptBackend()
+        results = []
+        with pyip.consoleSession(backend):
+            thread = startThread(lambda: results.append(pyip.inputInt('2> ', timeout=5, strictTimeout=True,
+                                                                      ioBackend=backend)))
+            waitForWaiters(backend.getConsoleLock(), 1)
+            time.sleep(0.5)
+        thread.join(30)
+        self.assertEqual(results, [2])
+        self.assertLessEqual(backend.readTimeouts[0], 4.5)
+
+    def test_sessionTimeout(self):
+        backend = NumberedPromptBackend()
+        errors = []
+
+        def startSession():
+            try:
+                with pyip.consoleSession(backend, timeout=0.1):
+                    pass
+            except pyip.TimeoutException as exc:
+                errors.append(exc)
+
+        with pyip.consoleSession(backend):
+            startThread(startSession).join(30)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(backend.getConsoleLock()._waiters, [])
+
+
+class test_ConsoleLock(unittest.TestCase):
+    def test_reentrant(self):
+        consoleLock = pyip.ConsoleLock()
+        self.assertTrue(consoleLock.acquire())
+        self.assertTrue(consoleLock.acquire(timeout=0))
+        consoleLock.release()
+
+        acquired = []
+        startThread(lambda: acquired.append(consoleLock.acquire(timeout=0.05))).join(30)
+        self.assertEqual(acquired, [False])
+        consoleLock.release()
+        startThread(lambda: acquired.append(consoleLock.acquire(timeout=0))).join(30)
+        self.assertEqual(acquired, [False, True])
+
+    def test_releaseByOtherThread(self):
+        consoleLock = pyip.ConsoleLock()
+        self.assertRaises(RuntimeError, consoleLock.release)
+        with consoleLock:
+            errors = []
+
+            def release():
+                try:
+                    consoleLock.release()
+                except RuntimeError as exc:
+                    errors.append(exc)
+
+            startThread(release).join(30)
+            self.assertEqual(len(errors), 1)
+
+    def test_stdioBackendsShareALock(self):
+        self.assertIs(pyip.StdIOBackend().getConsoleLock(), pyip.StdIOBackend().getConsoleLock())
+        backend = pyip.ScriptedIOBackend([])
+        self.assertIs(backend.getConsoleLock(), backend.getConsoleLock())
+        self.assertIsNot(backend.getConsoleLock(), pyip.ScriptedIOBackend([]).getConsoleLock())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,34 @@
+from __future__ import absolute_import, division, print_function
+
+import subprocess
+import sys
+import unittest
+
+
+def importedModules(code):
+    """Runs code in a new interpreter after `import pyinputplus as pyip` and
+    returns the names of the modules imported."""
+    output = subprocess.check_output([sys.executable, '-c',
+                                      'import sys\nimport pyinputplus as pyip\n' + code + '\nprint(" ".join(sys.modules))'],
+                                     universal_newlines=True)
+    return set(output.split())
+
+
+class test_lazyImports(unittest.TestCase):
+    def test_importIsMinimal(self):
+        modules = importedModules('')
+        for moduleName in ('pysimplevalidate', 'stdiomask', 'threading', 'queue', 'asyncio'):
+            self.assertNotIn(moduleName, modules)
+
+    def test_importedOnFirstUse(self):
+        modules = importedModules('assert pyip.inputStr(ioBackend=pyip.ScriptedIOBackend(["hi"])) == "hi"')
+        self.assertIn('pysimplevalidate', modules)
+        self.assertNotIn('stdiomask', modules)
+
+        modules = importedModules('assert pyip.pysv.validateNum("42") == 42\n'
+                                  'assert pyip.pysv is sys.modules["pysimplevalidate"]')
+        self.assertIn('pysimplevalidate', modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,317 @@
+from __future__ import absolute_import, division, print_function
+
+import io
+import json
+import os
+import sys
+import time
+import unittest
+
+import pyinputplus as pyip
+
+
+class test_ScriptedIOBackend(unittest.TestCase):
+    def test_answers(self):
+        backend = pyip.ScriptedIOBackend(['forty', '42'])
+        self.assertEqual(pyip.inputInt('> ', ioBackend=backend), 42)
+        self.assertEqual(backend.getOutput(), "> 'forty' is not an integer.\n> ")
+
+    def test_limitAndDefault(self):
+        backend = pyip.ScriptedIOBackend(['x', 'y'])
+        self.assertEqual(pyip.inputNum(limit=2, default='N/A', ioBackend=backend), 'N/A')
+        backend = pyip.ScriptedIOBackend(['x', 'y'])
+        self.assertRaises(pyip.RetryLimitException, pyip.inputNum, limit=2, ioBackend=backend)
+
+    def test_noResponse(self):
+        backend = pyip.ScriptedIOBackend([None, 'cat'])
+        self.assertEqual(pyip.inputStr('> ', attemptTimeout=1, ioBackend=backend), 'cat')
+        self.assertEqual(backend.getOutput(), '> \n> ')
+
+        backend = pyip.ScriptedIOBackend([None])
+        self.assertEqual(pyip.inputStr(timeout=1, strictTimeout=True, default='def', ioBackend=backend), 'def')
+
+        backend = pyip.ScriptedIOBackend([None])
+        self.assertRaises(pyip.PyInputPlusException, pyip.inputStr, ioBackend=backend)
+
+    def test_eof(self):
+        backend = pyip.ScriptedIOBackend(['invalid'])
+        self.assertRaises(EOFError, pyip.inputInt, ioBackend=backend)
+
+    def test_password(self):
+        backend = pyip.ScriptedIOBackend(['swordfish'])
+        self.assertEqual(pyip.inputPassword('Password: ', ioBackend=backend), 'swordfish')
+
+    def test_promptObject(self):
+        backend = pyip.ScriptedIOBackend(['3', '1', 'dog'])
+        menuPrompt = pyip.MenuPrompt(['cat', 'dog'], numbered=True, ioBackend=backend)
+        self.assertEqual(menuPrompt.ask(), 'cat')
+        self.assertEqual(menuPrompt.ask(), 'dog')
+
+
+class test_replay(unittest.TestCase):
+    def test_replay(self):
+        with pyip.replay(['forty', '42', 'maybe', 'perhaps']) as backend:
+            self.assertEqual(pyip.inputInt('Number: '), 42)
+            self.assertEqual(pyip.YesNoPrompt('Again? ', limit=2, default='no').ask(), 'no')
+            self.assertIsInstance(backend, pyip.ScriptedIOBackend)
+        self.assertIsInstance(pyip.getIOBackend(), pyip.StdIOBackend)
+
+    def test_transcriptList(self):
+        transcript = []
+        with pyip.replay(['forty', '42', 'x'], transcript=transcript):
+            pyip.inputInt('> ')
+            self.assertRaises(pyip.RetryLimitException, pyip.inputInt, '> ', limit=1)
+        self.assertEqual(transcript[:6], [('prompt', '> '), ('input', 'forty'), ('message', "'forty' is not an integer."),
+                                          ('prompt', '> '), ('input', '42'), ('result', 42)])
+        self.assertEqual(transcript[6:9], [('prompt', '> '), ('input', 'x'), ('message', "'x' is not an integer.")])
+        self.assertEqual(transcript[9][0], 'exception')
+        self.assertIsInstance(transcript[9][1], pyip.RetryLimitException)
+
+    def test_transcriptFile(self):
+        transcript = io.StringIO()
+        with pyip.replay([None, 'cat'], transcript=transcript):
+            pyip.inputStr('> ', attemptTimeout=1)
+        self.assertEqual(transcript.getvalue(), "prompt: '> '\ninput: None\nprompt: '> '\ninput: 'cat'\nresult: 'cat'\n")
+
+    def test_answersFile(self):
+        answersFile = io.StringIO('forty\n42\nyes')
+        with pyip.replay(answersFile):
+            self.assertEqual(pyip.inputInt(), 42)
+            self.assertEqual(pyip.inputYesNo(), 'yes')
+            self.assertRaises(EOFError, pyip.inputStr)
+
+    def test_restoresBackendOnException(self):
+        originalBackend = pyip.getIOBackend()
+        with self.assertRaises(EOFError):
+            with pyip.replay([]):
+                pyip.inputStr()
+        self.assertIs(pyip.getIOBackend(), originalBackend)
+
+
+class test_setIOBackend(unittest.TestCase):
+    def tearDown(self):
+        pyip.setIOBackend(None)
+
+    def test_setIOBackend(self):
+        backend = pyip.ScriptedIOBackend(['yes', 'no'])
+        pyip.setIOBackend(backend)
+        self.assertIs(pyip.getIOBackend(), backend)
+        self.assertEqual(pyip.inputYesNo(), 'yes')
+
+        # The ioBackend argument overrides the global backend.
+        self.assertEqual(pyip.inputYesNo(ioBackend=pyip.ScriptedIOBackend(['yes'])), 'yes')
+        self.assertEqual(pyip.inputYesNo(), 'no')
+
+        pyip.setIOBackend(None)
+        self.assertIsInstance(pyip.getIOBackend(), pyip.StdIOBackend)
+
+    def test_invalidBackend(self):
+        self.assertRaises(pyip.PyInputPlusException, pyip.setIOBackend, io.StringIO())
+        self.assertRaises(pyip.PyInputPlusException, pyip.inputStr, ioBackend=io.StringIO())
+
+
+class test_FileIOBackend(unittest.TestCase):
+    def test_files(self):
+        output = io.StringIO()
+        backend = pyip.FileIOBackend(io.StringIO('cat\n42\n'), output)
+        self.assertEqual(pyip.inputInt('> ', ioBackend=backend), 42)
+        self.assertEqual(output.getvalue(), "> 'cat' is not an integer.\n> ")
+        self.assertRaises(EOFError, pyip.inputInt, ioBackend=backend)
+
+    def test_pipeTimeout(self):
+        readFd, writeFd = os.pipe()
+        with io.open(readFd, 'r') as inputFile:
+            backend = pyip.FileIOBackend(inputFile)
+            startTime = time.time()
+            self.assertEqual(pyip.inputStr(timeout=0.2, strictTimeout=True, default='def', ioBackend=backend), 'def')
+            self.assertLess(time.time() - startTime, 5)
+
+            # The line is read by the same reader thread after the timeout.
+            os.write(writeFd, b'hello\n')
+            self.assertEqual(pyip.inputStr(ioBackend=backend), 'hello')
+        os.close(writeFd)
+
+
+
+class CountingRawIO(io.RawIOBase):
+    """A raw binary stream that records each write, the way each write to a
+    terminal or pipe is a write() system call."""
+
+    def __init__(self):
+        self.writes = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.writes.append(bytes(data).decode('utf-8'))
+        return len(data)
+
+
+class test_bufferedOutput(unittest.TestCase):
+    def setUp(self):
+        self.originalStdin, self.originalStdout = sys.stdin, sys.stdout
+        self.raw = CountingRawIO()
+        # Like sys.stdout when it is a terminal.
+        sys.stdout = io.TextIOWrapper(io.BufferedWriter(self.raw), encoding='utf-8', line_buffering=True)
+
+    def tearDown(self):
+        sys.stdin, sys.stdout = self.originalStdin, self.originalStdout
+
+    def test_oneWritePerAttempt(self):
+        sys.stdin = io.StringIO('forty\nfifty\n42\n')
+        self.assertEqual(pyip.inputInt('> '), 42)
+        self.assertEqual(self.raw.writes, ['> ', "'forty' is not an integer.\n> ", "'fifty' is not an integer.\n> "])
+
+        sys.stdin = io.StringIO('moose\n2\n')
+        del self.raw.writes[:]
+        self.assertEqual(pyip.inputMenu(['cat', 'dog', 'cow'], numbered=True), 'dog')
+        self.assertEqual(len(self.raw.writes), 2)
+
+    def test_flushedWhenPromptFinishes(self):
+        sys.stdin = io.StringIO('x\n')
+        self.assertRaises(pyip.RetryLimitException, pyip.inputInt, '> ', limit=1)
+        self.assertRaises(EOFError, pyip.inputInt, '> ')
+        self.assertEqual(self.raw.writes, ['> ', "'x' is not an integer.\n", '> '])
+
+        sys.stdin = io.StringIO('y\n')
+        self.assertEqual(pyip.IntPrompt('> ', limit=1, default='3').ask(), 3)
+        self.assertEqual(self.raw.writes[-2:], ['> ', "'y' is not an integer.\n"])
+
+    def test_fileIOBackend(self):
+        output = CountingRawIO()
+        backend = pyip.FileIOBackend(io.StringIO('cat\n42\n'), io.TextIOWrapper(io.BufferedWriter(output), encoding='utf-8'))
+        self.assertEqual(pyip.inputInt('> ', ioBackend=backend), 42)
+        self.assertEqual(output.writes, ['> ', "'cat' is not an integer.\n> "])
+
+
+class test_StreamIOBackend(unittest.TestCase):
+    def test_errorsAsJson(self):
+        output, errors = io.StringIO(), io.StringIO()
+        backend = pyip.StreamIOBackend(io.StringIO('forty\n42\nx\ny\n'), output, errors)
+        self.assertEqual(pyip.inputInt('> ', ioBackend=backend), 42)
+        self.assertRaises(pyip.RetryLimitException, pyip.inputInt, '> ', limit=2, ioBackend=backend)
+        self.assertRaises(EOFError, pyip.inputInt, ioBackend=backend)
+        self.assertEqual(output.getvalue(), '') # Prompts aren't shown by default.
+        self.assertEqual([json.loads(line) for line in errors.getvalue().splitlines()],
+                         [{'line': 1, 'input': 'forty', 'error': "'forty' is not an integer."},
+                          {'line': 3, 'input': 'x', 'error': "'x' is not an integer."},
+                          {'line': 4, 'input': 'y', 'error': "'y' is not an integer."}])
+
+    def test_showPrompts(self):
+        output = io.StringIO()
+        backend = pyip.StreamIOBackend(io.StringIO('cat'), output, io.StringIO(), showPrompts=True)
+        self.assertEqual(pyip.inputStr('Pet: ', ioBackend=backend), 'cat') # The last line doesn't need a newline.
+        self.assertEqual(output.getvalue(), 'Pet: ')
+
+    def test_blocks(self):
+        # A pipe is read through its binary buffer, in blocks, even if a
+        # block ends in the middle of a line or of a multi-byte character.
+        readFd, writeFd = os.pipe()
+        os.write(writeFd, 'caf\u00e9\r\n42\n'.encode('utf-8') + b'\n'.join([b'7'] * 1000))
+        os.close(writeFd)
+        with io.open(readFd, 'r', encoding='utf-8') as inputFile:
+            backend = pyip.StreamIOBackend(inputFile, errorFile=io.StringIO(), blockSize=4)
+            self.assertEqual(pyip.inputStr(ioBackend=backend), 'caf\u00e9')
+            self.assertEqual(pyip.inputInt(ioBackend=backend), 42)
+            self.assertEqual(sum(pyip.inputInt(ioBackend=backend) for i in range(1000)), 7000)
+            self.assertEqual(backend.lineNumber, 1002)
+            self.assertRaises(EOFError, pyip.inputInt, ioBackend=backend)
+
+    def test_pipeTimeout(self):
+        readFd, writeFd = os.pipe()
+        with io.open(readFd, 'r') as inputFile:
+            backend = pyip.StreamIOBackend(inputFile)
+            self.assertEqual(pyip.inputStr(timeout=0.2, strictTimeout=True, default='def', ioBackend=backend), 'def')
+            os.write(writeFd, b'hello\nworld\n')
+            self.assertEqual(pyip.inputStr(ioBackend=backend), 'hello')
+            self.assertEqual(pyip.inputStr(ioBackend=backend), 'world')
+        os.close(writeFd)
+
+    def test_autoIOBackend(self):
+        originalStdin = sys.stdin
+        sys.stdin = io.StringIO('42\n')
+        try:
+            backend = pyip.autoIOBackend()
+            self.assertIsInstance(backend, pyip.StreamIOBackend)
+            self.assertEqual(pyip.inputInt(ioBackend=backend), 42)
+        finally:
+            sys.stdin = originalStdin
+
+
+class test_KeystrokeIOBackend(unittest.TestCase):
+    def readKeystrokes(self, keys, isValidPrefix=lambda text: text.isdigit(), deadline=None, complete=None,
+                       history=None):
+        keys = list(keys)
+        output = []
+        result = pyip._readKeystrokes(lambda timeout: keys.pop(0) if keys else None, output.append, isValidPrefix,
+                                      deadline, complete, history)
+        return result, ''.join(output)
+
+    def test_rejectedKeys(self):
+        self.assertEqual(self.readKeystrokes('4x2\n'), ('42', '4\a2\n'))
+        self.assertEqual(self.readKeystrokes('1\x7f\x7f2\x1b\r'), ('2', '1\b \b2\n'))
+        self.assertEqual(self.readKeystrokes('4\x04\n'), ('4', '4\n'))
+        self.assertEqual(self.readKeystrokes('4', deadline=0), (None, '4\n'))
+        self.assertRaises(EOFError, self.readKeystrokes, '\x04')
+        self.assertRaises(KeyboardInterrupt, self.readKeystrokes, '4\x03')
+
+    def test_completion(self):
+        complete = pyip.ChoicePrompt(['dog', 'donkey', 'cat'])._complete
+        self.assertEqual(self.readKeystrokes('d\tn\t\n', None, complete=complete), ('donkey', 'donkey\n'))
+        self.assertEqual(self.readKeystrokes('x\t\n', None, complete=complete), ('x', 'x\a\n'))
+        self.assertEqual(self.readKeystrokes('\t\n', None), ('', '\a\n')) # Without a complete function.
+        # Completing can change the case of what was typed.
+        self.assertEqual(self.readKeystrokes('C\t\n', None, complete=lambda text: 'cat'),
+                         ('cat', 'C\b \bcat\n'))
+
+    def test_history(self):
+        up, down = pyip._KEY_UP, pyip._KEY_DOWN
+        history = ['7', 'seven', '42']
+        self.assertEqual(self.readKeystrokes([up, '\n'], history=history), ('42', '42\n'))
+        # Entries that aren't valid prefixes are skipped.
+        self.assertEqual(self.readKeystrokes([up, up, '\n'], history=history), ('7', '42\b\b  \b\b7\n'))
+        self.assertEqual(self.readKeystrokes([up, up, up, '\n'], history=history),
+                         ('7', '42\b\b  \b\b7\a\n'))
+        # Going back down restores what was typed.
+        self.assertEqual(self.readKeystrokes(['4', up, down, down, '\n'], history=history),
+                         ('4', '42\b \b\a\n'))
+        self.assertEqual(self.readKeystrokes([up, '\n']), ('', '\a\n'))
+
+    @unittest.skipIf(sys.platform == 'win32', 'pseudoterminals are not available on Windows')
+    def test_terminal(self):
+        import pty
+        masterFd, slaveFd = pty.openpty()
+        originalStdin, originalStdout = sys.stdin, sys.stdout
+        sys.stdin, sys.stdout = io.open(slaveFd, 'r'), io.StringIO()
+        try:
+            # The arrow key's escape sequence and the letters are skipped.
+            os.write(masterFd, b'-4\x1b[Dx2\n9\n')
+            backend = pyip.KeystrokeIOBackend()
+            self.assertEqual(pyip.inputInt('> ', min=1, max=10, limit=2, ioBackend=backend), 9)
+            self.assertEqual(sys.stdout.getvalue(), '> \a4\a2\nNumber must be at maximum 10.\n> 9\n')
+
+            # Prompts that can't check partial responses accept any keys.
+            os.write(masterFd, b'hello\n')
+            self.assertEqual(pyip.inputStr(ioBackend=backend), 'hello')
+
+            # The up arrow key recalls the previous response, and Tab completes choices.
+            sys.stdout = io.StringIO()
+            os.write(masterFd, b'\x1b[A\n\x1bOAx\ndo\t\n')
+            self.assertEqual(pyip.inputStr(ioBackend=backend), 'hello')
+            self.assertEqual(pyip.inputStr(ioBackend=backend), 'hellox')
+            self.assertEqual(pyip.inputChoice(['dog', 'cat'], prompt='', ioBackend=backend), 'dog')
+            self.assertEqual(sys.stdout.getvalue(), 'hello\nhellox\ndog\n')
+
+            sys.stdout = io.StringIO()
+            startTime = time.time()
+            self.assertEqual(pyip.inputInt(timeout=0.2, strictTimeout=True, default='7', ioBackend=backend), 7)
+            self.assertLess(time.time() - startTime, 5)
+        finally:
+            sys.stdin.close()
+            sys.stdin, sys.stdout = originalStdin, originalStdout
+            os.close(masterFd)
+
+
+if __name__ == '__main__':
+    unittest.main()
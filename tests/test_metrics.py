@@ -0,0 +1,130 @@
+from __future__ import absolute_import, division, print_function
+
+import json
+import time
+import unittest
+import warnings
+
+import pyinputplus as pyip
+
+
+class test_PromptMetrics(unittest.TestCase):
+    def setUp(self):
+        self.recorded = []
+        pyip.setMetricsCallback(self.recorded.append)
+
+    def tearDown(self):
+        pyip.setMetricsCallback(None)
+
+    def test_retries(self):
+        self.assertEqual(pyip.inputInt(ioBackend=pyip.ScriptedIOBackend(['forty', None, '42']), attemptTimeout=1), 42)
+        metrics, = self.recorded
+        self.assertEqual(metrics.promptType, 'IntPrompt')
+        self.assertEqual((metrics.tries, metrics.retries, metrics.invalidResponses), (3, 2, 1))
+        self.assertFalse(metrics.timedOut or metrics.limitReached or metrics.usedDefault)
+        self.assertIsNone(metrics.exception)
+        self.assertGreaterEqual(metrics.duration, metrics.waitTime)
+        self.assertGreater(metrics.validationTime, 0)
+        self.assertLessEqual(metrics.firstAnswerTime, metrics.duration)
+
+    def test_limitAndTimeout(self):
+        pyip.YesNoPrompt(limit=2, default='no', ioBackend=pyip.ScriptedIOBackend(['maybe', 'perhaps'])).ask()
+        self.assertTrue(self.recorded[-1].limitReached and self.recorded[-1].usedDefault)
+
+        self.assertRaises(pyip.TimeoutException, pyip.inputStr, timeout=0.01, strictTimeout=True,
+                          ioBackend=pyip.ScriptedIOBackend([None]))
+        self.assertTrue(self.recorded[-1].timedOut)
+        self.assertFalse(self.recorded[-1].usedDefault)
+        self.assertIsInstance(self.recorded[-1].exception, pyip.TimeoutException)
+        self.assertIsNone(self.recorded[-1].firstAnswerTime)
+
+    def test_menuCommandsAreNotTries(self):
+        pyip.inputMenu(['cat', 'dog'], pageSize=1, ioBackend=pyip.ScriptedIOBackend(['>', 'dog']))
+        self.assertEqual(self.recorded[-1].tries, 1)
+
+    def test_disabled(self):
+        pyip.setMetricsCallback(None)
+        self.assertIsNone(pyip.IntPrompt()._inputLoopArguments()['metrics'])
+        pyip.inputInt(ioBackend=pyip.ScriptedIOBackend(['42']))
+        self.assertEqual(self.recorded, [])
+        self.assertRaises(pyip.PyInputPlusException, pyip.setMetricsCallback, 'not a function')
+
+
+class test_validationBudget(unittest.TestCase):
+    def tearDown(self):
+        pyip.setValidationBudget(None)
+        pyip.setMetricsCallback(None)
+
+    def test_callback(self):
+        def slowValidation(value):
+            time.sleep(0.05)
+        slow = []
+        pyip.setValidationBudget(0.02, callback=slow.append)
+        self.assertEqual(pyip.inputCustom(slowValidation, applyFunc=str.upper, ioBackend=pyip.ScriptedIOBackend(['hi'])), 'HI')
+        self.assertEqual(len(slow), 1)
+        self.assertEqual(slow[0].stage, 'validationFunc')
+        self.assertGreaterEqual(slow[0].duration, 0.05)
+        self.assertEqual(slow[0].budget, 0.02)
+
+        # postValidateApplyFunc is timed even for prompts that convert the response.
+        pyip.inputInt(postValidateApplyFunc=lambda value: time.sleep(0.05) or value, ioBackend=pyip.ScriptedIOBackend(['4']))
+        self.assertEqual(slow[1].stage, 'postValidateApplyFunc')
+        self.assertIn('<lambda> took 0.05', str(slow[1]))
+
+    def test_warning(self):
+        pyip.setValidationBudget(0)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            pyip.inputStr(applyFunc=str.strip, ioBackend=pyip.ScriptedIOBackend(['hi']))
+        self.assertEqual([warning.message.stage for warning in caught], ['applyFunc', 'validationFunc'])
+        self.assertTrue(issubclass(caught[0].category, pyip.SlowValidationWarning))
+
+        self.assertRaises(pyip.PyInputPlusException, pyip.setValidationBudget, -1)
+        self.assertRaises(pyip.PyInputPlusException, pyip.setValidationBudget, 1, callback=42)
+
+    def test_stageTimes(self):
+        recorded = []
+        pyip.setMetricsCallback(recorded.append)
+        pyip.inputStr(applyFunc=lambda value: time.sleep(0.02) or value, ioBackend=pyip.ScriptedIOBackend(['hi']))
+        metrics = recorded[0]
+        self.assertGreaterEqual(metrics.applyFuncTime, 0.02)
+        self.assertEqual(metrics.postValidateApplyFuncTime, 0)
+        self.assertAlmostEqual(metrics.validationTime, metrics.applyFuncTime + metrics.validationFuncTime)
+
+
+class test_MetricsCollector(unittest.TestCase):
+    def tearDown(self):
+        pyip.setMetricsCallback(None)
+
+    def test_collector(self):
+        collector = pyip.MetricsCollector()
+        pyip.setMetricsCallback(collector)
+        with pyip.replay(['forty', '42', '7', 'maybe', 'perhaps']):
+            pyip.inputInt()
+            pyip.inputInt()
+            pyip.inputYesNo(limit=2, default='no')
+        self.assertEqual(collector.histogram('retries', 'IntPrompt').bucketCounts[:3], [1, 1, 0])
+        self.assertEqual(collector.histogram('retries').count, 3)
+        self.assertEqual(collector.histogram('waitTime', 'DatePrompt').count, 0)
+
+        report = json.loads(json.dumps(collector.export()))
+        self.assertEqual((report['all']['calls'], report['IntPrompt']['calls']), (3, 2))
+        self.assertEqual((report['YesNoPrompt']['limitReached'], report['all']['usedDefault']), (1, 1))
+        self.assertEqual(report['IntPrompt']['validationTime']['count'], 2)
+
+        collector.reset()
+        self.assertEqual(collector.export(), {})
+
+    def test_histogram(self):
+        histogram = pyip.Histogram((1, 2, 5))
+        self.assertIsNone(histogram.percentile(50))
+        for value in (0.5, 1.5, 1.8, 2, 7):
+            histogram.add(value)
+        self.assertEqual(histogram.bucketCounts, [1, 3, 0, 1])
+        self.assertEqual((histogram.min, histogram.max, histogram.count), (0.5, 7, 5))
+        self.assertEqual((histogram.percentile(20), histogram.percentile(50), histogram.percentile(100)), (1, 2, 7))
+        self.assertRaises(ValueError, pyip.Histogram, (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
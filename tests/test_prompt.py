@@ -0,0 +1,678 @@
+from __future__ import absolute_import, division, print_function
+
+import datetime
+import io
+import os
+import re
+import shutil
+import sys
+import tempfile
+import unittest
+
+import pyinputplus as pyip
+import pysimplevalidate as pysv
+from pyinputplus.testing import FakeConsole
+
+
+def answer(func, text):
+    """Calls func() with stdin replaced by text, and returns a tuple of
+    func()'s return value and the captured output."""
+    originalStdin, originalStdout = sys.stdin, sys.stdout
+    sys.stdin, sys.stdout = io.StringIO(text), io.StringIO()
+    try:
+        result = func()
+        return result, sys.stdout.getvalue()
+    finally:
+        sys.stdin, sys.stdout = originalStdin, originalStdout
+
+
+class test_Prompt(unittest.TestCase):
+    def test_askRepeatedly(self):
+        prompt = pyip.NumPrompt('Percent> ', min=0, max=100)
+        self.assertEqual(answer(prompt.ask, '42\n'), (42, 'Percent> '))
+        self.assertEqual(answer(prompt.ask, '101\n7\n'), (7, 'Percent> Number must be at maximum 100.\nPercent> '))
+
+    def test_argumentsCheckedOnCreation(self):
+        with self.assertRaises(pyip.PyInputPlusException):
+            pyip.StrPrompt(prompt=42)
+        with self.assertRaises(pyip.PyInputPlusException):
+            pyip.PasswordPrompt(mask='**')
+        with self.assertRaises(pysv.PySimpleValidateException):
+            pyip.NumPrompt(min=5, greaterThan=4)
+        with self.assertRaises(pysv.PySimpleValidateException):
+            pyip.ChoicePrompt(['cat', 'CAT'])
+
+    def test_limitAndDefault(self):
+        prompt = pyip.IntPrompt(limit=2, default='5', postValidateApplyFunc=lambda x: x * 2)
+        self.assertEqual(answer(prompt.ask, '42.0\n'), (84, ''))
+        # Like inputInt(), postValidateApplyFunc is applied to the default value too.
+        self.assertEqual(answer(prompt.ask, 'x\ny\n')[0], 10)
+
+        prompt = pyip.StrPrompt(limit=1)
+        with self.assertRaises(pyip.RetryLimitException):
+            answer(prompt.ask, '\n')
+
+    def test_menu(self):
+        prompt = pyip.MenuPrompt(['dog', 'cat'], numbered=True)
+        self.assertEqual(prompt.prompt, 'Please select one of the following:\n1. dog\n2. cat\n')
+        self.assertEqual(answer(prompt.ask, '2\n')[0], 'cat')
+        self.assertEqual(answer(prompt.ask, 'DOG\n')[0], 'dog')
+
+    def test_inputFunctionsUsePrompts(self):
+        self.assertEqual(answer(lambda: pyip.inputYesNo(), 'Y\n')[0], 'yes')
+        self.assertEqual(answer(lambda: pyip.inputBool(), 'f\n')[0], False)
+        self.assertEqual(answer(lambda: pyip.inputRegexStr(), 'a+\n')[0], 'a+')
+        self.assertEqual(answer(lambda: pyip.inputIp(), '127.0.0.1\n')[0], '127.0.0.1')
+        self.assertEqual(answer(lambda: pyip.inputCustom(lambda value: value.upper()), 'hi\n')[0], 'HI')
+
+
+class test_validateMany(unittest.TestCase):
+    def test_validateMany(self):
+        results = list(pyip.validateMany(pyip.inputInt, ['42', ' 7 ', 'cat'], min=0))
+        self.assertEqual(results[:2], [('42', 42), (' 7 ', 7)])
+        self.assertEqual(results[2][0], 'cat')
+        self.assertIsInstance(results[2][1], pysv.ValidationException)
+
+        results = pyip.validateMany('inputChoice', ['DOG', 'moose'], choices=['dog', 'cat'], blockRegexes=['moose'])
+        self.assertEqual(next(results), ('DOG', 'dog'))
+        self.assertEqual(str(next(results)[1]), 'This response is invalid.')
+
+        prompt = pyip.StrPrompt(applyFunc=str.lower, postValidateApplyFunc=str.title)
+        self.assertEqual(list(pyip.validateMany(prompt, ['HELLO WORLD'])), [('HELLO WORLD', 'Hello World')])
+
+    def test_lazy(self):
+        def values():
+            yield 'yes'
+            raise AssertionError('values should be consumed one at a time')
+        results = pyip.validateMany(pyip.YesNoPrompt, values())
+        self.assertEqual(next(results), ('yes', 'yes'))
+
+    def test_argumentsCheckedImmediately(self):
+        with self.assertRaises(pyip.PyInputPlusException):
+            pyip.validateMany('inputNothing', [])
+        with self.assertRaises(pysv.PySimpleValidateException):
+            pyip.validateMany(pyip.inputNum, [], min=5, greaterThan=4)
+        with self.assertRaises(pyip.PyInputPlusException):
+            pyip.validateMany(pyip.StrPrompt(), [], blank=True)
+
+
+class test_form(unittest.TestCase):
+    def makeForm(self, answers, **kwargs):
+        self.backend = pyip.ScriptedIOBackend(answers)
+        return pyip.Form([('name', 'inputStr', {'prompt': 'Name: '}),
+                          ('age', pyip.inputInt, {'prompt': 'Age: ', 'min': 0}),
+                          ('pet', pyip.ChoicePrompt(['dog', 'cat'], prompt='Pet: '))],
+                         ioBackend=self.backend, **kwargs)
+
+    def test_fieldByField(self):
+        record = self.makeForm(['Al', '-1', '42', 'DOG']).ask()
+        self.assertEqual(record, ('Al', 42, 'dog'))
+        self.assertEqual(record.age, 42)
+        self.assertEqual(self.backend.getOutput(), 'Name: Age: Number must be at minimum 0.\nAge: Pet: ')
+
+    def test_records(self):
+        self.assertEqual(self.makeForm(['Al, 42, cat'], acceptRecords=True).ask(), ('Al', 42, 'cat'))
+        self.assertEqual(self.makeForm(['"Sweigart, Al",42,cat'], acceptRecords=True).ask().name, 'Sweigart, Al')
+        self.assertEqual(self.makeForm(['pet=cat, age=42', 'Al'], acceptRecords=True).ask(), ('Al', 42, 'cat'))
+
+        # Invalid and missing fields of name=value pairs are asked for separately.
+        form = self.makeForm(['name=Al, age=forty, pet=moose', '42', 'dog'], acceptRecords=True)
+        self.assertEqual(form.ask(), ('Al', 42, 'dog'))
+        self.assertEqual(self.backend.getOutput(), "Name: age: 'forty' is not an integer.\npet: 'moose' is not a valid choice.\nAge: Pet: ")
+
+        # Comma-separated values with an invalid value are an answer to the
+        # first field, so a free-text first field can have commas in it.
+        form = self.makeForm(['Smith, John, cat', '42', 'cat'], acceptRecords=True)
+        self.assertEqual(form.ask(), ('Smith, John, cat', 42, 'cat'))
+        self.assertEqual(self.backend.getOutput(), 'Name: Age: Pet: ')
+
+        # Records aren't accepted by default, so a line with commas is just an answer.
+        self.assertEqual(self.makeForm(['Al, 42, cat', '42', 'cat']).ask().name, 'Al, 42, cat')
+
+    def test_parseRecord(self):
+        form = self.makeForm([])
+        self.assertEqual(form.parseRecord('age=7, name=Zo, pet=dog'), ('Zo', 7, 'dog'))
+        for line in ('Zo, 7', 'age=7, name=Zo', 'Zo, -7, dog', 'color=red'):
+            self.assertRaises(pysv.ValidationException, form.parseRecord, line)
+
+    def test_sharedRetries(self):
+        with self.assertRaises(pyip.RetryLimitException):
+            self.makeForm(['Al', 'x', '42', 'moose', 'dog'], retries=1).ask()
+        self.assertEqual(self.makeForm(['Al', 'x', '42', 'dog'], retries=1).ask(), ('Al', 42, 'dog'))
+
+    def test_sharedTimeout(self):
+        form = self.makeForm(['Al', '42', 'dog'], timeout=0)
+        with self.assertRaises(pyip.TimeoutException):
+            form.ask()
+
+    def test_argumentsCheckedOnCreation(self):
+        for fields in ([], [('name',)], [('name', 'inputNothing')], [('a', 'inputStr'), ('a', 'inputInt')],
+                       [('not valid', 'inputStr')], [('_name', 'inputStr')]):
+            self.assertRaises(pyip.PyInputPlusException, pyip.Form, fields)
+        self.assertRaises(pyip.PyInputPlusException, pyip.Form, [('name', 'inputStr')], retries=-1)
+        with self.assertRaises(pysv.PySimpleValidateException):
+            pyip.Form([('age', 'inputNum', {'min': 5, 'greaterThan': 4})])
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class test_numbers(unittest.TestCase):
+    def test_exactIntegers(self):
+        prompt = pyip.IntPrompt(max=10 ** 30)
+        self.assertEqual(prompt.validate('9007199254740993'), 9007199254740993)
+        self.assertEqual(prompt.validate('123456789012345678901234567.0'), 123456789012345678901234567)
+        self.assertEqual(prompt.validate(' 1e3 '), 1000)
+        for value in ('1.5', '1e-400', 'inf', 'nan', '1e400', '0x10', 'cat'):
+            self.assertRaisesRegex(pysv.ValidationException, 'is not an integer', prompt.validate, value)
+        self.assertRaisesRegex(pysv.ValidationException, 'at maximum', prompt.validate, '1' + '0' * 31)
+
+        backend = pyip.ScriptedIOBackend(['12345678901234567891'])
+        self.assertEqual(pyip.inputInt(ioBackend=backend), 12345678901234567891)
+
+    def test_sameAsValidateNum(self):
+        values = ['42', '-7', '3.5', '42.0', '1e3', '1_000', 'abc', '', '  12 ', 'nan', '-inf', '.5', '+3']
+        for prompt, numType in ((pyip.NumPrompt, 'num'), (pyip.FloatPrompt, 'float'), (pyip.IntPrompt, 'int')):
+            for kwargs in ({}, {'min': 0, 'max': 10}, {'lessThan': 5, 'greaterThan': -5}, {'blank': True},
+                           {'strip': False}, {'allowRegexes': ['^a']}, {'blockRegexes': ['^4']}):
+                promptObj = prompt(**kwargs)
+                for value in values:
+                    try:
+                        expected = pysv.validateNum(value, _numType=numType, **kwargs)
+                    except pysv.ValidationException as exc:
+                        with self.assertRaises(pysv.ValidationException) as cm:
+                            promptObj.validate(value)
+                        self.assertEqual(str(cm.exception), str(exc))
+                    else:
+                        self.assertEqual(repr(promptObj.validate(value)), repr(expected))
+
+    def checkValidateArray(self, useNumpy):
+        numbers, invalid = pyip.IntPrompt(min=0).validateArray(['42', '-1', '9007199254740993', 'cat'], useNumpy=useNumpy)
+        self.assertEqual(list(numbers), [42, 0, 9007199254740993, 0])
+        self.assertEqual(list(invalid), [False, True, False, True])
+
+        numbers, invalid = pyip.IntPrompt(max=500).validateArray(['7', ' 1e2 ', '600', '', '--5', '+3', '\u0663'],
+                                                                 useNumpy=useNumpy)
+        self.assertEqual(list(numbers), [7, 100, 0, 0, 0, 3, 3])
+        self.assertEqual(list(invalid), [False, False, True, True, True, False, False])
+        numbers, invalid = pyip.IntPrompt().validateArray(['1e3', str(2 ** 70)], useNumpy=useNumpy)
+        self.assertEqual(list(numbers), [1000, 2 ** 70])
+        numbers, invalid = pyip.NumPrompt(lessThan=10).validateArray(['4', '2.5', '10'], useNumpy=useNumpy)
+        self.assertEqual((list(numbers), list(invalid)), ([4.0, 2.5, 0.0], [False, False, True]))
+        numbers, invalid = pyip.FloatPrompt(blank=True, blockRegexes=['^7']).validateArray(['1', '', '7'], useNumpy=useNumpy)
+        self.assertEqual((list(numbers), list(invalid)), ([1.0, 0.0, 0.0], [False, True, True]))
+
+        values = [str(i) for i in range(-500, 500)]
+        for prompt in (pyip.NumPrompt, pyip.IntPrompt, pyip.FloatPrompt):
+            promptObj = prompt(greaterThan=-50, max=199)
+            numbers, invalid = promptObj.validateArray(values, useNumpy=useNumpy)
+            self.assertEqual(list(invalid), [not -50 < int(value) <= 199 for value in values])
+            self.assertEqual(list(numbers), [0 if isInvalid else promptObj.validate(value)
+                                             for value, isInvalid in zip(values, invalid)])
+        return numbers
+
+    def test_validateArray(self):
+        numbers = self.checkValidateArray(useNumpy=False)
+        self.assertEqual(numbers.typecode, 'd')
+        self.assertIsInstance(pyip.IntPrompt().validateArray([str(2 ** 70)], useNumpy=False)[0], list)
+
+    @unittest.skipIf(numpy is None, 'NumPy is not installed')
+    def test_validateArrayWithNumpy(self):
+        numbers = self.checkValidateArray(useNumpy=True)
+        self.assertEqual(numbers.dtype, numpy.float64)
+        numbers, invalid = pyip.IntPrompt().validateArray(['1', '2'])
+        self.assertEqual((numbers.dtype, invalid.dtype), (numpy.int64, numpy.bool_))
+        self.assertEqual(pyip.IntPrompt().validateArray([str(2 ** 70)])[0].dtype, object)
+
+    @unittest.skipIf(numpy is not None, 'NumPy is installed')
+    def test_useNumpyWithoutNumpy(self):
+        self.assertRaises(pyip.PyInputPlusException, pyip.IntPrompt().validateArray, ['1'], useNumpy=True)
+
+
+class test_choiceIndex(unittest.TestCase):
+    def test_sameAsValidateChoice(self):
+        choices = ['dog', 'Cat', '2', '']
+        for kwargs in ({}, {'numbered': True}, {'lettered': True}, {'caseSensitive': True}):
+            prompt = pyip.MenuPrompt(choices, **kwargs)
+            for value in ['dog', 'DOG', ' cat ', '1', '2', '4', '5', 'a', 'B', 'd', '', 'moose']:
+                try:
+                    expected = pysv.validateChoice(value, choices, **kwargs)
+                except pysv.ValidationException as exc:
+                    with self.assertRaises(pysv.ValidationException) as cm:
+                        prompt.validate(value)
+                    self.assertEqual(str(cm.exception), str(exc))
+                else:
+                    self.assertEqual(prompt.validate(value), expected)
+
+    def test_menuResult(self):
+        choices = ['SKU%05d' % (i) for i in range(10000)]
+        backend = pyip.ScriptedIOBackend(['sku09999', '10001', '5000'])
+        prompt = pyip.MenuPrompt(choices, numbered=True, limit=1, default='1', ioBackend=backend)
+        self.assertEqual(prompt.ask(), 'SKU09999')
+        self.assertEqual(prompt.ask(), 'SKU00000') # The default value is also turned into the choice it selects.
+        self.assertEqual(prompt.ask(), 'SKU04999')
+
+    def test_choiceIgnoresCaseSensitive(self):
+        # inputChoice() has always ignored the caseSensitive argument.
+        self.assertEqual(pyip.ChoicePrompt(['dog', 'cat'], caseSensitive=True).validate('DOG'), 'dog')
+
+
+class test_pagedMenu(unittest.TestCase):
+    def setUp(self):
+        self.choices = ['SKU%05d' % (i) for i in range(10000)]
+
+    def test_pages(self):
+        backend = pyip.ScriptedIOBackend(['<', '>', '>', '<', '4'])
+        prompt = pyip.MenuPrompt(self.choices, numbered=True, pageSize=2, limit=1, ioBackend=backend)
+        self.assertEqual(prompt.ask(), 'SKU00003') # Paging commands don't count toward the limit.
+        pages = backend.getOutput().split('(Enter > or < to see the next or previous page, or /text to only list the choices containing text.)\n')
+        self.assertEqual(pages[0], 'Please select one of the following (page 1 of 5000):\n1. SKU00000\n2. SKU00001\n')
+        self.assertEqual(pages[1], pages[0]) # There's no page before the first page.
+        self.assertEqual(pages[2], 'Please select one of the following (page 2 of 5000):\n3. SKU00002\n4. SKU00003\n')
+        self.assertEqual(pages[4], pages[2])
+        self.assertEqual(len(pages), 6)
+
+    def test_filter(self):
+        backend = pyip.ScriptedIOBackend(['/ku0999', '/ku09998', '/moose', '/', 'sku09998'])
+        prompt = pyip.MenuPrompt(self.choices, pageSize=3, prompt='SKU> ', ioBackend=backend)
+        self.assertEqual(prompt.ask(), 'SKU09998')
+        output = backend.getOutput()
+        self.assertIn("Choices containing 'ku0999' (page 1 of 4):\n* SKU09990\n* SKU09991\n* SKU09992\n", output)
+        self.assertIn("Choices containing 'ku09998' (page 1 of 1):\n* SKU09998\n", output)
+        self.assertIn("No choices contain 'moose'.\n(Enter", output)
+        self.assertTrue(output.endswith('Please select one of the following (page 1 of 3334):\n* SKU00000\n* SKU00001\n* SKU00002\n'
+                                        '(Enter > or < to see the next or previous page, or /text to only list the choices containing text.)\nSKU> '))
+
+    def test_matchingChoices(self):
+        choices = ['apple', 'Pineapple', 'grape', 'APPLESAUCE', 'pear', 'ap']
+        prompt = pyip.MenuPrompt(choices, lettered=True, pageSize=2)
+        for filterText in ['APP', 'pple', 'ap', 'pear', 'applesauce!', 'p', 'apple']:
+            expected = [i for i in range(len(choices)) if filterText.upper() in choices[i].upper()]
+            self.assertEqual(list(prompt._matchingChoices(filterText)), expected)
+
+        # Choices are selected with the letter they have in the unfiltered menu.
+        backend = pyip.ScriptedIOBackend(['/sauce', 'D'])
+        self.assertEqual(pyip.inputMenu(choices, lettered=True, pageSize=2, ioBackend=backend), 'APPLESAUCE')
+        self.assertIn("Choices containing 'sauce' (page 1 of 1):\nD. APPLESAUCE\n", backend.getOutput())
+
+    def test_choicesAreNotCommands(self):
+        backend = pyip.ScriptedIOBackend(['>'])
+        self.assertEqual(pyip.inputMenu(['<', '>'], pageSize=1, ioBackend=backend), '>')
+        self.assertRaises(pyip.PyInputPlusException, pyip.MenuPrompt, ['cat', 'dog'], pageSize=0)
+
+
+class test_prefixes(unittest.TestCase):
+    def checkPrefixes(self, prompt, values, rejected):
+        prefixFunc = prompt._inputLoopArguments()['prefixFunc']
+        for value in values:
+            try:
+                prompt.validate(value)
+            except pysv.ValidationException:
+                continue
+            # Every beginning of a valid response must be accepted while it's typed.
+            for i in range(len(value) + 1):
+                self.assertTrue(prefixFunc(value[:i]), (type(prompt).__name__, value[:i]))
+        for text in rejected:
+            self.assertFalse(prefixFunc(text), (type(prompt).__name__, text))
+
+    def test_numbers(self):
+        values = ['42', '-7', '+3', '3.5', '42.0', '1e3', '1.5E-2', '1_000', '1_0.0_1', ' 12 ', '.5', '5.', '-0', '0',
+                  'inf', '-Infinity', 'nan', 'NaN', '-1e400']
+        for prompt in (pyip.NumPrompt, pyip.IntPrompt, pyip.FloatPrompt):
+            self.checkPrefixes(prompt(), values, ['a', '4a', '4 2', '--', '1__', '_1', '1._', '.e', '1e3e', '1ee'])
+            self.checkPrefixes(prompt(min=1), values, ['-', '-5'])
+            self.checkPrefixes(prompt(greaterThan=0), values, ['-'])
+            self.checkPrefixes(prompt(max=-1), values, ['5', '+', '.'])
+            self.checkPrefixes(prompt(lessThan=0), values, ['0'])
+            self.checkPrefixes(prompt(strip=False), values, [])
+        self.checkPrefixes(pyip.NumPrompt(), values, ['1e', 'inf', 'n'])
+        self.checkPrefixes(pyip.IntPrompt(), values, ['i', 'n'])
+        self.checkPrefixes(pyip.FloatPrompt(min=1), values, ['infinityx', '-i'])
+
+    def test_choices(self):
+        choices = ['dog', 'Cat', 'catapult', '2', 'ox']
+        values = ['dog', 'DOG', ' cat ', 'CATAP', 'catapult', '1', '2', '5', '05', 'a', 'E', 'ox']
+        self.checkPrefixes(pyip.ChoicePrompt(choices), values, ['x', 'dogs', 'catapults'])
+        self.checkPrefixes(pyip.MenuPrompt(choices), values, ['1', 'x', 'dogs'])
+        self.checkPrefixes(pyip.MenuPrompt(choices, caseSensitive=True), values, ['D', 'CAT'])
+        self.checkPrefixes(pyip.MenuPrompt(choices, numbered=True), values, ['6', '12', '1a'])
+        self.checkPrefixes(pyip.MenuPrompt(choices, lettered=True), values, ['f', 'ab'])
+        self.checkPrefixes(pyip.MenuPrompt(choices, strip='!'), values + ['!dog!'], [' '])
+
+    def test_yesNo(self):
+        values = ['yes', 'Y', 'no', 'N', 'oui', 'non', 'True', 'T', 'false']
+        self.checkPrefixes(pyip.YesNoPrompt(), values, ['x', 'yess', 'nope'])
+        self.checkPrefixes(pyip.YesNoPrompt(yesVal='oui', noVal='non', caseSensitive=True), values, ['O', 'y'])
+        self.checkPrefixes(pyip.BoolPrompt(), values, ['yes', 'Tr ue'])
+
+    def test_uncheckedPrompts(self):
+        # These prompts can't tell whether a partial response can become valid.
+        for prompt in (pyip.StrPrompt(), pyip.RegexPrompt('^a'), pyip.IntPrompt(allowRegexes=['^n/a$']),
+                       pyip.IntPrompt(applyFunc=lambda value: value.replace('x', '')),
+                       pyip.MenuPrompt(['cat', 'dog'], pageSize=1)):
+            self.assertIsNone(prompt._inputLoopArguments()['prefixFunc'])
+        # Block regexes only reject complete responses.
+        self.checkPrefixes(pyip.IntPrompt(blockRegexes=['^4$']), ['42'], [])
+
+
+class test_completion(unittest.TestCase):
+    def test_choices(self):
+        choices = ['SKU-1001-red', 'SKU-1001-blue', 'SKU-2002', 'Cat', 'catapult']
+        complete = pyip.ChoicePrompt(choices)._complete
+        self.assertEqual(complete('SKU-1'), 'SKU-1001-')
+        self.assertEqual(complete('SKU-1001-r'), 'SKU-1001-red')
+        self.assertEqual(complete('s'), 'sKU-') # Completed case-insensitively, keeping the case typed.
+        self.assertEqual(complete('ca'), 'cat')
+        self.assertEqual(complete(''), '')
+        self.assertIsNone(complete('dog'))
+
+        complete = pyip.MenuPrompt(choices, caseSensitive=True)._complete
+        self.assertEqual(complete('C'), 'Cat')
+        self.assertEqual(complete('c'), 'catapult')
+        self.assertIsNone(complete('s'))
+
+    def test_manyChoices(self):
+        choices = ['SKU-%06d' % (i) for i in range(100000)]
+        complete = pyip.ChoicePrompt(choices, prompt='')._complete
+        self.assertEqual(complete('SKU-0999'), 'SKU-0999')
+        self.assertEqual(complete('SKU-09998'), 'SKU-09998')
+        self.assertEqual(complete('SKU-099987'), 'SKU-099987')
+        self.assertIsNone(complete('SKU-1000000'))
+
+    def test_filepath(self):
+        directory = tempfile.mkdtemp()
+        try:
+            os.mkdir(os.path.join(directory, 'reports'))
+            for name in ('report-2019.txt', 'report-2020.txt'):
+                open(os.path.join(directory, name), 'w').close()
+            complete = pyip.FilepathPrompt()._complete
+            prefix = directory + os.sep
+            self.assertEqual(complete(prefix + 'rep'), prefix + 'report')
+            self.assertEqual(complete(prefix + 'reports'), prefix + 'reports' + os.sep)
+            self.assertEqual(complete(prefix + 'report-2019'), prefix + 'report-2019.txt')
+            self.assertIsNone(complete(prefix + 'x'))
+            self.assertIsNone(complete(os.path.join(directory, 'missing', 'x')))
+
+            # The cached listing is replaced once the directory changes.
+            os.remove(os.path.join(directory, 'report-2020.txt'))
+            os.utime(directory, ns=(0, os.stat(directory).st_mtime_ns + 10 ** 9)) # Some file systems' times are coarse.
+            self.assertEqual(complete(prefix + 'report-'), prefix + 'report-2019.txt')
+        finally:
+            shutil.rmtree(directory)
+
+    def test_unsupportedPrompts(self):
+        self.assertIsNone(pyip.StrPrompt()._inputLoopArguments()['completeFunc'])
+        self.assertIsNone(pyip.IntPrompt()._inputLoopArguments()['completeFunc'])
+
+
+class test_history(unittest.TestCase):
+    def setUp(self):
+        pyip.clearHistory()
+
+    def tearDown(self):
+        pyip.clearHistory()
+
+    def test_validResponses(self):
+        backend = pyip.ScriptedIOBackend(['forty', '42', '7', '42', ''])
+        for i in range(3):
+            pyip.inputInt(ioBackend=backend)
+        pyip.inputInt(ioBackend=backend, blank=True)
+        self.assertEqual(pyip.getHistory(pyip.inputInt), ['7', '42']) # The invalid and blank responses aren't kept.
+        self.assertEqual(pyip.getHistory('inputInt'), pyip.getHistory(pyip.IntPrompt))
+        self.assertEqual(pyip.getHistory(pyip.inputNum), [])
+
+    def test_bounded(self):
+        prompt = pyip.StrPrompt(ioBackend=pyip.ScriptedIOBackend(['answer %d' % (i) for i in range(150)]))
+        for i in range(150):
+            prompt.ask()
+        self.assertEqual(pyip.getHistory(pyip.inputStr), ['answer %d' % (i) for i in range(50, 150)])
+
+    def test_passwords(self):
+        pyip.inputPassword(ioBackend=pyip.ScriptedIOBackend(['hunter2']))
+        self.assertEqual(pyip.getHistory(pyip.inputPassword), [])
+        self.assertIsNone(pyip.PasswordPrompt()._inputLoopArguments()['history'])
+        self.assertRaises(pyip.PyInputPlusException, pyip.getHistory, 'inputNothing')
+
+
+class test_answerStore(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'answers.jsonl')
+
+    def tearDown(self):
+        pyip.setAnswerStore(None)
+        shutil.rmtree(self.directory)
+
+    def readLines(self):
+        with io.open(self.path, encoding='utf-8') as storeFile:
+            return storeFile.read().splitlines()
+
+    def test_acrossSessions(self):
+        store = pyip.AnswerStore(self.path, batchSize=2)
+        pyip.setAnswerStore(store)
+        backend = pyip.ScriptedIOBackend(['Al', 'forty', '42'])
+        self.assertEqual(pyip.inputStr('Name> ', ioBackend=backend), 'Al')
+        self.assertFalse(os.path.exists(self.path)) # The first answer waits for the rest of its batch.
+        self.assertEqual(pyip.inputInt('Quantity> ', ioBackend=backend), 42)
+        self.assertEqual(len(self.readLines()), 2)
+
+        # A new store (as in the program's next run) only reads the file when a prompt needs it.
+        store = pyip.AnswerStore(self.path, defaults=True)
+        self.assertIsNone(store._answers)
+        pyip.setAnswerStore(store)
+        self.assertEqual(pyip.inputInt('Quantity> ', limit=1, ioBackend=pyip.ScriptedIOBackend(['x'])), 42)
+        self.assertEqual(store.getAnswers('StrPrompt:Name> '), ['Al'])
+        self.assertEqual(pyip.StrPrompt('Name> ')._inputLoopArguments()['history'].entries(), ['Al'])
+        self.assertIsNone(store.lastAnswer('StrPrompt:Nickname> '))
+
+        # Without defaults=True, prompts keep their own default.
+        pyip.setAnswerStore(pyip.AnswerStore(self.path))
+        self.assertIsNone(pyip.IntPrompt('Quantity> ')._inputLoopArguments()['default'])
+
+    def test_storesValidatedAnswers(self):
+        store = pyip.AnswerStore(self.path, defaults=True)
+        pyip.setAnswerStore(store)
+        self.assertEqual(pyip.inputInt('Quantity> ', ioBackend=pyip.ScriptedIOBackend([' 42 '])), 42)
+        self.assertEqual(pyip.inputYesNo('Continue> ', ioBackend=pyip.ScriptedIOBackend(['Y'])), 'yes')
+        self.assertEqual(store.getAnswers('IntPrompt:Quantity> '), ['42'])
+        self.assertEqual(store.getAnswers('YesNoPrompt:Continue> '), ['yes'])
+
+        # An answer that arrives after the timeout is discarded, so it isn't stored.
+        with FakeConsole() as console:
+            console.type('7\n', delay=10)
+            self.assertEqual(pyip.inputInt('Quantity> ', timeout=5), 42)
+        self.assertEqual(store.getAnswers('IntPrompt:Quantity> '), ['42'])
+        self.assertEqual(pyip.inputInt('Quantity> ', limit=1, ioBackend=pyip.ScriptedIOBackend(['x'])), 42)
+
+    def test_passwords(self):
+        store = pyip.AnswerStore(self.path, batchSize=1)
+        pyip.setAnswerStore(store)
+        pyip.inputPassword('Password> ', ioBackend=pyip.ScriptedIOBackend(['hunter2']))
+        self.assertEqual(store.getAnswers('PasswordPrompt:Password> '), [])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_compaction(self):
+        store = pyip.AnswerStore(self.path, maxAnswers=3, batchSize=1)
+        for i in range(500):
+            store.add('key', 'answer %d' % (i % 5))
+        self.assertEqual(store.getAnswers('key'), ['answer 2', 'answer 3', 'answer 4'])
+        self.assertLessEqual(len(self.readLines()), 100)
+        self.assertEqual(pyip.AnswerStore(self.path, maxAnswers=3).getAnswers('key'),
+                         ['answer 2', 'answer 3', 'answer 4'])
+
+    def test_damagedLines(self):
+        with io.open(self.path, 'w', encoding='utf-8') as storeFile:
+            storeFile.write('{"key": "k", "answer": "one"}\n[]\n{"key": "k", "answ')
+        store = pyip.AnswerStore(self.path)
+        self.assertEqual(store.lastAnswer('k'), 'one')
+        store.add('k', 'two')
+        store.close()
+        self.assertEqual(pyip.AnswerStore(self.path).getAnswers('k'), ['one', 'two'])
+
+    def test_arguments(self):
+        self.assertRaises(pyip.PyInputPlusException, pyip.AnswerStore, self.path, maxAnswers=0)
+        self.assertRaises(pyip.PyInputPlusException, pyip.AnswerStore, self.path, batchSize='10')
+        self.assertRaises(pyip.PyInputPlusException, pyip.setAnswerStore, self.path)
+
+
+class test_datetimeParser(unittest.TestCase):
+    def test_sameAsStrptime(self):
+        formats = ('%m/%d/%Y %H:%M', '%x %H:%M', '%y%m%d', 'hour %H minute %M', '%b %Y', '%Y-%m-%d %%', '%m/%d/%Y %H:%M')
+        parser = pyip._DatetimeParser(formats)
+        self.assertEqual(parser.formats, list(formats[:-1])) # Duplicate formats are removed.
+        for value in ['10/31/2018 12:00', '1/5/2018  1:02', '10/ 5/2018 7:00', '02/30/2020 12:00', '10/31/18 12:00',
+                      '991231', '691231', '1231', 'HOUR 5 minute 07', 'Jan 2019', '2019-1-2 %', '12/31/2018 24:00', '']:
+            expected = None
+            for format in formats:
+                try:
+                    expected = datetime.datetime.strptime(value, format)
+                    break
+                except ValueError:
+                    pass
+            if expected is None:
+                self.assertRaises(ValueError, parser.parse, value)
+            else:
+                self.assertEqual(parser.parse(value), expected)
+
+    def test_prompts(self):
+        self.assertEqual(pyip.DatePrompt().validate(' 2/29/2004 '), datetime.date(2004, 2, 29))
+        self.assertEqual(pyip.TimePrompt().validate('13:00:01'), datetime.time(13, 0, 1))
+        self.assertEqual(pyip.DatetimePrompt().validate('2018/10/31 12:00'), datetime.datetime(2018, 10, 31, 12, 0))
+        for prompt, value, message in [(pyip.DatePrompt(), '2/29/2005', "'2/29/2005' is not a valid date."),
+                                       (pyip.TimePrompt(), '25:00:01', "'25:00:01' is not a valid time."),
+                                       (pyip.DatetimePrompt(blockRegexes=['2018']), '2018/10/31 12:00',
+                                        "'2018/10/31 12:00' is not a valid date and time.")]:
+            with self.assertRaises(pysv.ValidationException) as cm:
+                prompt.validate(value)
+            self.assertEqual(str(cm.exception), message)
+        self.assertEqual(pyip.DatePrompt(blank=True).validate(''), '')
+        with self.assertRaises(pysv.PySimpleValidateException):
+            pyip.TimePrompt(formats='%H:%M')
+
+    def test_cacheIsBounded(self):
+        for i in range(300):
+            parser = pyip._DatetimeParser.forFormats(['%%Y-%%m-%%d %d' % (i)])
+            self.assertIs(pyip._DatetimeParser.forFormats(['%%Y-%%m-%%d %d' % (i)]), parser)
+        self.assertLessEqual(len(pyip._DatetimeParser._parsers), 128)
+
+
+class test_regexFilter(unittest.TestCase):
+    def test_compiledRegexes(self):
+        prompt = pyip.IntPrompt(allowRegexes=[re.compile('^n/a$', re.IGNORECASE)],
+                                blockRegexes=[(re.compile(r'^-'), 'No negative numbers.'), '666'])
+        self.assertEqual(prompt.validate('N/A'), 'N/A')
+        self.assertEqual(prompt.validate(' 42 '), 42)
+        for value, message in [('-5', 'No negative numbers.'), ('6666', 'This response is invalid.')]:
+            with self.assertRaises(pysv.ValidationException) as cm:
+                prompt.validate(value)
+            self.assertEqual(str(cm.exception), message)
+        self.assertEqual(pyip.inputRegex(re.compile(r'\d+'), ioBackend=pyip.ScriptedIOBackend(['abc123'])), '123')
+
+    def test_firstBlockRegexResponse(self):
+        # The response is from the first block regex in the list that matches,
+        # not the one that matches earliest in the value.
+        prompt = pyip.StrPrompt(blockRegexes=[('z', 'No z.'), ('(?i)A', 'No a.'), (re.compile('b # comment', re.VERBOSE), 'No b.')])
+        self.assertIsNotNone(prompt._regexFilter._combinedBlockRegex)
+        for value, message in [('az', 'No z.'), ('bA', 'No a.'), ('cb', 'No b.')]:
+            with self.assertRaises(pysv.ValidationException) as cm:
+                prompt.validate(value)
+            self.assertEqual(str(cm.exception), message)
+        self.assertEqual(prompt.validate('c'), 'c')
+
+    def test_notCombined(self):
+        # Regexes that refer to their groups are searched separately.
+        regexFilter = pyip._RegexFilter([r'(a)\1', r'(?P<x>b)(?P=x)'], [r'(?P<x>c)', r'(?P<x>d)'])
+        self.assertIsNone(regexFilter._combinedAllowRegex)
+        self.assertIsNone(regexFilter._combinedBlockRegex)
+        self.assertEqual((regexFilter.isAllowed('xaa'), regexFilter.isAllowed('bb'), regexFilter.isAllowed('ab')),
+                         (True, True, False))
+        self.assertEqual(regexFilter.blockResponse('d'), 'This response is invalid.')
+
+    def test_invalidArguments(self):
+        for kwargs in ({'allowRegexes': 42}, {'allowRegexes': [42]}, {'blockRegexes': [('a', 'b', 'c')]},
+                       {'blockRegexes': [(re.compile('a'), 42)]}):
+            with self.assertRaises(pysv.PySimpleValidateException):
+                pyip.StrPrompt(**kwargs)
+        self.assertRaises(re.error, pyip.NumPrompt, blockRegexes=['('])
+
+
+class test_validationCache(unittest.TestCase):
+    def setUp(self):
+        pyip.validationCache.enable(maxSize=3)
+
+    def tearDown(self):
+        pyip.validationCache.disable()
+
+    def test_hitsAndMisses(self):
+        for i in range(3):
+            self.assertEqual(pyip.inputState(ioBackend=pyip.ScriptedIOBackend(['ca'])), 'CA')
+        self.assertEqual((pyip.validationCache.hits, pyip.validationCache.misses), (2, 1))
+
+        # Different arguments that affect validation are cached separately.
+        self.assertEqual(pyip.inputNum(ioBackend=pyip.ScriptedIOBackend(['5', '15']), min=10), 15)
+        self.assertEqual(pyip.inputNum(ioBackend=pyip.ScriptedIOBackend(['5']), min=0), 5)
+        self.assertEqual(pyip.validationCache.misses, 4)
+
+        pyip.validationCache.clear()
+        self.assertEqual((len(pyip.validationCache), pyip.validationCache.hits, pyip.validationCache.misses), (0, 0, 0))
+
+    def test_cachedExceptions(self):
+        prompt = pyip.MonthPrompt()
+        for i in range(2):
+            with self.assertRaises(pysv.ValidationException):
+                prompt.validate('Smarch')
+        self.assertEqual((pyip.validationCache.hits, pyip.validationCache.misses), (1, 1))
+
+    def test_leastRecentlyUsedEvicted(self):
+        prompt = pyip.IntPrompt()
+        for value in ['1', '2', '3', '1', '4']: # '2' is the least recently used when '4' is added.
+            prompt.validate(value)
+        self.assertEqual(len(pyip.validationCache), 3)
+        prompt.validate('1')
+        prompt.validate('2')
+        self.assertEqual((pyip.validationCache.hits, pyip.validationCache.misses), (2, 5))
+
+    def test_applyFuncStillCalled(self):
+        calls = []
+        def applyFunc(value):
+            calls.append(value)
+            return value.strip('!')
+        prompt = pyip.StrPrompt(applyFunc=applyFunc, postValidateApplyFunc=str.upper)
+        self.assertEqual(prompt.validate('hi!'), 'HI')
+        self.assertEqual(prompt.validate('hi!!'), 'HI')
+        self.assertEqual(calls, ['hi!', 'hi!!'])
+        self.assertEqual(pyip.validationCache.hits, 1) # Keyed on the value returned by applyFunc.
+
+    def test_impureValidatorsNotCached(self):
+        calls = []
+        def isEven(value):
+            calls.append(value)
+            if int(value) % 2:
+                raise Exception('Odd.')
+        prompt = pyip.CustomPrompt(isEven)
+        prompt.validate('2')
+        prompt.validate('2')
+        self.assertEqual(len(calls), 2)
+
+        pyip.validationCache.declarePure(isEven)
+        prompt.validate('2')
+        prompt.validate('2')
+        self.assertEqual(len(calls), 3)
+
+        prompt = pyip.PasswordPrompt()
+        prompt.validate('swordfish')
+        prompt.validate('swordfish')
+        self.assertEqual(len(pyip.validationCache), 1)
+
+    def test_disabledByDefault(self):
+        pyip.validationCache.disable()
+        pyip.IntPrompt().validate('42')
+        self.assertEqual((len(pyip.validationCache), pyip.validationCache.misses), (0, 0))
+        self.assertRaises(pyip.PyInputPlusException, pyip.validationCache.enable, maxSize=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
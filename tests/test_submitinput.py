@@ -0,0 +1,105 @@
+from __future__ import absolute_import, division, print_function
+
+import concurrent.futures
+import io
+import os
+import threading
+import time
+import unittest
+
+import pyinputplus as pyip
+
+
+def waitFor(condition):
+    deadline = time.time() + 5
+    while not condition():
+        if time.time() > deadline:
+            raise AssertionError('condition never became true')
+        time.sleep(0.001)
+
+
+class test_submitInput(unittest.TestCase):
+    def test_result(self):
+        backend = pyip.ScriptedIOBackend(['forty', '42'])
+        future = pyip.submitInput(pyip.inputInt, prompt='> ', min=0, ioBackend=backend)
+        self.assertIsInstance(future, concurrent.futures.Future)
+        self.assertEqual(future.result(5), 42)
+        self.assertEqual(backend.getOutput(), "> 'forty' is not an integer.\n> ")
+
+        future = pyip.submitInput(pyip.YesNoPrompt(ioBackend=pyip.ScriptedIOBackend(['y'])))
+        self.assertEqual(future.result(5), 'yes')
+
+    def test_exceptions(self):
+        future = pyip.submitInput('inputInt', limit=1, ioBackend=pyip.ScriptedIOBackend(['forty']))
+        self.assertIsInstance(future.exception(5), pyip.RetryLimitException)
+
+        future = pyip.submitInput(pyip.inputStr, timeout=0.1, strictTimeout=True,
+                                  ioBackend=pyip.ScriptedIOBackend([None]))
+        self.assertIsInstance(future.exception(5), pyip.TimeoutException)
+
+        # The arguments are checked when the prompt is submitted.
+        self.assertRaises(pyip.PyInputPlusException, pyip.submitInput, 'inputNothing')
+
+    def test_inOrderOnOneThread(self):
+        threadNames = []
+        backend = pyip.ScriptedIOBackend(['%d' % (i) for i in range(20)])
+        futures = [pyip.submitInput(pyip.inputInt, ioBackend=backend,
+                                    postValidateApplyFunc=lambda value: threadNames.append(threading.current_thread().name) or value)
+                   for i in range(20)]
+        self.assertEqual([future.result(5) for future in futures], list(range(20)))
+        self.assertEqual(set(threadNames), set(['pyinputplus-reader']))
+
+    def test_cancelInterruptsRead(self):
+        readFd, writeFd = os.pipe()
+        output = io.StringIO()
+        with io.open(readFd, 'r') as inputFile:
+            backend = pyip.FileIOBackend(inputFile, output)
+            future = pyip.submitInput(pyip.inputStr, prompt='first> ', ioBackend=backend)
+            queuedFuture = pyip.submitInput(pyip.inputStr, prompt='queued> ', ioBackend=backend)
+            nextFuture = pyip.submitInput(pyip.inputStr, prompt='next> ', ioBackend=backend)
+            waitFor(lambda: output.getvalue() == 'first> ')
+
+            # A running prompt can't be cancelled with cancel(), only stopped with cancelInput().
+            self.assertTrue(future.running())
+            self.assertFalse(future.cancel())
+            self.assertTrue(queuedFuture.cancel())
+            self.assertTrue(pyip.cancelInput(future))
+            self.assertRaises(concurrent.futures.CancelledError, future.result, 5)
+            self.assertFalse(future.cancelled())
+            self.assertFalse(pyip.cancelInput(future))
+
+            # The reader thread moves on to the next prompt that wasn't cancelled.
+            waitFor(lambda: output.getvalue() == 'first> next> ')
+            os.write(writeFd, b'hello\n')
+            self.assertEqual(nextFuture.result(5), 'hello')
+        os.close(writeFd)
+
+    def test_cancelledWhileWaitingForConsole(self):
+        backend = pyip.ScriptedIOBackend(['hello'])
+        consoleLock = backend.getConsoleLock()
+        with consoleLock: # Keep the prompt from starting.
+            future = pyip.submitInput(pyip.inputStr, prompt='first> ', ioBackend=backend)
+            waitFor(lambda: consoleLock._waiters)
+            self.assertTrue(future.running())
+            self.assertTrue(pyip.cancelInput(future))
+
+        # The stopped prompt is never displayed and doesn't read an answer.
+        self.assertEqual(pyip.submitInput(pyip.inputStr, prompt='second> ', ioBackend=backend).result(5), 'hello')
+        self.assertEqual(backend.getOutput(), 'second> ')
+        self.assertRaises(concurrent.futures.CancelledError, future.result, 5)
+
+    def test_cancelInputBeforeStart(self):
+        backend = pyip.ScriptedIOBackend(['hello'])
+        with backend.getConsoleLock(): # Keep the first prompt running, so the second one stays pending.
+            runningFuture = pyip.submitInput(pyip.inputStr, prompt='first> ', ioBackend=backend)
+            pendingFuture = pyip.submitInput(pyip.inputStr, prompt='second> ', ioBackend=backend)
+            waitFor(runningFuture.running)
+            self.assertFalse(pendingFuture.running())
+            self.assertTrue(pyip.cancelInput(pendingFuture))
+            self.assertTrue(pendingFuture.cancelled())
+        self.assertEqual(runningFuture.result(5), 'hello')
+        self.assertEqual(backend.getOutput(), 'first> ')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+from __future__ import absolute_import, division, print_function
+
+import sys
+import time
+import unittest
+
+import pyinputplus as pyip
+from pyinputplus.testing import FakeConsole, answer
+
+
+class test_FakeConsole(unittest.TestCase):
+    def test_readsTypedLinesAndCapturesOutput(self):
+        with FakeConsole('forty\n42\n') as console:
+            self.assertEqual(pyip.inputInt('Quantity> '), 42)
+        self.assertEqual(console.output, "Quantity> 'forty' is not an integer.\nQuantity> ")
+        self.assertEqual(console.unreadText(), '')
+
+    def test_restoresPatchedState(self):
+        originalStdin, originalStdout = sys.stdin, sys.stdout
+        originalTime, originalReader = pyip.time, pyip._stdinThreadedReader
+        with self.assertRaises(ValueError):
+            with FakeConsole():
+                raise ValueError()
+        self.assertIs(sys.stdin, originalStdin)
+        self.assertIs(sys.stdout, originalStdout)
+        self.assertIs(pyip.time, originalTime)
+        self.assertIs(pyip._stdinThreadedReader, originalReader)
+
+    def test_runningOutOfTypedTextRaisesEOFError(self):
+        with FakeConsole('\n') as console:
+            with self.assertRaises(EOFError):
+                pyip.inputStr()
+            with self.assertRaises(EOFError):
+                pyip.inputInt(timeout=5, strictTimeout=True)
+            with self.assertRaises(EOFError):
+                pyip.inputPassword()
+
+    def test_typeFinishesUnfinishedLines(self):
+        with FakeConsole('hel') as console:
+            console.type('lo\nworld\n')
+            self.assertEqual(pyip.inputStr(), 'hello')
+            self.assertEqual(console.unreadText(), 'world\n')
+
+    def test_readOutput(self):
+        with FakeConsole('cat\ndog\n') as console:
+            pyip.inputStr('First> ')
+            self.assertEqual(console.readOutput(), 'First> ')
+            pyip.inputStr('Second> ')
+            self.assertEqual(console.readOutput(), 'Second> ')
+            self.assertEqual(console.readOutput(), '')
+        self.assertEqual(console.output, 'First> Second> ')
+
+    def test_timeoutUsesFakeClock(self):
+        startTime = time.time()
+        with FakeConsole() as console:
+            console.type('42\n', delay=3600)
+            self.assertEqual(pyip.inputInt(timeout=60, default='0'), 0)
+
+            # With strictTimeout, the read gives up when the timeout passes
+            # and leaves the line for the next prompt.
+            console.type('7\n', delay=3600)
+            with self.assertRaises(pyip.TimeoutException):
+                pyip.inputInt(timeout=60, strictTimeout=True)
+            self.assertEqual(console.unreadText(), '7\n')
+            self.assertEqual(pyip.inputInt(attemptTimeout=3600), 7)
+        self.assertLess(time.time() - startTime, 5)
+
+    def test_metricsUseFakeClock(self):
+        metrics = []
+        pyip.setMetricsCallback(metrics.append)
+        try:
+            answer(pyip.inputStr, 'hello\n', delay=2.5)
+        finally:
+            pyip.setMetricsCallback(None)
+        self.assertEqual(metrics[0].waitTime, 2.5)
+        self.assertEqual(metrics[0].firstAnswerTime, 2.5)
+
+    def test_password(self):
+        self.assertEqual(answer(pyip.inputPassword, 'swordfish\n'), ('swordfish', '*********\n'))
+        self.assertEqual(answer(lambda: pyip.inputPassword('Password: ', mask=''), 'abc\b\bz\n'), ('az', 'Password: \n'))
+        self.assertEqual(answer(pyip.inputPassword, 'ab\b\b\bc\n'), ('c', '**\b \b\b \b*\n'))
+
+    def test_keystrokeIOBackendReadsLines(self):
+        self.assertEqual(answer(lambda: pyip.inputInt(ioBackend=pyip.KeystrokeIOBackend()), '42\n'), (42, ''))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+from __future__ import absolute_import, division, print_function
+
+import io
+import os
+import subprocess
+import sys
+import time
+import unittest
+
+import pyinputplus as pyip
+
+try:
+    import pty
+except ImportError:
+    pty = None
+
+
+def runWithTerminal(code, typed=None, typeAfter=0.0):
+    """Runs the Python code in a subprocess whose stdin is a pseudoterminal,
+    optionally typing the `typed` string into it after `typeAfter` seconds.
+    Returns a tuple of the subprocess's stdout and how long it ran."""
+    master, slave = pty.openpty()
+    startTime = time.time()
+    proc = subprocess.Popen([sys.executable, '-c', 'import pyinputplus as pyip\n' + code],
+                            stdin=slave, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    os.close(slave)
+    try:
+        if typed is not None:
+            time.sleep(typeAfter)
+            os.write(master, typed.encode('utf-8'))
+        output = proc.communicate(timeout=10)[0].decode('utf-8')
+    finally:
+        os.close(master)
+    return output, time.time() - startTime
+
+
+@unittest.skipIf(pty is None or sys.platform == 'win32', 'requires a POSIX pseudoterminal')
+class test_strictTimeout(unittest.TestCase):
+    def test_timeoutWhileWaiting(self):
+        output, duration = runWithTerminal(
+            'try:\n'
+            '    pyip.inputStr(timeout=0.5, strictTimeout=True)\n'
+            'except pyip.TimeoutException:\n'
+            '    print("timed out")\n')
+        self.assertEqual(output.strip(), 'timed out')
+        self.assertLess(duration, 5)
+
+    def test_defaultWhileWaiting(self):
+        output, duration = runWithTerminal('print(pyip.inputStr(default="def", timeout=0.5, strictTimeout=True))')
+        self.assertEqual(output.strip(), 'def')
+
+    def test_inputBeforeTimeout(self):
+        output, duration = runWithTerminal('print(pyip.inputInt(timeout=5, strictTimeout=True))', typed='42\n', typeAfter=0.2)
+        self.assertEqual(output.strip(), '42')
+
+    def test_attemptTimeout(self):
+        output, duration = runWithTerminal(
+            'try:\n'
+            '    pyip.inputStr("> ", attemptTimeout=0.3, limit=2)\n'
+            'except pyip.RetryLimitException:\n'
+            '    print("limit")\n')
+        self.assertEqual(output, '> \n> \nlimit\n')
+
+    def test_attemptTimeoutRetry(self):
+        output, duration = runWithTerminal('print(pyip.inputStr(attemptTimeout=0.5, limit=3))', typed='hello\n', typeAfter=0.8)
+        self.assertEqual(output.strip(), 'hello')
+
+
+class test_strictTimeoutWithoutTerminal(unittest.TestCase):
+    def test_readsInBackgroundThread(self):
+        originalStdin, originalStdout = sys.stdin, sys.stdout
+        sys.stdin, sys.stdout = io.StringIO('\nhello\n'), io.StringIO()
+        try:
+            self.assertEqual(pyip.inputStr(timeout=5, strictTimeout=True, attemptTimeout=5), 'hello')
+            self.assertEqual(sys.stdout.getvalue(), 'Blank values are not allowed.\n')
+        finally:
+            sys.stdin, sys.stdout = originalStdin, originalStdout
+
+    def test_untimedReadAfterTimeout(self):
+        # The thread left reading stdin by a prompt that timed out gets the
+        # next line, so a prompt without a timeout must read it from there.
+        proc = subprocess.Popen([sys.executable, '-c',
+                                 'import pyinputplus as pyip\n'
+                                 'print(pyip.inputStr(default="def", timeout=0.2, strictTimeout=True))\n'
+                                 'print(pyip.inputStr())\n'
+                                 'print(pyip.inputStr(timeout=5, strictTimeout=True))\n'],
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        try:
+            time.sleep(0.5)
+            proc.stdin.write(b'one\n')
+            proc.stdin.flush()
+            time.sleep(0.2)
+            output = proc.communicate(b'two\n', timeout=10)[0].decode('utf-8')
+        finally:
+            if proc.poll() is None:
+                proc.kill()
+        self.assertEqual(output.split(), ['def', 'one', 'two'])
+
+    def test_arguments(self):
+        with self.assertRaises(pyip.PyInputPlusException):
+            pyip.StrPrompt(strictTimeout='yes')
+        with self.assertRaises(pyip.PyInputPlusException):
+            pyip.StrPrompt(attemptTimeout='5')
+
+
+if __name__ == '__main__':
+    unittest.main()